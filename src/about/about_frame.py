@@ -3,8 +3,6 @@ import platform
 from orginizer.tools_header import ToolsHeader
 
 # --- Configuration ---
-ctk.set_appearance_mode("Dark")  # Options: "Light", "Dark", "System"
-ctk.set_default_color_theme("blue")  # Options: "blue", "green", "dark-blue"
 ctk.DrawEngine.preferred_drawing_method = "circle_shapes"
 
 
@@ -10,10 +10,14 @@ from about.about_frame import AboutWindow
 default_ctk_font = customtkinter.ThemeManager.theme["CTkFont"]
 default_ctk_font["family"] = "Helvetica"
 
+# Seconds from launch to the dashboard's first frame; main.py warns past it
+STARTUP_BUDGET_S = 1.0
+
 
 class App(customtkinter.CTk):
-    def __init__(self):
+    def __init__(self, on_first_frame=None):
         super().__init__()
+        self.on_first_frame = on_first_frame
 
         self.title("Toolkit")
         self.geometry("550x800")
@@ -36,6 +40,15 @@ class App(customtkinter.CTk):
         self.footer = footer.FooterFrame(self, version="1.0.0")
         self.footer.grid(row=4, column=0, padx=10, pady=(10, 0), sticky="nsew")
 
+        # Idle callbacks queued once the mainloop runs come after the first
+        # redraw, so this runs when the dashboard is on screen
+        self.after(0, lambda: self.after_idle(self._first_frame_shown))
+
+    def _first_frame_shown(self):
+        self.tools.prewarm()
+        if self.on_first_frame is not None:
+            self.on_first_frame()
+
     def open_about(self, ev):
         if self.about is None or not self.about.winfo_exists():
             self.about = AboutWindow(self.window)
@@ -0,0 +1,62 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Tuple
+
+import customtkinter as ctk
+from PIL import Image
+
+# The PNGs live in assets/ at the top of the repository, next to src/
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
+# How many sized images are kept; icons are small, so this is a count cap
+MAX_IMAGES = 64
+# Sources are shrunk to this multiple of the largest size asked for, enough
+# for CTkImage to scale them for a 200% display without upsampling
+MAX_SCALING = 2
+
+_lock = threading.Lock()
+_sources: Dict[str, Image.Image] = {}
+_images: "OrderedDict[Tuple[str, Tuple[int, int]], ctk.CTkImage]" = OrderedDict()
+
+
+def asset_path(name: str) -> Path:
+    return ASSETS_DIR / name
+
+
+def _source(name: str, size: Tuple[int, int]) -> Image.Image:
+    # Called with _lock held. Each PNG is decoded once; a bigger size than
+    # the kept copy was prepared for decodes it again at the new size.
+    source = _sources.get(name)
+    target = (size[0] * MAX_SCALING, size[1] * MAX_SCALING)
+    if source is None or source.width < target[0] or source.height < target[1]:
+        with Image.open(asset_path(name)) as image:
+            image.load()
+            source = image.copy()
+        if source.width > target[0] or source.height > target[1]:
+            source.thumbnail(target, Image.LANCZOS)
+        _sources[name] = source
+    return source
+
+
+def get_image(name: str, size: Tuple[int, int]) -> ctk.CTkImage:
+    """
+    The CTkImage of the PNG `name` in assets/ at `size`.
+
+    Images are shared: every caller asking for the same (name, size) gets the
+    same CTkImage, which also keeps its scaled PhotoImage between windows.
+    The least recently used ones are dropped past MAX_IMAGES; widgets still
+    showing them keep their own reference.
+    """
+    key = (name, tuple(size))
+    with _lock:
+        image = _images.get(key)
+        if image is not None:
+            _images.move_to_end(key)
+            return image
+        source = _source(name, size)
+        image = ctk.CTkImage(light_image=source, dark_image=source, size=size)
+        _images[key] = image
+        if len(_images) > MAX_IMAGES:
+            _images.popitem(last=False)
+        return image
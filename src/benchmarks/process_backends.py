@@ -0,0 +1,121 @@
+"""
+Compares the psutil and /proc process collectors on a synthetic process table.
+
+Builds a fake /proc with 5,000 processes in a temporary folder, points both
+backends at it (psutil through psutil.PROCFS_PATH) and times refresh():
+
+    cd src
+    python -m benchmarks.process_backends --processes 5000 --rounds 5
+
+Linux only, since psutil's /proc parser only exists there.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import psutil
+
+from logic.processes import ProcessCache
+from logic.procfs import ProcfsProcessCache
+
+MEMINFO = """MemTotal:       16318480 kB
+MemFree:         8123456 kB
+MemAvailable:   12345678 kB
+Buffers:          234567 kB
+Cached:          3456789 kB
+SwapCached:            0 kB
+Active:          4567890 kB
+Inactive:        2345678 kB
+Shmem:            123456 kB
+SReclaimable:     234567 kB
+SwapTotal:       2097148 kB
+SwapFree:        2097148 kB
+"""
+
+
+def build_fake_proc(root: str, count: int):
+    """Writes the /proc files both backends read for `count` processes."""
+    with open(os.path.join(root, "stat"), "w") as f:
+        f.write("cpu  1000 0 1000 100000 0 0 0 0 0 0\n")
+        f.write(f"btime {int(time.time()) - 3600}\n")
+    with open(os.path.join(root, "meminfo"), "w") as f:
+        f.write(MEMINFO)
+    # psutil checks the running kernel through /proc/self
+    os.symlink("1", os.path.join(root, "self"))
+    # No open sockets, but the connection count scan reads these
+    os.mkdir(os.path.join(root, "net"))
+    for kind in ("tcp", "tcp6", "udp", "udp6"):
+        with open(os.path.join(root, "net", kind), "w") as f:
+            f.write("  sl  local_address rem_address   st\n")
+
+    for pid in range(1, count + 1):
+        folder = os.path.join(root, str(pid))
+        os.mkdir(folder)
+        name = f"worker-{pid % 97}"
+        utime, stime, start = pid * 3, pid, 1000 + pid
+        with open(os.path.join(folder, "stat"), "w") as f:
+            f.write(
+                f"{pid} ({name}) S 1 {pid} {pid} 0 -1 4194560 100 0 0 0 "
+                f"{utime} {stime} 0 0 20 0 1 0 {start} 123456789 2048 "
+                "18446744073709551615 1 1 0 0 0 0 0 0 0 0 0 0 17 0 0 0 0 0 0\n"
+            )
+        with open(os.path.join(folder, "statm"), "w") as f:
+            f.write(f"30141 {1000 + pid % 500} 500 100 0 2000 0\n")
+        with open(os.path.join(folder, "cmdline"), "w") as f:
+            f.write(f"/usr/bin/{name}\0--flag\0")
+        with open(os.path.join(folder, "status"), "w") as f:
+            f.write(
+                f"Name:\t{name}\nState:\tS (sleeping)\nPPid:\t1\n"
+                f"Uid:\t0\t0\t0\t0\nThreads:\t1\n"
+            )
+        with open(os.path.join(folder, "io"), "w") as f:
+            f.write(
+                f"rchar: {pid * 4096}\nwchar: {pid * 1024}\n"
+                f"syscr: {pid}\nsyscw: {pid}\n"
+                f"read_bytes: {pid * 4096}\nwrite_bytes: {pid * 1024}\n"
+                "cancelled_write_bytes: 0\n"
+            )
+
+
+def time_refresh(cache, rounds: int) -> float:
+    """Returns the mean seconds per refresh after an initial priming pass."""
+    cache.refresh()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        cache.refresh()
+    return (time.perf_counter() - start) / rounds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if not sys.platform.startswith("linux"):
+        print("This benchmark needs Linux.")
+        return
+
+    with tempfile.TemporaryDirectory() as root:
+        build_fake_proc(root, args.processes)
+
+        # Both backends count connections through psutil
+        original_path = psutil.PROCFS_PATH
+        psutil.PROCFS_PATH = root
+        try:
+            procfs_time = time_refresh(ProcfsProcessCache(proc_root=root), args.rounds)
+            psutil_time = time_refresh(ProcessCache(), args.rounds)
+        finally:
+            psutil.PROCFS_PATH = original_path
+
+    print(f"{args.processes} processes, mean of {args.rounds} refreshes:")
+    print(f"  psutil : {psutil_time * 1000:8.1f} ms")
+    print(f"  procfs : {procfs_time * 1000:8.1f} ms")
+    print(f"  speedup: {psutil_time / procfs_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measures how long the Toolkit takes to start, against main.py's budget.
+
+Each round starts a fresh interpreter. With a display, main.py runs with
+TOOLKIT_STARTUP_PROBE=1, which prints the time to the dashboard's first frame
+and exits. Without one, only the import of the dashboard (`import app`) is
+timed, which is most of the startup work before Tk draws anything:
+
+    cd src
+    python -m benchmarks.startup --rounds 5
+
+Exits with status 1 when the median is over the budget.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from app import STARTUP_BUDGET_S
+
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+IMPORT_PROBE = (
+    "import time\n"
+    "started = time.perf_counter()\n"
+    "import app\n"
+    "print(f'first_frame={time.perf_counter() - started:.3f}')\n"
+)
+
+
+def has_display() -> bool:
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def run_once(window: bool) -> float:
+    """Seconds to the first frame (or to the import) in a new interpreter."""
+    env = dict(os.environ, TOOLKIT_STARTUP_PROBE="1")
+    command = [sys.executable, "main.py"] if window else [sys.executable, "-c"]
+    if not window:
+        command.append(IMPORT_PROBE)
+    result = subprocess.run(
+        command, cwd=SRC_DIR, env=env, capture_output=True, text=True, timeout=60
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("first_frame="):
+            return float(line.split("=", 1)[1])
+    raise RuntimeError(f"No timing in the output:\n{result.stdout}{result.stderr}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_S)
+    args = parser.parse_args(argv)
+
+    window = has_display()
+    times = [run_once(window) for _ in range(args.rounds)]
+    median = statistics.median(times)
+
+    what = "first frame of main.py" if window else "import app (no display)"
+    print(f"{what}, {args.rounds} cold starts:")
+    print(f"  median: {median * 1000:8.1f} ms")
+    print(f"  worst : {max(times) * 1000:8.1f} ms")
+    print(f"  budget: {args.budget * 1000:8.1f} ms")
+    if median > args.budget:
+        print("Over budget.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 import customtkinter as ctk
+from job_status import JobStatus
+from log_sink import LogSink
 from orginizer.tools_header import ToolsHeader
 from .folders_framer import FoldersFrame
-from .cleaner_helper import run_clean_logic
+from logic import utils
+from logic.jobs import CANCELLED, DONE
+from .cleaner_helper import build_clean_plan, execute_clean_plan
+from .plan_frame import PlanFrame
 
 
 class FileCleanerFrame(ctk.CTkFrame):
@@ -11,7 +16,7 @@ class FileCleanerFrame(ctk.CTkFrame):
         # Configure the grid layout for the frame
         # Use column 0 for labels/widgets, and configure it to fill the space slightly
         self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(4, weight=1)  # Row for the Logs textbox should expand
+        self.grid_rowconfigure(6, weight=1)  # Row for the Logs textbox should expand
 
         # --- 1. Title ---
         self.header = ToolsHeader(self, "cleaner.png", "File Cleaner")
@@ -21,51 +26,111 @@ class FileCleanerFrame(ctk.CTkFrame):
         self.folders = FoldersFrame(self)
         self.folders.grid(row=1, column=0, sticky="ewns")
 
-        # --- 3. Start Button ---
+        # --- 3. Scan Button ---
+        # Scanning only builds a plan; nothing is deleted until it is confirmed
         self.start_button = ctk.CTkButton(
             self,
-            text="Start",
+            text="Scan",
             fg_color="green",
             hover_color="darkgreen",
-            command=self.on_clean,
+            command=self.on_scan,
         )
-        self.start_button.grid(row=2, column=0, padx=20, pady=(40, 20), sticky="ew")
+        self.start_button.grid(row=2, column=0, padx=20, pady=(40, 10), sticky="ew")
+
+        # --- 4. Progress and Cancel ---
+        # The cleanup runs on a worker thread so the window stays responsive
+        self.job_status = JobStatus(self)
+        self.job_status.grid(row=3, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        # --- 5. Plan ---
+        self.plan_frame = PlanFrame(self, on_clean=self.on_clean)
+        self.plan_frame.grid(row=4, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.plan = None
 
         # --- 5. Logs Section ---
         self.logs_label = ctk.CTkLabel(
             self, text="Logs", font=ctk.CTkFont(size=18, weight="bold")
         )
-        self.logs_label.grid(row=3, column=0, padx=20, pady=(10, 5), sticky="w")
+        self.logs_label.grid(row=5, column=0, padx=20, pady=(10, 5), sticky="w")
+        self.save_log_button = ctk.CTkButton(
+            self, text="Save Full Log", width=120, command=self.on_save_log
+        )
+        self.save_log_button.grid(row=5, column=0, padx=20, pady=(10, 5), sticky="e")
 
         # Textbox for Logs
         # The row configured with weight=1 (row 9 in the layout above) is the logs section,
         # so this textbox will expand into the remaining vertical space.
         self.logs_textbox = ctk.CTkTextbox(self, height=100)
-        self.logs_textbox.grid(row=4, column=0, padx=20, pady=(5, 20), sticky="nsew")
+        self.logs_textbox.grid(row=6, column=0, padx=20, pady=(5, 20), sticky="nsew")
+        # Lines are appended in batches, and only the latest are kept on screen
+        self.log = LogSink(self.logs_textbox)
 
     def addLog(self, log):
-        info = self.logs_textbox.get("1.0", "end")
-        info += f"\n{log}"
-        self.logs_textbox.delete("1.0", "end")
-        self.logs_textbox.insert("1.0", info)
-        print(log)
-
-    def on_clean(self):
-        self.logs_textbox.delete("1.0", "end")
+        self.log.write(log)
+
+    def on_save_log(self):
+        path = utils.save_file_chooser("cleaner-log.txt")
+        if path:
+            try:
+                self.log.save(path)
+            except OSError as e:
+                print(f"Error saving log: {e}")
+
+    def _set_running(self, running: bool):
+        self.start_button.configure(state="disabled" if running else "normal")
+        self.plan_frame.set_enabled(not running)
+
+    def on_scan(self):
+        if self.job_status.is_running():
+            return
+        self.log.clear()
         folders = self.folders.get_folders()
         options = {
             "temp_files": self.folders.folders[0] in folders,
             "browser_cache": self.folders.folders[1] in folders,
-            "large_old": self.folders.folders[0] in folders,
+            "large_old": self.folders.folders[2] in folders,
         }
-        run_clean_logic(options, lambda x: self.addLog(x))
+
+        def work(job):
+            # Read on the main thread once the job is done
+            self.plan = build_clean_plan(options, self.addLog, job)
+
+        self.plan = None
+        self.plan_frame.show(None)
+        self._set_running(True)
+        self.job_status.run(work, on_done=self.on_scan_done)
+
+    def on_scan_done(self, status):
+        self._set_running(False)
+        if status == DONE:
+            self.plan_frame.show(self.plan)
+        elif status == CANCELLED:
+            self.addLog("\nScan cancelled.")
+
+    def on_clean(self, categories):
+        if self.job_status.is_running() or self.plan is None:
+            return
+        plan = self.plan
+        self._set_running(True)
+        self.job_status.run(
+            lambda job: execute_clean_plan(plan, categories, self.addLog, job),
+            on_done=self.on_clean_done,
+        )
+
+    def on_clean_done(self, status):
+        # The plan is spent; scan again for a fresh one
+        self.plan = None
+        self.plan_frame.show(None)
+        self._set_running(False)
+        if status == CANCELLED:
+            self.addLog("\nCleanup cancelled.")
 
 
 class CleanerWindow(ctk.CTkToplevel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.title("File Cleaner")
-        self.geometry("500x600")
+        self.geometry("500x750")
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -73,6 +138,10 @@ class CleanerWindow(ctk.CTkToplevel):
         self.frame = FileCleanerFrame(self)
         self.frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
 
+    def is_busy(self) -> bool:
+        """True while a run is in progress, so the window is not destroyed."""
+        return self.frame.job_status.is_running()
+
 
 # --- Example Usage (Main Application Loop) ---
 if __name__ == "__main__":
@@ -1,74 +1,199 @@
+import errno
+import os
 import shutil
+import stat
 import tempfile
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Callable, Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, TypedDict
 from platformdirs import user_downloads_dir
+from cleaner.pruner import deletion_order, plan_stale_tree
+from cleaner.scanner import FileRecord, ScanRoot, scan
+from logic.jobs import Job
+from logic.processes import format_size
 
 # 500 MB (500 * 1024 * 1024 bytes)
 LARGE_FILE_LIMIT_BYTES = 524288000
 # 3 months (approx 90 days)
 OLD_FILE_LIMIT_SECONDS = 90 * 24 * 60 * 60
+# Temp files younger than a day may still be in use
+TEMP_MIN_AGE_SECONDS = 24 * 60 * 60
+# How deep stale temp trees are followed; deeper folders are kept
+TEMP_MAX_DEPTH = 32
+
+# Scan root names
+TEMP_ROOT = "temp"
+DOWNLOADS_ROOT = "downloads"
+
+# Plan categories, named like the cleaning options they come from
+TEMP_FILES = "temp_files"
+LARGE_OLD = "large_old"
+CATEGORY_TITLES = {
+    TEMP_FILES: "Old temporary files",
+    LARGE_OLD: "Large & old downloads",
+}
+
+
+class Candidate(TypedDict):
+    path: str
+    name: str
+    is_dir: bool
+    disk_bytes: int
+    # What the scan saw, to tell whether the entry changed since
+    mtime: float
+    inode: int
+    device: int
+
+
+class CleanPlan(TypedDict):
+    # Category (TEMP_FILES, LARGE_OLD) -> what would be deleted
+    candidates: Dict[str, List[Candidate]]
+    # Category -> bytes on disk that deleting its candidates frees
+    reclaimable: Dict[str, int]
+    # Category -> the scanned folder its candidates are in
+    roots: Dict[str, str]
+
+
+def changed_since_scan(candidate: Candidate, st: os.stat_result) -> bool:
+    """
+    True if `st` (a fresh lstat) is not the entry the plan was made from:
+    replaced, turned into another kind of entry, or modified again.
+    """
+    if stat.S_ISDIR(st.st_mode) != candidate["is_dir"]:
+        return True
+    if candidate["inode"] and st.st_ino != candidate["inode"]:
+        return True
+    if candidate["device"] and st.st_dev != candidate["device"]:
+        return True
+    # A planned folder's mtime changes as its planned content is deleted
+    return not candidate["is_dir"] and st.st_mtime != candidate["mtime"]
+
+
+def delete_candidate(
+    candidate: Candidate,
+    logger: Callable[[str], None],
+    dir_fd: Optional[int] = None,
+) -> bool:
+    """
+    Deletes a planned file, or folder if it is empty, and logs the result.
+    With `dir_fd` (its parent folder) it is removed by name, else by path.
 
-
-def delete_file_safely(path: Path, logger: Callable[[str], None]):
-    """Safely attempts to delete a file and logs the result."""
+    A plan can be hours old, so an entry that changed since the scan is
+    skipped; the age rules it was planned under may no longer hold.
+    """
+    name = candidate["name"]
+    path = name if dir_fd is not None else candidate["path"]
     try:
-        if path.is_file():
-            path.unlink()
-            logger(f"  [DELETED] File: {path.name}")
-        elif path.is_dir() and not list(path.iterdir()):
+        st = os.stat(path, dir_fd=dir_fd, follow_symlinks=False)
+        if changed_since_scan(candidate, st):
+            logger(f"  [SKIPPED] {name}: Changed since scan.")
+            return False
+        if candidate["is_dir"]:
             # Only delete empty directories for temp folders
-            path.rmdir()
-            logger(f"  [DELETED] Empty Directory: {path.name}")
-
+            os.rmdir(path, dir_fd=dir_fd)
+            logger(f"  [DELETED] Empty Directory: {name}")
+        else:
+            os.unlink(path, dir_fd=dir_fd)
+            logger(f"  [DELETED] File: {name}")
+        return True
     except OSError as e:
-        logger(f"  [FAILED] Could not delete {path.name}. Error: {e}")
-    except Exception as e:
-        logger(f"  [FAILED] Unexpected error with {path.name}. Error: {e}")
+        if candidate["is_dir"] and e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+            logger(f"  [SKIPPED] {name}: Directory is not empty.")
+        else:
+            logger(f"  [FAILED] Could not delete {name}. Error: {e}")
+        return False
+
+
+def is_download_candidate(
+    record: FileRecord, now_ts: float, logger: Callable[[str], None]
+) -> bool:
+    """True for a Downloads file that is both large and old."""
+    name = record["name"]
+    # Check 1: Size > 500 MB
+    is_large = record["size"] > LARGE_FILE_LIMIT_BYTES
+
+    # Check 2: Last accessed or modified time > 3 months ago
+    # Use max of st_atime (access) and st_mtime (modified) for robustness
+    last_activity_ts = max(record["atime"], record["mtime"])
+    is_old = last_activity_ts < now_ts - OLD_FILE_LIMIT_SECONDS
+
+    if is_large and is_old:
+        logger(f"  [CANDIDATE] Found: {name}")
+        logger(
+            f"    Size: {round(record['size'] / 1024 / 1024, 2)} MB. Age: > 3 months."
+        )
+        return True
+    elif is_large:
+        logger(f"  [SKIPPED] {name}: Large, but too recent.")
+    elif is_old:
+        logger(f"  [SKIPPED] {name}: Old, but too small.")
+    return False
+
+
+def _candidate(record: FileRecord) -> Candidate:
+    return {
+        "path": record["path"],
+        "name": record["name"],
+        "is_dir": record["is_dir"],
+        "disk_bytes": record["disk_bytes"],
+        "mtime": record["mtime"],
+        "inode": record["inode"],
+        "device": record["device"],
+    }
 
 
-def run_clean_logic(options: Dict[str, bool], logger: Callable[[str], None]):
+def build_clean_plan(
+    options: Dict[str, bool],
+    logger: Callable[[str], None],
+    job: Optional[Job] = None,
+) -> CleanPlan:
     """
-    Runs safe, non-strict disk cleanup based on provided options.
+    Dry run: scans the folders for the selected options and lists what a
+    cleanup would delete, without deleting anything.
+
+    The temp folder and the Downloads folder are scanned concurrently. Stale
+    trees in the temp folder are followed down to TEMP_MAX_DEPTH, and folders
+    whose whole content is stale are planned for pruning (see pruner.py).
+    Reclaimable space is the candidates' disk usage, not their size.
 
     Args:
         options: A dictionary of cleaning options (e.g., {"temp_files": True}).
         logger: A function to output messages (e.g., print or a custom log function).
+        job: The Job running this scan, if any. It gets one step per entry
+            and can stop the scan between two entries.
     """
     logger("=" * 40)
-    logger(f"Cleanup Run Started at {datetime.now().strftime('%H:%M:%S')}")
+    logger(f"Cleanup Scan Started at {datetime.now().strftime('%H:%M:%S')}")
     logger("=" * 40)
 
-    files_deleted_count = 0
+    plan: CleanPlan = {"candidates": {}, "reclaimable": {}, "roots": {}}
     now_ts = time.time()
-    three_months_ago_ts = now_ts - OLD_FILE_LIMIT_SECONDS
-
-    # --- 1. Clean Temporary Files ---
-    if options.get("temp_files"):
+    roots: List[ScanRoot] = []
+    temp_records: List[FileRecord] = []
+    # A safe check: only delete temp files older than 1 day to avoid
+    # deleting temporary files used by currently running programs.
+    temp_cutoff = now_ts - TEMP_MIN_AGE_SECONDS
+
+    # --- 1. Temporary Files ---
+    if options.get(TEMP_FILES):
         logger("\n[Task] Checking System Temporary Files...")
         temp_dir = Path(tempfile.gettempdir())
 
         if not temp_dir.exists():
             logger("  Temp directory not found or inaccessible.")
-
-        for item in temp_dir.iterdir():
-            # A safe check: only delete files older than 1 day to avoid
-            # deleting temporary files used by currently running programs.
-            try:
-                if item.stat().st_mtime < (now_ts - 24 * 60 * 60):
-                    delete_file_safely(item, logger)
-                    files_deleted_count += 1
-                else:
-                    logger(
-                        f"  [SKIPPED] {item.name}: Too recent (less than 24 hours old)."
-                    )
-            except Exception as e:
-                logger(f"  [SKIPPED] Cannot access stats for {item.name}: {e}")
-
-    # --- 2. Check Large & Old Files (Downloads Root Only) ---
-    if options.get("large_old"):
+        else:
+            roots.append(
+                {
+                    "name": TEMP_ROOT,
+                    "path": str(temp_dir),
+                    "max_depth": TEMP_MAX_DEPTH,
+                }
+            )
+            plan["roots"][TEMP_FILES] = str(temp_dir)
+
+    # --- 2. Large & Old Files (Downloads Root Only) ---
+    if options.get(LARGE_OLD):
         logger("\n[Task] Checking Large & Old Files in Downloads Root...")
 
         try:
@@ -78,39 +203,11 @@ def run_clean_logic(options: Dict[str, bool], logger: Callable[[str], None]):
             downloads_path = None
 
         if downloads_path and downloads_path.exists():
-            for item in downloads_path.iterdir():
-                if item.is_file():
-                    try:
-                        file_stat = item.stat()
-
-                        # Check 1: Size > 500 MB
-                        is_large = file_stat.st_size > LARGE_FILE_LIMIT_BYTES
-
-                        # Check 2: Last accessed or modified time > 3 months ago
-                        # Use max of st_atime (access) and st_mtime (modified) for robustness
-                        last_activity_ts = max(file_stat.st_atime, file_stat.st_mtime)
-                        is_old = last_activity_ts < three_months_ago_ts
-
-                        if is_large and is_old:
-                            logger(f"  [CANDIDATE] Found: {item.name}")
-                            logger(
-                                f"    Size: {round(file_stat.st_size / 1024 / 1024, 2)} MB. Age: > 3 months."
-                            )
-
-                            # Log action, but DO NOT DELETE YET (Crucial Safety Step)
-                            # In a cleaner, files should be quarantined or confirmed.
-                            # For this function, we just log it as a finding.
-
-                        elif is_large:
-                            logger(f"  [SKIPPED] {item.name}: Large, but too recent.")
-                        elif is_old:
-                            logger(f"  [SKIPPED] {item.name}: Old, but too small.")
-
-                    except OSError as e:
-                        logger(
-                            f"  [SKIPPED] Cannot access file stats for {item.name}: {e}"
-                        )
-
+            roots.append(
+                {"name": DOWNLOADS_ROOT, "path": str(downloads_path), "max_depth": 0}
+            )
+            plan["roots"][LARGE_OLD] = str(downloads_path)
+            plan["candidates"][LARGE_OLD] = []
         elif downloads_path:
             logger(f"  Downloads directory does not exist at: {downloads_path}")
 
@@ -119,9 +216,104 @@ def run_clean_logic(options: Dict[str, bool], logger: Callable[[str], None]):
         logger("\n[Task] Checking Browser Cache...")
         logger("  [SKIPPED] Browser cache deletion is work in progress!!")
 
+    if job is not None:
+        job.begin_phase("Scanning")
+    for record in scan(roots):
+        if job is not None:
+            job.step(record["disk_bytes"])
+        if record["error"] is not None:
+            logger(f"  [SKIPPED] Cannot access {record['name']}: {record['error']}")
+            if record["root"] == TEMP_ROOT:
+                # Keeps the folders around it from being pruned
+                temp_records.append(record)
+        elif record["root"] == TEMP_ROOT:
+            # Decided once the whole tree is known
+            temp_records.append(record)
+            if record["depth"] == 0 and record["mtime"] >= temp_cutoff:
+                logger(
+                    f"  [SKIPPED] {record['name']}: Too recent "
+                    "(less than 24 hours old)."
+                )
+        elif not record["is_dir"] and is_download_candidate(record, now_ts, logger):
+            plan["candidates"][LARGE_OLD].append(_candidate(record))
+
+    if TEMP_FILES in plan["roots"]:
+        stale = plan_stale_tree(
+            temp_records, plan["roots"][TEMP_FILES], temp_cutoff, TEMP_MAX_DEPTH
+        )
+        plan["candidates"][TEMP_FILES] = [_candidate(record) for record in stale]
+
+    logger("\n" + "=" * 40)
+    logger("Cleanup Scan Finished.")
+    for category, candidates in plan["candidates"].items():
+        plan["reclaimable"][category] = sum(c["disk_bytes"] for c in candidates)
+        logger(f"  {describe_category(plan, category)}")
+    logger("=" * 40)
+    return plan
+
+
+def describe_category(plan: CleanPlan, category: str) -> str:
+    """E.g. "Old temporary files: 120 items, 1.5 GB"."""
+    count = len(plan["candidates"][category])
+    reclaimable = format_size(plan["reclaimable"][category])
+    return f"{CATEGORY_TITLES[category]}: {count} items, {reclaimable}"
+
+
+def execute_clean_plan(
+    plan: CleanPlan,
+    categories: List[str],
+    logger: Callable[[str], None],
+    job: Optional[Job] = None,
+) -> int:
+    """
+    Deletes the candidates of the chosen plan `categories`, straight from the
+    plan without scanning again, and returns how many were deleted.
+
+    Each category is removed in one bottom-up walk, so folders emptied by the
+    cleanup are pruned right after their content.
+    """
+    logger("=" * 40)
+    logger(f"Cleanup Run Started at {datetime.now().strftime('%H:%M:%S')}")
+    logger("=" * 40)
+
+    categories = [c for c in categories if plan["candidates"].get(c)]
+    if job is not None:
+        total = sum(len(plan["candidates"][c]) for c in categories)
+        job.begin_phase("Deleting", total)
+    files_deleted_count = 0
+    freed = 0
+    for category in categories:
+        ordered = deletion_order(
+            plan["roots"][category], plan["candidates"][category], logger
+        )
+        for candidate, dir_fd in ordered:
+            if job is not None:
+                job.step(candidate["disk_bytes"])
+            if delete_candidate(candidate, logger, dir_fd):
+                files_deleted_count += 1
+                freed += candidate["disk_bytes"]
+
     logger("\n" + "=" * 40)
-    logger(f"Cleanup Run Finished. Files deleted: {files_deleted_count}")
+    logger(
+        f"Cleanup Run Finished. Files deleted: {files_deleted_count}, "
+        f"freed {format_size(freed)}"
+    )
     logger("=" * 40)
+    return files_deleted_count
+
+
+def run_clean_logic(
+    options: Dict[str, bool],
+    logger: Callable[[str], None],
+    job: Optional[Job] = None,
+):
+    """
+    Runs safe, non-strict disk cleanup based on provided options: builds the
+    plan, then deletes the old temporary files. Large & old downloads are
+    only reported; they are deleted only when chosen from the plan.
+    """
+    plan = build_clean_plan(options, logger, job)
+    execute_clean_plan(plan, [TEMP_FILES], logger, job)
 
 
 # --- Demonstration ---
@@ -0,0 +1,92 @@
+import customtkinter as ctk
+from typing import Callable, Dict, List, Optional
+
+from .cleaner_helper import LARGE_OLD, CleanPlan, describe_category
+
+
+class PlanFrame(ctk.CTkFrame):
+    """
+    The result of a scan: one checkbox per plan category with its item count
+    and reclaimable space, and a button that deletes the checked ones.
+
+    Large & old downloads start unchecked, since they are the user's files.
+    """
+
+    def __init__(self, master, on_clean: Callable[[List[str]], None]):
+        super().__init__(master)
+        self.on_clean = on_clean
+        self.plan: Optional[CleanPlan] = None
+        self.vars: Dict[str, ctk.StringVar] = {}
+
+        self.grid_columnconfigure(0, weight=1)
+
+        self.title_label = ctk.CTkLabel(
+            self, text="Cleanup Plan", font=ctk.CTkFont(size=18, weight="bold")
+        )
+        self.title_label.grid(row=0, column=0, padx=20, pady=(10, 5), sticky="w")
+
+        self.checkboxs_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.checkboxs_frame.grid(row=1, column=0, padx=20, sticky="ew")
+        self.empty_label = ctk.CTkLabel(
+            self.checkboxs_frame, text="Scan to see what can be cleaned."
+        )
+        self.empty_label.pack(anchor="w")
+
+        self.clean_button = ctk.CTkButton(
+            self,
+            text="Clean Selected",
+            fg_color="darkred",
+            hover_color="#5a0000",
+            state="disabled",
+            command=self._clean,
+        )
+        self.clean_button.grid(row=2, column=0, padx=20, pady=(5, 10), sticky="ew")
+
+    def show(self, plan: Optional[CleanPlan]):
+        """Lists the categories of `plan`, or the empty state for None."""
+        self.plan = plan
+        self.vars = {}
+        for child in self.checkboxs_frame.winfo_children():
+            if child is not self.empty_label:
+                child.destroy()
+
+        if not plan or not any(plan["candidates"].values()):
+            self.empty_label.configure(
+                text="Nothing to clean." if plan else "Scan to see what can be cleaned."
+            )
+            self.empty_label.pack(anchor="w")
+            self.clean_button.configure(state="disabled")
+            return
+
+        self.empty_label.pack_forget()
+        for category, candidates in plan["candidates"].items():
+            var = ctk.StringVar(value="off" if category == LARGE_OLD else "on")
+            check = ctk.CTkCheckBox(
+                self.checkboxs_frame,
+                text=describe_category(plan, category),
+                variable=var,
+                onvalue="on",
+                offvalue="off",
+                state="normal" if candidates else "disabled",
+            )
+            check.pack(pady=(5, 5), anchor="w")
+            self.vars[category] = var
+        self.clean_button.configure(state="normal")
+
+    def set_enabled(self, enabled: bool):
+        """Disables the Clean button while a scan or cleanup runs."""
+        has_plan = self.plan is not None and bool(self.vars)
+        state = "normal" if enabled and has_plan else "disabled"
+        self.clean_button.configure(state=state)
+
+    def selected(self) -> List[str]:
+        return [
+            category
+            for category, var in self.vars.items()
+            if var.get() == "on" and self.plan["candidates"][category]
+        ]
+
+    def _clean(self):
+        categories = self.selected()
+        if categories:
+            self.on_clean(categories)
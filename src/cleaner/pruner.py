@@ -0,0 +1,160 @@
+"""
+Recursive, age-aware cleanup of stale folder trees, such as the ones crashed
+builds leave in the temp folder.
+
+plan_stale_tree() picks what to delete from a recursive scan: stale files,
+and folders whose whole content goes too, so they can be pruned. Only the
+content of stale folders is considered: a folder changed within the age
+limit may belong to a running program, so its whole subtree is left alone.
+
+deletion_order() then lists the plan in one bottom-up walk: a folder's
+files, its subfolders' content, then the subfolder itself. Where the OS
+supports it, every folder is opened relative to its parent's descriptor and
+its entries are removed by name (unlinkat/rmdir with dir_fd), so deep trees
+never rebuild full paths, and a folder swapped for a symlink since the scan
+is not followed (O_NOFOLLOW).
+"""
+
+import os
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from cleaner.scanner import FileRecord
+
+USE_DIR_FD = {os.open, os.stat, os.unlink, os.rmdir} <= os.supports_dir_fd
+_OPEN_FLAGS = (
+    os.O_RDONLY
+    | getattr(os, "O_DIRECTORY", 0)
+    | getattr(os, "O_NOFOLLOW", 0)
+    | getattr(os, "O_CLOEXEC", 0)
+)
+
+
+def plan_stale_tree(
+    records: List[FileRecord],
+    root_path: str,
+    cutoff: float,
+    max_depth: int,
+) -> List[FileRecord]:
+    """
+    The records to delete from a recursive scan of `root_path`: files last
+    modified before `cutoff` inside stale folders, and stale folders all of
+    whose entries are deleted too. Folders at `max_depth` were not listed, so
+    they are never pruned.
+    """
+    by_path = {record["path"]: record for record in records}
+    # Folders that could not be listed, or entries that could not be read
+    unreadable = {record["path"] for record in records if record["error"]}
+    children: Dict[str, int] = {}
+    for record in records:
+        parent = os.path.dirname(record["path"])
+        children[parent] = children.get(parent, 0) + 1
+
+    stale_parents: Dict[str, bool] = {root_path: True}
+
+    def in_stale_folder(path: str) -> bool:
+        # Is every folder from root_path down to `path`'s parent stale?
+        parent = os.path.dirname(path)
+        if parent not in stale_parents:
+            folder = by_path.get(parent)
+            stale_parents[parent] = (
+                folder is not None
+                and folder["error"] is None
+                and folder["mtime"] < cutoff
+                and in_stale_folder(parent)
+            )
+        return stale_parents[parent]
+
+    candidates: List[FileRecord] = []
+    deleted_children: Dict[str, int] = {}
+    # Deepest first, so a folder's children are decided before the folder
+    for record in sorted(records, key=lambda r: r["depth"], reverse=True):
+        path = record["path"]
+        if record["error"] or record["mtime"] >= cutoff:
+            continue
+        if not in_stale_folder(path):
+            continue
+        if record["is_dir"] and (
+            record["depth"] >= max_depth
+            or path in unreadable
+            or deleted_children.get(path, 0) != children.get(path, 0)
+        ):
+            continue
+        candidates.append(record)
+        parent = os.path.dirname(path)
+        deleted_children[parent] = deleted_children.get(parent, 0) + 1
+    return candidates
+
+
+class _Folder:
+    """A folder of the plan: its files, subfolders and own candidate."""
+
+    __slots__ = ("files", "folders", "candidate")
+
+    def __init__(self):
+        self.files: List[Dict] = []
+        self.folders: Dict[str, "_Folder"] = {}
+        self.candidate: Optional[Dict] = None
+
+
+def _build_tree(root_path: str, candidates: List[Dict]) -> _Folder:
+    root = _Folder()
+    for candidate in candidates:
+        parts = os.path.relpath(candidate["path"], root_path).split(os.sep)
+        folder = root
+        for name in parts[:-1]:
+            folder = folder.folders.setdefault(name, _Folder())
+        if candidate["is_dir"]:
+            folder.folders.setdefault(parts[-1], _Folder()).candidate = candidate
+        else:
+            folder.files.append(candidate)
+    return root
+
+
+def _walk_fd(
+    folder: _Folder, fd: int, logger: Callable[[str], None]
+) -> Iterator[Tuple[Dict, Optional[int]]]:
+    for candidate in folder.files:
+        yield candidate, fd
+    for name, subfolder in folder.folders.items():
+        try:
+            sub_fd = os.open(name, _OPEN_FLAGS, dir_fd=fd)
+        except OSError as e:
+            # Gone, or replaced by a file or symlink since the scan
+            logger(f"  [SKIPPED] {name}: Could not open folder. Error: {e}")
+            continue
+        try:
+            yield from _walk_fd(subfolder, sub_fd, logger)
+        finally:
+            os.close(sub_fd)
+        if subfolder.candidate is not None:
+            yield subfolder.candidate, fd
+
+
+def deletion_order(
+    root_path: str, candidates: List[Dict], logger: Callable[[str], None]
+) -> Iterator[Tuple[Dict, Optional[int]]]:
+    """
+    Yields `(candidate, dir_fd)` pairs of `candidates` under `root_path`, each
+    folder after everything planned inside it.
+
+    `dir_fd` is an open descriptor of the candidate's parent folder, valid
+    until the next pair is requested; remove the candidate by its name
+    relative to it. It is None where dir_fd is not supported, and the full
+    path must be used instead.
+    """
+    if not USE_DIR_FD:
+        # Files first, then folders deepest first
+        depth = lambda c: c["path"].count(os.sep)
+        for candidate in sorted(candidates, key=lambda c: (c["is_dir"], -depth(c))):
+            yield candidate, None
+        return
+
+    try:
+        root_fd = os.open(root_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError as e:
+        logger(f"  [FAILED] Could not open {root_path}. Error: {e}")
+        return
+    try:
+        yield from _walk_fd(_build_tree(root_path, candidates), root_fd, logger)
+    finally:
+        os.close(root_fd)
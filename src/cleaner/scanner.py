@@ -0,0 +1,192 @@
+import os
+import queue
+import stat as stat_module
+import threading
+from typing import Dict, Iterator, List, Optional, TypedDict
+
+from logic.workers import LOW, get_pool
+
+# Records are handed over in batches to keep the queue traffic low
+BATCH_SIZE = 256
+
+
+class ScanRoot(TypedDict):
+    name: str  # tags the records, e.g. "temp" or "downloads"
+    path: str
+    max_depth: int  # 0 lists the folder itself, 1 also its subfolders, ...
+
+
+class FileRecord(TypedDict):
+    root: str
+    path: str
+    name: str
+    depth: int
+    is_dir: bool
+    size: int
+    disk_bytes: int  # space actually used on disk, from st_blocks
+    mtime: float
+    atime: float
+    inode: int
+    device: int  # 0 where DirEntry does not know it (Windows)
+    error: Optional[str]  # why the entry (or folder) was not read
+
+
+# Put by a folder's task once all its records are queued
+_FOLDER_DONE = object()
+
+OTHER_FILE_SYSTEM = "On another file system, not followed"
+
+
+def disk_usage(stat: os.stat_result) -> int:
+    """
+    Bytes an entry takes on disk: less than st_size for sparse or compressed
+    files, more for small files that still fill a whole block.
+    """
+    blocks = getattr(stat, "st_blocks", None)
+    # st_blocks counts 512-byte units; Windows has no st_blocks
+    return blocks * 512 if blocks is not None else stat.st_size
+
+
+def crosses_boundary(stat: os.stat_result, root_device: int) -> bool:
+    """
+    True for an entry that leads out of its root's file system: a mount
+    point (or bind-mounted file), or on Windows any reparse point, such as a
+    junction, which DirEntry.is_dir() does not treat as a symlink.
+    """
+    attributes = getattr(stat, "st_file_attributes", 0)
+    if attributes & stat_module.FILE_ATTRIBUTE_REPARSE_POINT:
+        return True
+    # Windows' DirEntry stat has no st_dev; reparse points cover it there
+    return bool(root_device and stat.st_dev) and stat.st_dev != root_device
+
+
+def _error_record(
+    root: ScanRoot, path: str, depth: int, error: OSError
+) -> FileRecord:
+    return {
+        "root": root["name"],
+        "path": path,
+        "name": os.path.basename(path),
+        "depth": depth,
+        "is_dir": True,
+        "size": 0,
+        "disk_bytes": 0,
+        "mtime": 0.0,
+        "atime": 0.0,
+        "inode": 0,
+        "device": 0,
+        "error": str(error),
+    }
+
+
+class _Scan:
+    """One scan() call: folder tasks on the worker pool feeding a queue."""
+
+    def __init__(self):
+        self.results: "queue.Queue" = queue.Queue()
+        self.stopped = threading.Event()
+        self.outstanding = 0
+        self.lock = threading.Lock()
+        # Root name -> st_dev of the root folder, 0 if unknown
+        self.devices: Dict[str, int] = {}
+
+    def submit(self, root: ScanRoot, path: str, depth: int):
+        with self.lock:
+            self.outstanding += 1
+        get_pool().submit(self.scan_folder, root, path, depth, priority=LOW)
+
+    def scan_folder(self, root: ScanRoot, path: str, depth: int):
+        try:
+            if not self.stopped.is_set():
+                self._scan_folder(root, path, depth)
+        finally:
+            self.results.put(_FOLDER_DONE)
+
+    def _scan_folder(self, root: ScanRoot, path: str, depth: int):
+        batch: List[FileRecord] = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if self.stopped.is_set():
+                        return
+                    # DirEntry answers is_dir() from the directory listing;
+                    # symlinks are never followed, and neither are mount
+                    # points or junctions (see crosses_boundary), so nothing
+                    # outside the scanned folders is ever touched
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError as e:
+                        batch.append(_error_record(root, entry.path, depth, e))
+                        continue
+                    boundary = crosses_boundary(stat, self.devices[root["name"]])
+                    batch.append(
+                        {
+                            "root": root["name"],
+                            "path": entry.path,
+                            "name": entry.name,
+                            "depth": depth,
+                            "is_dir": is_dir,
+                            "size": 0 if is_dir else stat.st_size,
+                            "disk_bytes": disk_usage(stat),
+                            "mtime": stat.st_mtime,
+                            "atime": stat.st_atime,
+                            # inode() also works on Windows, where the
+                            # cached stat has no st_ino
+                            "inode": entry.inode(),
+                            "device": stat.st_dev,
+                            # Kept, so the folders around it are not pruned
+                            "error": OTHER_FILE_SYSTEM if boundary else None,
+                        }
+                    )
+                    if is_dir and not boundary and depth < root["max_depth"]:
+                        # Subfolders are walked concurrently
+                        self.submit(root, entry.path, depth + 1)
+                    if len(batch) >= BATCH_SIZE:
+                        self.results.put(batch)
+                        batch = []
+        except OSError as e:
+            batch.append(_error_record(root, path, depth, e))
+        if batch:
+            self.results.put(batch)
+
+    def records(self) -> Iterator[FileRecord]:
+        while True:
+            item = self.results.get()
+            if item is _FOLDER_DONE:
+                # Subfolders are submitted before their parent is done, so
+                # this only reaches 0 once every folder was scanned
+                with self.lock:
+                    self.outstanding -= 1
+                    if self.outstanding == 0:
+                        return
+                continue
+            yield from item
+
+
+def scan(roots: List[ScanRoot]) -> Iterator[FileRecord]:
+    """
+    Lists the entries of every root, and of their subfolders up to each
+    root's max_depth, with os.scandir.
+
+    Roots and subfolders are scanned concurrently on the shared worker pool,
+    and records are yielded as they come in, in no particular order. A root
+    or folder that cannot be listed yields one record with its `error`, and
+    so does every entry on another file system than its root (mount points,
+    Windows junctions), which is never listed.
+    Stopping the iteration early stops the folder tasks.
+    """
+    if not roots:
+        return
+    run = _Scan()
+    for root in roots:
+        try:
+            run.devices[root["name"]] = os.stat(root["path"]).st_dev
+        except OSError:
+            # Listing the root fails too and reports the error
+            run.devices[root["name"]] = 0
+        run.submit(root, root["path"], 0)
+    try:
+        yield from run.records()
+    finally:
+        run.stopped.set()
@@ -0,0 +1,165 @@
+"""
+Headless metrics exporter.
+
+Serves the sampler's latest system metrics in the Prometheus text format,
+without importing customtkinter or PIL, so it runs on servers with no display:
+
+    python exporter.py --port 9105
+    python exporter.py --unix-socket /run/toolkit-metrics.sock
+"""
+
+import argparse
+import os
+import socketserver
+import stat
+import sys
+from typing import List
+
+from logic.sampler import MetricsSampler
+from logic.stats import RawMetrics
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (metric name, RawMetrics field, help text)
+GAUGES = (
+    ("toolkit_cpu_percent", "cpu_percent", "CPU usage in percent."),
+    ("toolkit_cpu_temperature_celsius", "cpu_temp", "CPU temperature."),
+    ("toolkit_memory_percent", "ram_percent", "RAM usage in percent."),
+    ("toolkit_memory_used_bytes", "ram_used", "RAM in use."),
+    ("toolkit_disk_percent", "disk_percent", "Root disk usage in percent."),
+    ("toolkit_disk_used_bytes", "disk_used", "Root disk space in use."),
+    ("toolkit_disk_free_bytes", "disk_free", "Root disk space available."),
+    (
+        "toolkit_network_receive_bytes_per_second",
+        "net_recv_rate",
+        "Network download rate.",
+    ),
+    (
+        "toolkit_network_transmit_bytes_per_second",
+        "net_sent_rate",
+        "Network upload rate.",
+    ),
+    ("toolkit_sample_timestamp_seconds", "timestamp", "When the sample was taken."),
+)
+
+
+def format_prometheus(sample: RawMetrics) -> str:
+    """Renders one sample in the Prometheus text exposition format."""
+    lines: List[str] = []
+    for name, field, help_text in GAUGES:
+        value = sample[field]
+        if value is None:
+            # e.g. no temperature sensor on this machine
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+class MetricsHandler(socketserver.StreamRequestHandler):
+    """A minimal HTTP/1.0 handler: GET /metrics returns the latest sample."""
+
+    sampler: MetricsSampler
+    # The server handles one client at a time; a client that never sends its
+    # request must not block every other scrape
+    timeout = 5
+
+    def handle(self):
+        try:
+            self._handle()
+        except TimeoutError:
+            pass
+
+    def _handle(self):
+        request_line = self.rfile.readline(1024).decode("latin-1").split()
+        # Skip the headers; nothing in them changes the response
+        while self.rfile.readline(1024) not in (b"\r\n", b"\n", b""):
+            pass
+
+        if len(request_line) < 2 or request_line[0] not in ("GET", "HEAD"):
+            self._respond("405 Method Not Allowed", "")
+        elif request_line[1].split("?")[0] not in ("/", "/metrics"):
+            self._respond("404 Not Found", "")
+        else:
+            sample = self.sampler.latest()
+            if sample is None:
+                sample = self.sampler.sample_now()
+            body = format_prometheus(sample)
+            self._respond("200 OK", "" if request_line[0] == "HEAD" else body)
+
+    def _respond(self, status: str, body: str):
+        payload = body.encode("utf-8")
+        header = (
+            f"HTTP/1.0 {status}\r\n"
+            f"Content-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        self.wfile.write(header.encode("latin-1") + payload)
+
+
+class TCPServer(socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+def remove_stale_socket(path: str) -> bool:
+    """
+    Removes the Unix socket at `path` if there is one. Returns False, and
+    leaves it alone, if `path` is anything other than a socket.
+    """
+    try:
+        if not stat.S_ISSOCK(os.lstat(path).st_mode):
+            return False
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    return True
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serve Toolkit system metrics in Prometheus text format."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="address to bind")
+    parser.add_argument("--port", type=int, default=9105, help="TCP port to bind")
+    parser.add_argument(
+        "--unix-socket", help="serve on this Unix socket path instead of TCP"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="sampling interval in seconds"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.unix_socket and not remove_stale_socket(args.unix_socket):
+        sys.exit(f"error: {args.unix_socket} exists and is not a socket")
+
+    sampler = MetricsSampler(interval=args.interval)
+    sampler.start()
+    MetricsHandler.sampler = sampler
+
+    if args.unix_socket:
+        server = socketserver.UnixStreamServer(args.unix_socket, MetricsHandler)
+        where = args.unix_socket
+    else:
+        server = TCPServer((args.host, args.port), MetricsHandler)
+        where = f"http://{args.host}:{args.port}/metrics"
+
+    print(f"Serving metrics on {where}")
+    try:
+        # Nothing else runs on this thread, so there is no need to wake it often
+        server.serve_forever(poll_interval=5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        sampler.stop()
+        if args.unix_socket:
+            remove_stale_socket(args.unix_socket)
+
+
+if __name__ == "__main__":
+    main()
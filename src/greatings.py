@@ -1,5 +1,8 @@
 import customtkinter
+import live_updates
 import logic.utils as utils
+from logic import metrics_bus
+from logic.alerts import NORMAL_MESSAGE
 
 
 class GreatingsFrame(customtkinter.CTkFrame):
@@ -26,7 +29,7 @@ class GreatingsFrame(customtkinter.CTkFrame):
         # Sub Title
         self.subtitle = customtkinter.CTkLabel(
             self,
-            text=f"Your system is running normally.",
+            text=NORMAL_MESSAGE,
             font=("Helvetica", 18),
             text_color="gray50",
         )
@@ -36,3 +39,18 @@ class GreatingsFrame(customtkinter.CTkFrame):
             pady=(5, 10),
             expand=True,
         )
+
+        # The alert rules decide what the subtitle says
+        self.subscription = live_updates.attach(
+            self, metrics_bus.SYSTEM, lambda sample: self.update_status()
+        )
+
+    def update_status(self):
+        """Shows the active alert (if any) instead of the all-clear message."""
+        message = metrics_bus.get_bus().alerts.status_message()
+        if message == self.subtitle.cget("text"):
+            return
+        self.subtitle.configure(
+            text=message,
+            text_color="gray50" if message == NORMAL_MESSAGE else "#FF4500",
+        )
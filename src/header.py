@@ -1,5 +1,5 @@
 import customtkinter as ctk
-from PIL import Image
+from asset_cache import get_image
 from about.about_frame import AboutWindow
 
 
@@ -11,8 +11,7 @@ class HeaderFrame(ctk.CTkFrame):
         self.window: ctk.CTk = None
 
         # LOGO
-        imageData = Image.open("assets/icon.png")
-        logo = ctk.CTkImage(dark_image=imageData, light_image=imageData, size=(50, 50))
+        logo = get_image("icon.png", (50, 50))
         self.logo = ctk.CTkLabel(
             self,
             text="",
@@ -35,10 +34,7 @@ class HeaderFrame(ctk.CTkFrame):
         )
 
         # Settings
-        imageData2 = Image.open("assets/setting.png")
-        setting = ctk.CTkImage(
-            dark_image=imageData2, light_image=imageData2, size=(40, 40)
-        )
+        setting = get_image("setting.png", (40, 40))
         self.settings = ctk.CTkLabel(
             self,
             text="",
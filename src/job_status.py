@@ -0,0 +1,117 @@
+import tkinter
+from typing import Callable, Optional
+
+import customtkinter as ctk
+
+from logic.jobs import CANCELLED, FAILED, Job, JobProgress
+from logic.processes import format_size
+from logic.workers import HIGH
+from ui_scheduler import get_scheduler
+
+
+def _format_eta(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def describe_progress(progress: JobProgress) -> str:
+    """E.g. "Moving files: 120/800 files, 1.5 GB, ETA 0:42"."""
+    items = str(progress["items"])
+    if progress["total_items"] is not None:
+        items += f"/{progress['total_items']}"
+    text = f"{progress['phase']}: {items} files"
+    if progress["bytes"]:
+        text += f", {format_size(progress['bytes'])}"
+    if progress["eta"] is not None:
+        text += f", ETA {_format_eta(progress['eta'])}"
+    return text
+
+
+class JobStatus(ctk.CTkFrame):
+    """
+    Progress bar, progress text and Cancel button of a background Job.
+
+    run() starts the work on a worker thread; progress reports are moved to
+    the Tk main thread by the UiScheduler, which draws only the newest one.
+    `on_done(status)` is called there once the job finished, was cancelled or
+    failed. A job still running when the frame is destroyed is cancelled.
+    """
+
+    def __init__(self, master, on_done: Optional[Callable[[str], None]] = None):
+        super().__init__(master, fg_color="transparent")
+        self.on_done = on_done
+        self.job: Optional[Job] = None
+
+        self.grid_columnconfigure(0, weight=1)
+
+        self.progress_bar = ctk.CTkProgressBar(self)
+        self.progress_bar.set(0)
+        self.progress_bar.grid(row=0, column=0, padx=(0, 10), sticky="ew")
+        self.cancel_button = ctk.CTkButton(
+            self, text="Cancel", width=80, state="disabled", command=self.cancel
+        )
+        self.cancel_button.grid(row=0, column=1)
+        self.progress_label = ctk.CTkLabel(self, text="", anchor="w")
+        self.progress_label.grid(row=1, column=0, columnspan=2, sticky="ew")
+
+        tkinter.Misc.bind(self, "<Destroy>", self._on_destroy, "+")
+
+    def is_running(self) -> bool:
+        return self.job is not None and self.job.is_running()
+
+    def run(
+        self,
+        work: Callable[[Job], None],
+        on_done: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Starts `work(job)` on a worker thread, unless a job is running.
+        `on_done` replaces the frame's own on_done for this run.
+        """
+        if self.is_running():
+            return
+        on_done = on_done or self.on_done
+        self.progress_bar.set(0)
+        self.progress_label.configure(text="Starting...")
+        self.cancel_button.configure(state="normal")
+        # Called on the job's thread
+        self.job = Job(
+            work,
+            on_progress=lambda p: get_scheduler().post(
+                self, lambda: self._show_progress(p), HIGH, key=self
+            ),
+            on_done=lambda status, e: get_scheduler().post(
+                self, lambda: self._finished(status, on_done), HIGH
+            ),
+        )
+        self.job.start()
+
+    def cancel(self):
+        if self.is_running():
+            self.job.cancel()
+            self.cancel_button.configure(state="disabled")
+            self.progress_label.configure(text="Cancelling...")
+
+    def _show_progress(self, progress: JobProgress):
+        if self.job is None or self.job.cancelled:
+            return
+        total = progress["total_items"]
+        if total:
+            self.progress_bar.set(min(progress["items"] / total, 1))
+        self.progress_label.configure(text=describe_progress(progress))
+
+    def _finished(self, status: str, on_done: Optional[Callable[[str], None]]):
+        self.cancel_button.configure(state="disabled")
+        if status == CANCELLED:
+            self.progress_label.configure(text="Cancelled.")
+        elif status == FAILED:
+            self.progress_label.configure(text="Failed, see the logs.")
+        else:
+            self.progress_bar.set(1)
+            self.progress_label.configure(text="Done.")
+        if on_done is not None:
+            on_done(status)
+
+    def _on_destroy(self, event):
+        if event.widget is self and self.job is not None:
+            self.job.cancel()
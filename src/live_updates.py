@@ -0,0 +1,69 @@
+import tkinter
+from typing import Any, Callable
+
+from logic.metrics_bus import Subscription, get_bus
+from logic.sampler import HIDDEN, OBSCURED, VISIBLE
+from logic.workers import NORMAL
+from ui_scheduler import get_scheduler
+
+
+def attach(
+    widget: tkinter.Misc,
+    topic: str,
+    on_update: Callable[[Any], None],
+    priority: int = NORMAL,
+) -> Subscription:
+    """
+    Subscribes `widget` to a metrics bus topic.
+
+    `on_update` is always called on the Tk main thread, through the shared
+    UiScheduler: updates of every view in one tick are applied in a single
+    idle callback, by `priority`, and only the newest sample per view is
+    drawn. The subscription is cancelled automatically when the widget is
+    destroyed. The bus is told when the widget's window is minimized/withdrawn
+    or fully covered, so sampling can slow down or pause for views nobody can
+    see.
+    """
+    toplevel = widget.winfo_toplevel()
+    state = {"mapped": True, "obscured": False}
+    # Coalesces this view's pending updates; subscribe() may deliver before
+    # `subscription` is assigned
+    update_key = object()
+
+    def deliver(sample):
+        # Called on the sampler thread: hop back to the Tk main thread
+        posted = get_scheduler().post(
+            widget, lambda: on_update(sample), priority, key=update_key, live=True
+        )
+        if not posted:
+            # The widget (or the interpreter) is already gone
+            subscription.cancel()
+
+    def report_visibility():
+        if not state["mapped"]:
+            subscription.set_visibility(HIDDEN)
+        elif state["obscured"]:
+            subscription.set_visibility(OBSCURED)
+        else:
+            subscription.set_visibility(VISIBLE)
+
+    def on_map(event):
+        if event.widget is toplevel:
+            state["mapped"] = event.type == tkinter.EventType.Map
+            report_visibility()
+
+    def on_visibility(event):
+        state["obscured"] = event.state == "VisibilityFullyObscured"
+        report_visibility()
+
+    def on_destroy(event):
+        if event.widget is widget:
+            subscription.cancel()
+
+    subscription = get_bus().subscribe(topic, deliver)
+    # CTk widgets redirect bind() to their inner canvas, so bind on the widget itself
+    tkinter.Misc.bind(widget, "<Destroy>", on_destroy, "+")
+    tkinter.Misc.bind(widget, "<Visibility>", on_visibility, "+")
+    tkinter.Misc.bind(toplevel, "<Map>", on_map, "+")
+    tkinter.Misc.bind(toplevel, "<Unmap>", on_map, "+")
+    return subscription
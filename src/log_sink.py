@@ -0,0 +1,90 @@
+import shutil
+import tempfile
+import threading
+import tkinter
+from typing import List
+
+import customtkinter as ctk
+
+# Lines kept in the textbox; older ones are still in the full log
+MAX_LINES = 2000
+FLUSH_MS = 100
+
+
+class LogSink:
+    """
+    Collects log lines for a CTkTextbox.
+
+    write() can be called from any thread and only queues the line. Queued
+    lines are appended to the end of the textbox in one batch every FLUSH_MS
+    on the Tk main thread, and the textbox keeps the last `max_lines` lines.
+    Every line also goes to a temporary file, so the full log of a long run
+    can still be saved with save(). The file is closed with the textbox.
+    """
+
+    def __init__(self, textbox: ctk.CTkTextbox, max_lines: int = MAX_LINES):
+        self.textbox = textbox
+        self.max_lines = max_lines
+        self._pending: List[str] = []
+        self._scheduled = False
+        self._lock = threading.Lock()
+        self._full_log = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+        tkinter.Misc.bind(self.textbox, "<Destroy>", self._on_destroy, "+")
+
+    def write(self, line: str):
+        with self._lock:
+            if self._full_log.closed:
+                # A job thread still logging after its window was destroyed
+                return
+            self._pending.append(line)
+            self._full_log.write(line + "\n")
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self.textbox.after(FLUSH_MS, self._flush)
+        except (RuntimeError, tkinter.TclError):
+            # The textbox (or the interpreter) is already gone
+            pass
+
+    def clear(self):
+        """Empties the textbox and the full log, e.g. before a new run."""
+        with self._lock:
+            self._pending.clear()
+            self._full_log.seek(0)
+            self._full_log.truncate()
+        self.textbox.delete("1.0", "end")
+
+    def save(self, path: str):
+        """Writes every line since the last clear() to `path`."""
+        with self._lock:
+            self._full_log.flush()
+            self._full_log.seek(0)
+            with open(path, "w", encoding="utf-8") as f:
+                shutil.copyfileobj(self._full_log, f)
+            self._full_log.seek(0, 2)
+
+    def close(self):
+        """Deletes the full log; later lines are dropped."""
+        with self._lock:
+            self._pending.clear()
+            self._full_log.close()
+
+    def _on_destroy(self, event):
+        if event.widget is self.textbox:
+            self.close()
+
+    def _flush(self):
+        with self._lock:
+            lines, self._pending = self._pending, []
+            self._scheduled = False
+        if not lines or not self.textbox.winfo_exists():
+            return
+
+        self.textbox.insert("end", "\n".join(lines) + "\n")
+        # The textbox always ends with an empty line after the last "\n"
+        line_count = int(self.textbox.index("end-1c").split(".")[0]) - 1
+        if line_count > self.max_lines:
+            self.textbox.delete("1.0", f"{line_count - self.max_lines + 1}.0")
+        self.textbox.see("end")
@@ -0,0 +1,199 @@
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from logic.metrics_log import get_data_directory
+from logic.stats import RawMetrics
+
+RULES_FILE_NAME = "alert_rules.json"
+
+UNITS = {"": 1, "%": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "Mbps": 125000}
+
+FIRED = "fired"
+CLEARED = "cleared"
+
+NORMAL_MESSAGE = "Your system is running normally."
+
+
+class Rule:
+    """
+    A threshold rule such as "CPU > 90% for 30 s" or "disk free < 5 GB".
+
+    Each sample is checked in O(1): the rule keeps the time its condition
+    started holding and, if `window` is set, a running mean over the last
+    `window` seconds. Once fired, it only clears when the value crosses
+    `clear` (hysteresis), so a value hovering at the threshold doesn't flap.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        metric: str,
+        op: str,
+        threshold: float,
+        duration: float = 0,
+        clear: Optional[float] = None,
+        window: float = 0,
+        message: Optional[str] = None,
+    ):
+        if op not in (">", "<"):
+            raise ValueError(f"Unsupported operator {op!r} in rule {name!r}")
+        self.name = name
+        self.metric = metric
+        self.op = op
+        self.threshold = threshold
+        self.duration = duration
+        self.clear = threshold if clear is None else clear
+        self.window = window
+        self.message = message or name
+
+        self.active = False
+        self._breach_since: Optional[float] = None
+        self._values = deque()  # (timestamp, value) inside the window
+        self._window_sum = 0.0
+
+    def _crosses(self, value: float, limit: float) -> bool:
+        return value > limit if self.op == ">" else value < limit
+
+    def _current_value(self, timestamp: float, value: float) -> float:
+        if not self.window:
+            return value
+        self._values.append((timestamp, value))
+        self._window_sum += value
+        while self._values[0][0] <= timestamp - self.window:
+            _, old = self._values.popleft()
+            self._window_sum -= old
+        return self._window_sum / len(self._values)
+
+    def update(self, sample: RawMetrics) -> Optional[str]:
+        """Feeds one sample; returns FIRED or CLEARED when the state changes."""
+        value = sample.get(self.metric)
+        if value is None:
+            return None
+        timestamp = sample["timestamp"]
+        value = self._current_value(timestamp, value)
+
+        if self.active:
+            if self._crosses(value, self.clear):
+                return None
+            self.active = False
+            self._breach_since = None
+            return CLEARED
+
+        if not self._crosses(value, self.threshold):
+            self._breach_since = None
+            return None
+        if self._breach_since is None:
+            self._breach_since = timestamp
+        if timestamp - self._breach_since >= self.duration:
+            self.active = True
+            return FIRED
+        return None
+
+
+def rule_from_dict(data: Dict) -> Rule:
+    """Builds a rule from its JSON form; thresholds may carry a unit."""
+    scale = UNITS[data.get("unit", "")]
+    clear = data.get("clear")
+    return Rule(
+        name=data["name"],
+        metric=data["metric"],
+        op=data["op"],
+        threshold=data["threshold"] * scale,
+        duration=data.get("duration", 0),
+        clear=None if clear is None else clear * scale,
+        window=data.get("window", 0),
+        message=data.get("message"),
+    )
+
+
+DEFAULT_RULES = [
+    {
+        "name": "High CPU",
+        "metric": "cpu_percent",
+        "op": ">",
+        "threshold": 90,
+        "clear": 80,
+        "duration": 30,
+        "message": "CPU has been above 90% for 30 s.",
+    },
+    {
+        "name": "High RAM",
+        "metric": "ram_percent",
+        "op": ">",
+        "threshold": 90,
+        "clear": 85,
+        "duration": 30,
+        "message": "RAM usage is above 90%.",
+    },
+    {
+        "name": "Low disk space",
+        "metric": "disk_free",
+        "op": "<",
+        "threshold": 5,
+        "clear": 6,
+        "unit": "GB",
+        "message": "Less than 5 GB of disk space is free.",
+    },
+]
+
+
+def load_rules(path: Optional[Path] = None) -> List[Rule]:
+    """
+    Loads the user's rules from `alert_rules.json` in the data dir, falling
+    back to DEFAULT_RULES when the file is missing or invalid.
+    """
+    if path is None:
+        path = get_data_directory() / RULES_FILE_NAME
+    rules = DEFAULT_RULES
+    if path.exists():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                rules = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Could not read alert rules from {path}: {e}")
+    try:
+        return [rule_from_dict(rule) for rule in rules]
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Invalid alert rule in {path}: {e}")
+        return [rule_from_dict(rule) for rule in DEFAULT_RULES]
+
+
+class RuleEngine:
+    """
+    Checks every rule against each sample of the metric stream.
+
+    Listeners are called as `listener(rule, event)` whenever a rule fires or
+    clears; the work per sample is O(number of rules), never a history scan.
+    """
+
+    def __init__(self, rules: Optional[List[Rule]] = None):
+        self.rules = load_rules() if rules is None else rules
+        self.listeners: List[Callable[[Rule, str], None]] = []
+        self._lock = threading.Lock()
+
+    def feed(self, sample: RawMetrics):
+        events = []
+        with self._lock:
+            for rule in self.rules:
+                event = rule.update(sample)
+                if event:
+                    events.append((rule, event))
+        for rule, event in events:
+            for listener in list(self.listeners):
+                listener(rule, event)
+
+    def active_rules(self) -> List[Rule]:
+        with self._lock:
+            return [rule for rule in self.rules if rule.active]
+
+    def status_message(self) -> str:
+        """One line summary for the dashboard greeting."""
+        active = self.active_rules()
+        if not active:
+            return NORMAL_MESSAGE
+        if len(active) == 1:
+            return active[0].message
+        return f"{active[0].message} (+{len(active) - 1} more alerts)"
@@ -0,0 +1,141 @@
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from logic.stats import RawMetrics
+
+# RawMetrics fields that are kept in the history
+FIELDS = (
+    "cpu_percent",
+    "ram_percent",
+    "disk_percent",
+    "net_recv_rate",
+    "net_sent_rate",
+)
+
+# (resolution in seconds, span in seconds) for each downsampling tier
+TIERS = (
+    (1, 10 * 60),  # 1 s for 10 min
+    (10, 6 * 60 * 60),  # 10 s for 6 h
+    (60, 7 * 24 * 60 * 60),  # 1 min for 7 days
+)
+
+
+class HistoryTier:
+    """
+    A fixed-size ring buffer of bucket averages at a single resolution.
+
+    Timestamps are stored in an array('d') and every metric in its own
+    array('f') column, so memory use is fixed at creation time.
+    """
+
+    def __init__(self, resolution: int, span: int):
+        self.resolution = resolution
+        self.capacity = span // resolution
+        self.timestamps = array("d", bytes(8 * self.capacity))
+        self.columns: Dict[str, array] = {
+            field: array("f", bytes(4 * self.capacity)) for field in FIELDS
+        }
+        self._head = 0  # index of the next slot to write
+        self._count = 0
+
+        # Running sums for the bucket currently being filled
+        self._bucket = None
+        self._sums = [0.0] * len(FIELDS)
+        self._samples = 0
+
+    def __len__(self):
+        return self._count
+
+    def add(self, timestamp: float, values: List[float]):
+        bucket = int(timestamp // self.resolution)
+        if self._bucket is not None and bucket != self._bucket:
+            self._flush()
+        self._bucket = bucket
+        for i, value in enumerate(values):
+            self._sums[i] += value
+        self._samples += 1
+
+    def _flush(self):
+        if not self._samples:
+            return
+        slot = self._head
+        self.timestamps[slot] = self._bucket * self.resolution
+        for i, field in enumerate(FIELDS):
+            self.columns[field][slot] = self._sums[i] / self._samples
+            self._sums[i] = 0.0
+        self._samples = 0
+        self._head = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def series(self, field: str, count: Optional[int] = None) -> Tuple[array, array]:
+        """Returns (timestamps, values) for the newest `count` buckets, oldest first."""
+        count = self._count if count is None else min(count, self._count)
+        start = (self._head - count) % self.capacity
+        column = self.columns[field]
+        if start + count <= self.capacity:
+            return (
+                self.timestamps[start : start + count],
+                column[start : start + count],
+            )
+        # The requested range wraps around the end of the ring
+        return (
+            self.timestamps[start:] + self.timestamps[: self._head],
+            column[start:] + column[: self._head],
+        )
+
+
+class MetricHistory:
+    """
+    Multi-resolution, fixed-memory history of system metrics.
+
+    Every sample is averaged into each tier, so coarser tiers are downsampled
+    automatically as data arrives. Safe to feed from the sampler thread while
+    the UI thread reads.
+    """
+
+    def __init__(self, tiers=TIERS):
+        self.tiers = [HistoryTier(resolution, span) for resolution, span in tiers]
+        self._lock = threading.Lock()
+
+    def add(self, sample: RawMetrics):
+        values = [float(sample[field]) for field in FIELDS]
+        with self._lock:
+            for tier in self.tiers:
+                tier.add(sample["timestamp"], values)
+
+    def backfill(self, samples: Iterable[RawMetrics], resolution: int):
+        """
+        Feeds older samples already averaged over `resolution` seconds (e.g.
+        the on-disk rollups), oldest first, into the tiers at least that
+        coarse. Must run before the first live sample is added.
+        """
+        with self._lock:
+            tiers = [tier for tier in self.tiers if tier.resolution >= resolution]
+            for sample in samples:
+                values = [float(sample[field]) for field in FIELDS]
+                for tier in tiers:
+                    tier.add(sample["timestamp"], values)
+
+    def span(self) -> int:
+        """Seconds covered by the coarsest tier."""
+        tier = self.tiers[-1]
+        return tier.capacity * tier.resolution
+
+    def tier_for(self, seconds: float) -> HistoryTier:
+        """Returns the finest tier whose span covers the last `seconds`."""
+        for tier in self.tiers:
+            if tier.capacity * tier.resolution >= seconds:
+                return tier
+        return self.tiers[-1]
+
+    def series(self, field: str, seconds: float) -> Tuple[array, array]:
+        """Returns (timestamps, values) covering roughly the last `seconds`."""
+        tier = self.tier_for(seconds)
+        with self._lock:
+            return tier.series(field, int(seconds // tier.resolution))
+
+    def recent(self, field: str, count: int) -> array:
+        """Returns the newest `count` values at the finest resolution (for sparklines)."""
+        with self._lock:
+            return self.tiers[0].series(field, count)[1]
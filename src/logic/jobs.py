@@ -0,0 +1,125 @@
+import threading
+import time
+from typing import Callable, Optional, TypedDict
+
+# How a job ended
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+# Minimum seconds between two progress reports
+PROGRESS_INTERVAL = 0.1
+
+
+class JobCancelled(BaseException):
+    """
+    Raised by Job.step() on the worker thread once the job was cancelled.
+
+    Like KeyboardInterrupt it is not an Exception, so the helpers' broad
+    `except Exception` around a single file does not swallow it.
+    """
+
+
+class JobProgress(TypedDict):
+    phase: str
+    items: int  # files handled in this phase
+    bytes: int  # size of those files
+    total_items: Optional[int]  # None while the phase's size is unknown
+    elapsed: float  # seconds since the phase began
+    eta: Optional[float]  # seconds left in this phase, if it can be estimated
+
+
+class Job:
+    """
+    Runs a long file operation on a worker thread, with progress and cancel.
+
+    `work(job)` runs on the worker. It calls begin_phase() before each stage
+    and step() once per file; step() reports progress at most every
+    PROGRESS_INTERVAL seconds and raises JobCancelled after cancel(), so the
+    work stops cleanly between two files.
+
+    `on_progress(JobProgress)` and `on_done(status, error)` are called on the
+    worker thread.
+    """
+
+    def __init__(
+        self,
+        work: Callable[["Job"], None],
+        on_progress: Optional[Callable[[JobProgress], None]] = None,
+        on_done: Optional[Callable[[str, Optional[Exception]], None]] = None,
+    ):
+        self.work = work
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._phase = ""
+        self._items = 0
+        self._bytes = 0
+        self._total_items: Optional[int] = None
+        self._phase_start = time.monotonic()
+        self._last_report = 0.0
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="Job", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def begin_phase(self, phase: str, total_items: Optional[int] = None):
+        self._phase = phase
+        self._items = 0
+        self._bytes = 0
+        self._total_items = total_items
+        self._phase_start = time.monotonic()
+        self._report()
+
+    def step(self, size: int = 0):
+        """Counts one file of `size` bytes; raises JobCancelled if cancelled."""
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self._items += 1
+        self._bytes += size
+        if time.monotonic() - self._last_report >= PROGRESS_INTERVAL:
+            self._report()
+
+    def progress(self) -> JobProgress:
+        elapsed = time.monotonic() - self._phase_start
+        eta = None
+        if self._total_items and self._items:
+            left = max(self._total_items - self._items, 0)
+            eta = elapsed / self._items * left
+        return {
+            "phase": self._phase,
+            "items": self._items,
+            "bytes": self._bytes,
+            "total_items": self._total_items,
+            "elapsed": elapsed,
+            "eta": eta,
+        }
+
+    def _report(self):
+        self._last_report = time.monotonic()
+        if self.on_progress is not None:
+            self.on_progress(self.progress())
+
+    def _run(self):
+        status, error = DONE, None
+        try:
+            self.work(self)
+        except JobCancelled:
+            status = CANCELLED
+        except Exception as e:
+            print(f"Error in job: {e}")
+            status, error = FAILED, e
+        self._report()
+        if self.on_done is not None:
+            self.on_done(status, error)
@@ -0,0 +1,197 @@
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from logic.alerts import FIRED, RuleEngine
+from logic.history import MetricHistory
+from logic.metrics_log import ROLLUP, ROLLUP_SECONDS, MetricsLog, MetricsLogReader
+from logic.notify import send_desktop_notification
+from logic.sampler import HIDDEN, VISIBLE, MetricsSampler, Sampler
+from logic.processes import ProcessCollector
+from logic import sampler_process
+from logic.stats import RawMetrics
+
+# Topics every view can subscribe to
+SYSTEM = "system"
+PROCESSES = "processes"
+
+
+class Subscription:
+    """Handle returned by MetricsBus.subscribe(); call cancel() to detach."""
+
+    def __init__(self, bus: "MetricsBus", topic: str, callback: Callable[[Any], None]):
+        self.bus = bus
+        self.topic = topic
+        self.callback = callback
+        self.visibility = VISIBLE
+
+    def cancel(self):
+        self.bus.unsubscribe(self)
+
+    def set_visibility(self, visibility: int):
+        self.bus.set_visibility(self, visibility)
+
+
+class MetricsBus:
+    """
+    A subscription hub shared by every live view.
+
+    Each topic is backed by exactly one Sampler, so a topic is sampled once per
+    tick no matter how many views are subscribed. A topic's sampler runs only
+    while it has at least one subscriber.
+
+    Callbacks are invoked on the sampler thread; Tk widgets must hop back to
+    the main thread (e.g. with `after(0, ...)`) before touching the UI.
+
+    Views report how visible they are, and each sampler is paced for the
+    most visible of its subscribers. Hidden subscribers get no callbacks and
+    are handed the latest sample when they are shown again.
+
+    System samples are also recorded in `history` for sparklines and trends,
+    appended to the on-disk `log` so they survive a restart, and checked
+    against the user's `alerts` rules. The history's long-term tiers are
+    refilled from the log's rollups before the first sample goes in.
+    """
+
+    def __init__(self):
+        self.history = MetricHistory()
+        self.log = MetricsLog()
+        self.alerts = RuleEngine()
+        self._lock = threading.Lock()
+        self._samplers: Dict[str, Sampler] = {}
+        self._subscriptions: Dict[str, List[Subscription]] = {}
+        self._history_loaded = False
+
+    def record_history(self, sample: RawMetrics):
+        """Adds a system sample to `history`; called on the sampler thread."""
+        if not self._history_loaded:
+            self._history_loaded = True
+            self._load_history(sample["timestamp"])
+        self.history.add(sample)
+
+    def _load_history(self, now: float):
+        # Rollups of the minute in progress are not written yet
+        end = now - now % ROLLUP_SECONDS
+        try:
+            reader = MetricsLogReader(ROLLUP, self.log.directory)
+            samples = reader.query(end - self.history.span(), end)
+            self.history.backfill(samples, ROLLUP_SECONDS)
+        except (OSError, ValueError) as e:
+            print(f"Could not load the metrics history: {e}")
+
+    def add_topic(self, topic: str, sampler: Sampler):
+        """Registers the sampler that feeds `topic`."""
+        with self._lock:
+            self._samplers[topic] = sampler
+            self._subscriptions.setdefault(topic, [])
+        sampler.listeners.append(lambda sample: self._publish(topic, sample))
+
+    def subscribe(self, topic: str, callback: Callable[[Any], None]) -> Subscription:
+        """Attaches `callback` to `topic`, starting its sampler if needed."""
+        subscription = Subscription(self, topic, callback)
+        with self._lock:
+            sampler = self._samplers[topic]
+            self._subscriptions[topic].append(subscription)
+            sampler.set_visibility(VISIBLE)
+            sampler.start()
+        # Hand new views the last known value straight away
+        latest = sampler.latest()
+        if latest is not None:
+            self._deliver(subscription, latest)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Detaches a subscription; the sampler stops with the last one."""
+        with self._lock:
+            subscriptions = self._subscriptions[subscription.topic]
+            if subscription in subscriptions:
+                subscriptions.remove(subscription)
+            sampler = self._samplers[subscription.topic]
+            if not subscriptions:
+                sampler.stop()
+            else:
+                sampler.set_visibility(max(sub.visibility for sub in subscriptions))
+
+    def set_visibility(self, subscription: Subscription, visibility: int):
+        """Records how visible a subscriber is and re-paces its sampler."""
+        with self._lock:
+            was_hidden = subscription.visibility == HIDDEN
+            subscription.visibility = visibility
+            subscriptions = self._subscriptions[subscription.topic]
+            sampler = self._samplers[subscription.topic]
+            sampler.set_visibility(
+                max((sub.visibility for sub in subscriptions), default=HIDDEN)
+            )
+        latest = sampler.latest()
+        if was_hidden and visibility != HIDDEN and latest is not None:
+            self._deliver(subscription, latest)
+
+    def close(self):
+        """Stops every sampler and closes the on-disk log."""
+        with self._lock:
+            for sampler in self._samplers.values():
+                sampler.stop()
+        self.log.close()
+
+    def subscriber_count(self, topic: str) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(topic, []))
+
+    def latest(self, topic: str):
+        """Returns the latest sample published on `topic`, or None."""
+        return self._samplers[topic].latest()
+
+    def _publish(self, topic: str, sample):
+        with self._lock:
+            subscriptions = [
+                sub for sub in self._subscriptions[topic] if sub.visibility != HIDDEN
+            ]
+        for subscription in subscriptions:
+            self._deliver(subscription, sample)
+
+    def _deliver(self, subscription: Subscription, sample):
+        try:
+            subscription.callback(sample)
+        except Exception as e:
+            print(f"Error delivering {subscription.topic} update: {e}")
+
+
+_default_bus: Optional[MetricsBus] = None
+
+
+def _notify_alert(rule, event):
+    if event == FIRED:
+        send_desktop_notification(f"Toolkit: {rule.name}", rule.message)
+
+
+def shutdown():
+    """Closes the application-wide bus, if it was ever created."""
+    if _default_bus is not None:
+        _default_bus.close()
+
+
+def get_bus() -> MetricsBus:
+    """Returns the application-wide bus with the standard topics registered."""
+    global _default_bus
+    if _default_bus is None:
+        _default_bus = MetricsBus()
+        if sampler_process.is_enabled():
+            # Collect in a child process so parsing never holds the UI's GIL
+            worker = sampler_process.SamplerProcess()
+            collect_system, collect_processes = (
+                worker.collect_system,
+                worker.collect_processes,
+            )
+        else:
+            collect_system, collect_processes = None, ProcessCollector().collect
+        system_sampler = MetricsSampler(interval=1.0, collect=collect_system)
+        system_sampler.listeners.append(_default_bus.record_history)
+        system_sampler.listeners.append(_default_bus.log.append)
+        system_sampler.listeners.append(_default_bus.alerts.feed)
+        _default_bus.alerts.listeners.append(_notify_alert)
+        _default_bus.add_topic(SYSTEM, system_sampler)
+        _default_bus.add_topic(
+            # The process list is only worth sampling while someone can see it
+            PROCESSES,
+            Sampler(collect_processes, 1.5, "ProcessSampler", idle_interval=None),
+        )
+    return _default_bus
@@ -0,0 +1,265 @@
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from platformdirs import user_data_dir
+
+from logic.stats import RawMetrics
+
+APP_NAME = "Toolkit"
+APP_AUTHOR = "Toolkit"
+
+# One fixed-size, little-endian record per sample (64 bytes). The field order
+# matches RECORD_FIELDS; a missing CPU temperature is stored as NaN.
+RECORD = struct.Struct("<dffffQQQdd")
+RECORD_FIELDS = (
+    "timestamp",
+    "cpu_percent",
+    "cpu_temp",
+    "ram_percent",
+    "disk_percent",
+    "ram_used",
+    "disk_used",
+    "disk_free",
+    "net_recv_rate",
+    "net_sent_rate",
+)
+
+RAW = "raw"  # every sample, one segment per day
+ROLLUP = "rollup-1m"  # one-minute averages, one segment per day
+ROLLUP_SECONDS = 60
+
+# How many daily segments of each kind are kept on disk
+RETENTION_DAYS = {RAW: 2, ROLLUP: 30}
+
+
+def get_data_directory() -> Path:
+    """Returns the platform-specific data folder for Toolkit's own files."""
+    return Path(user_data_dir(appname=APP_NAME, appauthor=APP_AUTHOR, ensure_exists=True))
+
+
+def get_metrics_directory() -> Path:
+    """Returns the folder in the user data dir that holds the metric segments."""
+    metrics_dir = get_data_directory() / "metrics"
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    return metrics_dir
+
+
+def segment_day(timestamp: float) -> str:
+    return time.strftime("%Y%m%d", time.gmtime(timestamp))
+
+
+def pack_sample(sample: RawMetrics) -> bytes:
+    cpu_temp = sample["cpu_temp"]
+    return RECORD.pack(
+        sample["timestamp"],
+        sample["cpu_percent"],
+        math.nan if cpu_temp is None else cpu_temp,
+        sample["ram_percent"],
+        sample["disk_percent"],
+        sample["ram_used"],
+        sample["disk_used"],
+        sample["disk_free"],
+        sample["net_recv_rate"],
+        sample["net_sent_rate"],
+    )
+
+
+def unpack_sample(record: Tuple) -> RawMetrics:
+    values = dict(zip(RECORD_FIELDS, record))
+    if math.isnan(values["cpu_temp"]):
+        values["cpu_temp"] = None
+    return values
+
+
+class MetricsLog:
+    """
+    Append-only binary log of system metric samples.
+
+    Raw samples go to a daily `raw-YYYYMMDD.bin` segment, and one-minute
+    averages are rolled up into `rollup-1m-YYYYMMDD.bin`. Old segments are
+    deleted once they are past their retention.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory else None
+        self.enabled = True
+        self._files = {}  # kind -> (day, open file)
+        # append() runs on the sampler thread, close() on the main thread
+        self._lock = threading.Lock()
+
+        # Running sums for the minute currently being rolled up
+        self._minute = None
+        self._sums = [0.0] * len(RECORD_FIELDS)
+        self._counts = [0] * len(RECORD_FIELDS)
+
+    def append(self, sample: RawMetrics):
+        """Writes one sample (and, at minute boundaries, one rollup record)."""
+        with self._lock:
+            if not self.enabled:
+                return
+            try:
+                self._write(RAW, sample["timestamp"], pack_sample(sample))
+                self._roll_up(sample)
+            except OSError as e:
+                # The app keeps working without a log (read-only or full disk)
+                print(f"Metrics log disabled: {e}")
+                self.enabled = False
+                self._close_files()
+
+    def close(self):
+        """
+        Writes the rollup of the minute in progress, so a restart does not
+        lose it, and closes the segments. Later samples are not logged.
+        """
+        with self._lock:
+            if self.enabled:
+                self.enabled = False
+                try:
+                    self._flush_rollup()
+                except OSError as e:
+                    print(f"Could not write the last metrics rollup: {e}")
+            self._close_files()
+
+    def _close_files(self):
+        for _, file in self._files.values():
+            file.close()
+        self._files = {}
+
+    def _roll_up(self, sample: RawMetrics):
+        minute = int(sample["timestamp"] // ROLLUP_SECONDS)
+        if self._minute is not None and minute != self._minute:
+            self._flush_rollup()
+        self._minute = minute
+        record = RECORD.unpack(pack_sample(sample))
+        for i, value in enumerate(record):
+            # NaN marks a missing value (CPU temperature) and is left out
+            if not math.isnan(value):
+                self._sums[i] += value
+                self._counts[i] += 1
+
+    def _flush_rollup(self):
+        if not any(self._counts):
+            return
+        averages = [
+            total / count if count else math.nan
+            for total, count in zip(self._sums, self._counts)
+        ]
+        averages[0] = self._minute * ROLLUP_SECONDS
+        # The byte counters are stored as integers
+        for i in (5, 6, 7):
+            averages[i] = int(averages[i])
+        self._write(ROLLUP, averages[0], RECORD.pack(*averages))
+        self._sums = [0.0] * len(RECORD_FIELDS)
+        self._counts = [0] * len(RECORD_FIELDS)
+
+    def _write(self, kind: str, timestamp: float, record: bytes):
+        day = segment_day(timestamp)
+        current = self._files.get(kind)
+        if current is None or current[0] != day:
+            if current is not None:
+                current[1].close()
+            self._files[kind] = (day, self._open_segment(kind, day))
+            prune_segments(self._get_directory(), kind)
+        file = self._files[kind][1]
+        file.write(record)
+        file.flush()
+
+    def _open_segment(self, kind: str, day: str):
+        path = self._get_directory() / f"{kind}-{day}.bin"
+        file = open(path, "ab")
+        # Drop a torn record left behind by a crash so records stay aligned
+        size = file.tell()
+        if size % RECORD.size:
+            file.truncate(size - size % RECORD.size)
+            file.seek(0, os.SEEK_END)
+        return file
+
+    def _get_directory(self) -> Path:
+        if self.directory is None:
+            self.directory = get_metrics_directory()
+        return self.directory
+
+
+def list_segments(directory: Path, kind: str) -> List[Path]:
+    """Returns the segments of one kind, oldest first."""
+    return sorted(directory.glob(f"{kind}-[0-9]*.bin"))
+
+
+def prune_segments(directory: Path, kind: str, keep_days: Optional[int] = None):
+    keep_days = RETENTION_DAYS[kind] if keep_days is None else keep_days
+    for path in list_segments(directory, kind)[:-keep_days]:
+        try:
+            path.unlink()
+        except OSError as e:
+            print(f"Could not remove old metrics segment {path.name}: {e}")
+
+
+class MetricsLogReader:
+    """
+    Memory-mapped reader for the segments written by MetricsLog.
+
+    Records are located by binary search on their timestamps, so queries over
+    a week of rollups only touch the pages they return.
+    """
+
+    def __init__(self, kind: str = ROLLUP, directory: Optional[Path] = None):
+        self.kind = kind
+        self.directory = Path(directory) if directory else get_metrics_directory()
+
+    def query(self, start: float, end: float) -> Iterator[RawMetrics]:
+        """Yields the samples with start <= timestamp < end, oldest first."""
+        for record in self._records(start, end):
+            yield unpack_sample(record)
+
+    def column(self, field: str, start: float, end: float) -> Tuple[array, array]:
+        """Returns (timestamps, values) arrays for one field, ready for plotting."""
+        index = RECORD_FIELDS.index(field)
+        timestamps = array("d")
+        values = array("d")
+        for record in self._records(start, end):
+            timestamps.append(record[0])
+            values.append(record[index])
+        return timestamps, values
+
+    def _records(self, start: float, end: float) -> Iterator[Tuple]:
+        first_day, last_day = segment_day(start), segment_day(end)
+        for path in list_segments(self.directory, self.kind):
+            day = path.stem.rsplit("-", 1)[-1]
+            if first_day <= day <= last_day:
+                yield from self._read_segment(path, start, end)
+
+    def _read_segment(self, path: Path, start: float, end: float) -> Iterator[Tuple]:
+        try:
+            with open(path, "rb") as file:
+                count = os.fstat(file.fileno()).st_size // RECORD.size
+                if not count:
+                    return
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    index = self._first_at_or_after(view, count, start)
+                    while index < count:
+                        record = RECORD.unpack_from(view, index * RECORD.size)
+                        if record[0] >= end:
+                            break
+                        yield record
+                        index += 1
+        except OSError as e:
+            print(f"Could not read metrics segment {path.name}: {e}")
+
+    @staticmethod
+    def _first_at_or_after(view: mmap.mmap, count: int, timestamp: float) -> int:
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            (value,) = struct.unpack_from("<d", view, middle * RECORD.size)
+            if value < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
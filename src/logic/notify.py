@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+
+def send_desktop_notification(title: str, message: str) -> bool:
+    """
+    Shows a desktop notification using the platform's own tooling.
+    """
+    platform = sys.platform
+
+    try:
+        if platform.startswith("darwin"):
+            # Passed as arguments, so no quoting rules of AppleScript apply
+            subprocess.Popen(
+                [
+                    "osascript",
+                    "-e",
+                    "on run argv",
+                    "-e",
+                    "display notification (item 1 of argv) "
+                    "with title (item 2 of argv)",
+                    "-e",
+                    "end run",
+                    "--",
+                    message,
+                    title,
+                ]
+            )
+
+        elif platform.startswith("linux"):
+            # Most Linux desktops ship notify-send (libnotify)
+            subprocess.Popen(["notify-send", "--app-name=Toolkit", title, message])
+
+        else:
+            # Windows has no notification command line tool out of the box
+            print(f"[{title}] {message}")
+            return False
+
+        return True
+
+    except FileNotFoundError:
+        # The notification command is not installed
+        print(f"[{title}] {message}")
+        return False
+    except Exception as e:
+        print(f"Could not send notification: {e}")
+        return False
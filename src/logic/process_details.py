@@ -0,0 +1,147 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+import psutil
+
+from logic.processes import ProcessInfo, format_size
+from logic.workers import HIGH, get_pool
+
+# How many entries the list sections show
+MAX_LISTED = 10
+
+
+def _cmdline(proc: psutil.Process) -> str:
+    return " ".join(proc.cmdline()) or "(none)"
+
+
+def _threads(proc: psutil.Process) -> str:
+    threads = proc.threads()
+    busiest = sorted(threads, key=lambda t: t.user_time + t.system_time, reverse=True)
+    lines = [f"{len(threads)} threads"]
+    for thread in busiest[:MAX_LISTED]:
+        cpu_time = thread.user_time + thread.system_time
+        lines.append(f"  TID {thread.id}: {cpu_time:.1f}s CPU")
+    return "\n".join(lines)
+
+
+def _open_files(proc: psutil.Process) -> str:
+    files = proc.open_files()
+    lines = [f"{len(files)} open files"]
+    lines.extend(f"  {file.path}" for file in files[:MAX_LISTED])
+    if len(files) > MAX_LISTED:
+        lines.append(f"  ... and {len(files) - MAX_LISTED} more")
+    return "\n".join(lines)
+
+
+def _memory_maps(proc: psutil.Process) -> str:
+    maps = proc.memory_maps(grouped=True)
+    total_rss = sum(m.rss for m in maps)
+    lines = [f"{len(maps)} mappings, {format_size(total_rss)} resident"]
+    for m in sorted(maps, key=lambda m: m.rss, reverse=True)[:MAX_LISTED]:
+        lines.append(f"  {format_size(m.rss):>10}  {m.path or '[anonymous]'}")
+    return "\n".join(lines)
+
+
+def _environment(proc: psutil.Process) -> str:
+    env = proc.environ()
+    # Each entry is stored as "KEY=value\0"
+    size = sum(len(key) + len(value) + 2 for key, value in env.items())
+    return f"{len(env)} variables, {format_size(size)}"
+
+
+def _children(proc: psutil.Process) -> str:
+    children = proc.children()
+    lines = [f"{len(children)} child processes"]
+    for child in children[:MAX_LISTED]:
+        try:
+            lines.append(f"  {child.name()} ({child.pid})")
+        except psutil.NoSuchProcess:
+            continue
+    return "\n".join(lines)
+
+
+# Section title -> function producing its text from a psutil.Process
+SECTIONS: Dict[str, Callable[[psutil.Process], str]] = {
+    "Command line": _cmdline,
+    "Threads": _threads,
+    "Open files": _open_files,
+    "Memory maps": _memory_maps,
+    "Environment": _environment,
+    "Children": _children,
+}
+
+
+class DetailsLoader:
+    """
+    Fetches the SECTIONS of one process on the shared worker pool.
+
+    Sections run at HIGH priority, ahead of background refreshes, since the
+    user just asked for them; the process table's refresh never pays for
+    these calls. Results for a process that is no longer selected are dropped.
+    """
+
+    def __init__(self):
+        self._futures: List[Future] = []
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def close(self):
+        with self._lock:
+            self._generation += 1
+            # Sections still queued are dropped; running ones finish unseen
+            for future in self._futures:
+                future.cancel()
+            self._futures = []
+
+    def load(
+        self,
+        info: ProcessInfo,
+        on_section: Callable[[str, str], None],
+        sections: Optional[List[str]] = None,
+    ):
+        """
+        Fetches `sections` (all by default) of the process described by `info`.
+
+        `on_section(title, text)` is called from a worker thread once per
+        section, unless another load() or close() happened meanwhile.
+        """
+        self.close()
+        with self._lock:
+            generation = self._generation
+            self._futures = [
+                get_pool().submit(
+                    self._load_section,
+                    info,
+                    title,
+                    generation,
+                    on_section,
+                    priority=HIGH,
+                )
+                for title in sections or list(SECTIONS)
+            ]
+
+    def _load_section(
+        self, info: ProcessInfo, title: str, generation: int, on_section
+    ):
+        if generation != self._generation:
+            return
+        try:
+            proc = psutil.Process(info["pid"])
+            # The same create time as when the row was sampled, else the PID
+            # was reused by another process
+            if abs(proc.create_time() - info["create_time"]) > 1.0:
+                raise psutil.NoSuchProcess(info["pid"])
+            text = SECTIONS[title](proc)
+        except psutil.NoSuchProcess:
+            text = "The process has exited."
+        except psutil.AccessDenied:
+            text = "Access denied."
+        except Exception as e:
+            text = f"Error: {e}"
+        with self._lock:
+            current = generation == self._generation
+        # Outside the lock: on_section calls into Tk, which waits for the main
+        # thread, and the main thread may be waiting for the lock in load()
+        if current:
+            on_section(title, text)
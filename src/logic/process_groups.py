@@ -0,0 +1,210 @@
+import heapq
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from logic.processes import SORT_KEYS, ProcessDiff, ProcessInfo, ProcessSample
+
+# ProcessInfo values that are added up per application and per subtree
+TOTAL_FIELDS = (
+    "cpu",
+    "mem",
+    "rss",
+    "threads",
+    "io",
+    "io_read",
+    "io_write",
+    "connections",
+)
+
+
+def _rounded(values: Dict) -> Dict:
+    # Adding and subtracting per-tick deltas leaves float noise (e.g. -0.0000001)
+    row = dict(values)
+    for field in ("cpu", "mem", "io", "io_read", "io_write"):
+        row[field] = max(round(row[field], 1), 0.0)
+    return row
+
+
+class TreeNode:
+    """One process in the tree, with the totals of its whole subtree."""
+
+    __slots__ = ("pid", "ppid", "name", "total", "parent", "children")
+
+    def __init__(self, info: ProcessInfo):
+        self.pid = info["pid"]
+        self.ppid = info["ppid"]
+        self.name = info["name"]
+        # The values of this process plus all of its descendants
+        self.total = {field: info[field] for field in TOTAL_FIELDS}
+        self.parent: Optional[int] = None
+        self.children: Set[int] = set()
+
+
+class ProcessGroups:
+    """
+    Per-application totals and a process tree, kept up to date from the
+    ProcessDiff of every tick.
+
+    Adding, removing or changing a process only touches its application and
+    its ancestors in the tree, so a tick costs O(changes x tree depth) instead
+    of a walk over every process. If a sample was missed (see
+    ProcessSample["tick"]), everything is rebuilt from its snapshot.
+    """
+
+    def __init__(self):
+        self.tick: Optional[int] = None
+        # Process name -> {"name", "count", *TOTAL_FIELDS}
+        self.apps: Dict[str, Dict] = {}
+        self.nodes: Dict[int, TreeNode] = {}
+        self.roots: Set[int] = set()
+        # Parent PID not seen yet -> children waiting to be attached to it.
+        # Only kept within one rebuild() or apply(): a parent missing by then
+        # has exited, and a later process with its PID is unrelated.
+        self._orphans: Dict[int, Set[int]] = {}
+
+    def update(self, sample: ProcessSample):
+        if self.tick is not None and sample["tick"] == self.tick + 1:
+            self.apply(sample["diff"])
+        else:
+            self.rebuild(sample["processes"])
+        self.tick = sample["tick"]
+
+    def rebuild(self, processes: Dict[int, ProcessInfo]):
+        self.apps.clear()
+        self.nodes.clear()
+        self.roots.clear()
+        self._orphans.clear()
+        for info in processes.values():
+            self._add(info)
+        self._orphans.clear()
+
+    def apply(self, diff: ProcessDiff):
+        # Removals first: a reused PID shows up as removed plus added
+        for info in diff["removed"]:
+            self._remove(info)
+        for info in diff["added"]:
+            self._add(info)
+        for previous, current in diff["changed"]:
+            self._change(previous, current)
+        self._orphans.clear()
+
+    # --- Per-application totals ---
+
+    def _add_to_app(self, info: ProcessInfo, sign: int):
+        app = self.apps.get(info["name"])
+        if app is None:
+            app = self.apps[info["name"]] = {"name": info["name"], "count": 0}
+            app.update(dict.fromkeys(TOTAL_FIELDS, 0))
+        app["count"] += sign
+        if not app["count"]:
+            del self.apps[info["name"]]
+            return
+        for field in TOTAL_FIELDS:
+            app[field] += sign * info[field]
+
+    # --- Process tree ---
+
+    def _add_up(self, pid: Optional[int], values: Dict, sign: int):
+        """Adds `values` to the subtree totals of `pid` and all its ancestors."""
+        while pid is not None:
+            node = self.nodes[pid]
+            for field in TOTAL_FIELDS:
+                node.total[field] += sign * values[field]
+            pid = node.parent
+
+    def _add(self, info: ProcessInfo):
+        self._add_to_app(info, 1)
+        node = self.nodes[info["pid"]] = TreeNode(info)
+
+        # Children that were seen before this process
+        for child_pid in self._orphans.pop(node.pid, ()):
+            child = self.nodes[child_pid]
+            child.parent = node.pid
+            node.children.add(child_pid)
+            self.roots.discard(child_pid)
+            for field in TOTAL_FIELDS:
+                node.total[field] += child.total[field]
+
+        # PID 0 is its own parent on some systems
+        if node.ppid in self.nodes and node.ppid != node.pid:
+            node.parent = node.ppid
+            self.nodes[node.ppid].children.add(node.pid)
+            self._add_up(node.ppid, node.total, 1)
+        else:
+            self.roots.add(node.pid)
+            if node.ppid and node.ppid != node.pid:
+                self._orphans.setdefault(node.ppid, set()).add(node.pid)
+
+    def _remove(self, info: ProcessInfo):
+        self._add_to_app(info, -1)
+        node = self.nodes.pop(info["pid"])
+        if node.parent is not None:
+            self.nodes[node.parent].children.discard(node.pid)
+            self._add_up(node.parent, node.total, -1)
+        else:
+            self.roots.discard(node.pid)
+
+        # The kernel re-parents the children; show them as roots until they exit.
+        # They are not queued as orphans, since a new process could reuse the PID.
+        for child_pid in node.children:
+            self.nodes[child_pid].parent = None
+            self.roots.add(child_pid)
+
+    def _change(self, previous: ProcessInfo, current: ProcessInfo):
+        self._add_to_app(previous, -1)
+        self._add_to_app(current, 1)
+        delta = {field: current[field] - previous[field] for field in TOTAL_FIELDS}
+        self._add_up(current["pid"], delta, 1)
+
+    # --- Queries ---
+
+    def top_apps(
+        self, count: int, sort_by: str = "CPU", only: Optional[Set[str]] = None
+    ) -> List[Dict]:
+        """
+        Returns the first `count` applications ranked by one of SORT_KEYS,
+        optionally only those named in `only`.
+
+        Applications have no PID, so "PID" ranks them by process count.
+        """
+        key, descending = SORT_KEYS[sort_by]
+        if key == "pid":
+            key, descending = "count", True
+        select = heapq.nlargest if descending else heapq.nsmallest
+        apps = self.apps.values()
+        if only is not None:
+            apps = (app for app in apps if app["name"] in only)
+        return [_rounded(app) for app in select(count, apps, key=lambda app: app[key])]
+
+    def tree_rows(
+        self, count: int, sort_by: str = "CPU", only: Optional[Set[int]] = None
+    ) -> List[Tuple[int, Dict]]:
+        """
+        Returns up to `count` (depth, row) pairs of the tree in display order,
+        optionally only for the PIDs in `only`.
+
+        Siblings are ranked by their subtree totals, and each row carries the
+        totals of the process and all of its descendants.
+        """
+        key, descending = SORT_KEYS[sort_by]
+        select = heapq.nlargest if descending else heapq.nsmallest
+        # When filtering, rows skipped further down can't take up the count
+        limit = count if only is None else len(self.nodes)
+
+        def rank(node: TreeNode):
+            return node.pid if key == "pid" else node.total[key]
+
+        def walk(pids: Set[int], depth: int) -> Iterator[Tuple[int, TreeNode]]:
+            nodes = (self.nodes[pid] for pid in pids)
+            for node in select(limit, nodes, key=rank):
+                yield depth, node
+                yield from walk(node.children, depth + 1)
+
+        rows = []
+        for depth, node in walk(self.roots, 0):
+            if len(rows) == count:
+                break
+            if only is not None and node.pid not in only:
+                continue
+            row = {"pid": node.pid, "name": node.name, **node.total}
+            rows.append((depth, _rounded(row)))
+        return rows
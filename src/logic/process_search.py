@@ -0,0 +1,107 @@
+from typing import Dict, Iterable, Optional, Set
+
+from logic.processes import ProcessDiff, ProcessInfo, ProcessSample
+
+# Only the start of very long command lines (e.g. Java classpaths) is searchable
+MAX_TEXT = 512
+
+
+def _searchable_text(info: ProcessInfo) -> str:
+    text = f"{info['name']}\0{info['pid']}\0{info['user']}\0{info['cmdline']}"
+    return text[:MAX_TEXT].lower()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class ProcessIndex:
+    """
+    Substring search over process name, PID, user and command line.
+
+    The text of every process is indexed by its trigrams when the process is
+    added, and dropped when it is removed, following each tick's ProcessDiff.
+    A query only checks the processes that contain all of its trigrams, and
+    the matches of the current query are kept up to date from the diffs too.
+    Queries shorter than 3 characters narrow down the previous results while
+    the user is typing, or check every process otherwise.
+    """
+
+    def __init__(self):
+        self.tick: Optional[int] = None
+        self._texts: Dict[int, str] = {}
+        self._index: Dict[str, Set[int]] = {}
+        # The last query and the PIDs matching it
+        self._query = ""
+        self._matches: Set[int] = set()
+
+    def update(self, sample: ProcessSample):
+        if self.tick is not None and sample["tick"] == self.tick + 1:
+            self.apply(sample["diff"])
+        else:
+            self.rebuild(sample["processes"].values())
+        self.tick = sample["tick"]
+
+    def rebuild(self, processes: Iterable[ProcessInfo]):
+        self._texts.clear()
+        self._index.clear()
+        self._matches.clear()
+        for info in processes:
+            self._add(info)
+
+    def apply(self, diff: ProcessDiff):
+        # Only static fields are indexed, so changed processes are skipped
+        for info in diff["removed"]:
+            self._remove(info["pid"])
+        for info in diff["added"]:
+            self._add(info)
+
+    def _add(self, info: ProcessInfo):
+        pid = info["pid"]
+        text = self._texts[pid] = _searchable_text(info)
+        for trigram in _trigrams(text):
+            self._index.setdefault(trigram, set()).add(pid)
+        if self._query and self._query in text:
+            self._matches.add(pid)
+
+    def _remove(self, pid: int):
+        text = self._texts.pop(pid, None)
+        if text is None:
+            return
+        for trigram in _trigrams(text):
+            pids = self._index[trigram]
+            pids.discard(pid)
+            if not pids:
+                del self._index[trigram]
+        self._matches.discard(pid)
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        """Returns the PIDs matching `query`, or None when there is no filter."""
+        query = query.strip().lower()
+        if not query:
+            self._query = ""
+            self._matches = set()
+            return None
+        if query == self._query:
+            return self._matches
+
+        if len(query) >= 3:
+            # Intersect from the rarest trigram up, so the sets only shrink
+            candidates = None
+            for pids in sorted(
+                (self._index.get(trigram, set()) for trigram in _trigrams(query)),
+                key=len,
+            ):
+                candidates = set(pids) if candidates is None else candidates & pids
+                if not candidates:
+                    break
+        elif self._query and self._query in query:
+            # Typing on: the new matches are a subset of the old ones
+            candidates = self._matches
+        else:
+            candidates = self._texts.keys()
+
+        texts = self._texts
+        self._query = query
+        self._matches = {pid for pid in candidates if query in texts[pid]}
+        return self._matches
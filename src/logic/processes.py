@@ -0,0 +1,309 @@
+import heapq
+import os
+import sys
+import time
+import psutil
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple, TypedDict
+
+# "procfs" or "psutil"; by default procfs is used wherever /proc is available
+BACKEND_ENV = "TOOLKIT_PROCESS_BACKEND"
+
+
+class ProcessInfo(TypedDict):
+    pid: int
+    ppid: int  # parent PID as of when the process was first seen
+    name: str
+    user: str  # owner's user name, "" when it cannot be read
+    cmdline: str  # arguments joined by spaces, "" when it cannot be read
+    create_time: float
+    cpu: float  # percent, rounded to one decimal
+    mem: float  # percent, rounded to one decimal
+    rss: int  # resident memory in bytes
+    threads: int
+    io: float  # disk read + write, bytes per second
+    io_read: float  # bytes per second
+    io_write: float  # bytes per second
+    connections: int  # open internet sockets
+
+
+# Values that are too costly to read on every refresh; they are re-read
+# every SLOW_REFRESH_TICKS refreshes and cached in between
+SLOW_FIELDS = ("io", "io_read", "io_write", "connections")
+SLOW_REFRESH_TICKS = 4
+
+# Values that can change between refreshes; a change in any of them makes
+# the process show up in ProcessDiff["changed"]
+DYNAMIC_FIELDS = ("cpu", "mem", "rss", "threads") + SLOW_FIELDS
+
+# Columns the process list can be ranked by: label -> (ProcessInfo key, descending)
+SORT_KEYS = {
+    "CPU": ("cpu", True),
+    "RAM": ("mem", True),
+    "RSS": ("rss", True),
+    "I/O": ("io", True),
+    "Threads": ("threads", True),
+    "Conns": ("connections", True),
+    "PID": ("pid", False),
+}
+
+
+class ProcessDiff(TypedDict):
+    added: List[ProcessInfo]
+    removed: List[ProcessInfo]
+    # (previous, current) pairs for processes whose values changed
+    changed: List[Tuple[ProcessInfo, ProcessInfo]]
+
+
+class ProcessSample(TypedDict):
+    # Snapshot of every cached process, keyed by PID
+    processes: Dict[int, ProcessInfo]
+    diff: ProcessDiff
+    # Counts up by one per refresh, so consumers can tell if they missed a diff
+    tick: int
+
+
+def _read_or_empty(read: Callable[[], str]) -> str:
+    try:
+        return read() or ""
+    except (psutil.AccessDenied, psutil.ZombieProcess):
+        return ""
+
+
+def values_changed(previous: ProcessInfo, values: Dict) -> bool:
+    for field in DYNAMIC_FIELDS:
+        if values[field] != previous[field]:
+            return True
+    return False
+
+
+def count_connections() -> Dict[int, int]:
+    """Open internet sockets per PID, from one system-wide scan."""
+    try:
+        connections = psutil.net_connections(kind="inet")
+    except psutil.AccessDenied:
+        # macOS only lists other processes' sockets to root
+        return {}
+    counts: Dict[int, int] = {}
+    for connection in connections:
+        if connection.pid:
+            counts[connection.pid] = counts.get(connection.pid, 0) + 1
+    return counts
+
+
+class SlowFields:
+    """
+    The SLOW_FIELDS of every process, shared by both process caches.
+
+    Every SLOW_REFRESH_TICKS refreshes, disk I/O counters are read per process
+    and connections are counted in one system-wide scan. In between, the
+    values from the last pass are carried over, so they don't add to the cost
+    of every refresh.
+    """
+
+    def __init__(self):
+        self.due = False
+        self._refreshes = 0
+        self._last_pass = None
+        self._elapsed = None
+        # pid -> (read bytes, written bytes) at the last pass
+        self._io_bytes: Dict[int, Tuple[int, int]] = {}
+        self._connections: Dict[int, int] = {}
+
+    def start_refresh(self, now: float):
+        self.due = self._refreshes % SLOW_REFRESH_TICKS == 0
+        self._refreshes += 1
+        if self.due:
+            last, self._last_pass = self._last_pass, now
+            self._elapsed = None if last is None else now - last
+            self._connections = count_connections()
+
+    def values(
+        self,
+        pid: int,
+        previous: Optional[ProcessInfo],
+        read_io: Callable[[], Optional[Tuple[int, int]]],
+    ) -> Dict:
+        """Returns the slow values for `pid`, calling `read_io` only on a pass."""
+        if not self.due:
+            if previous is None:
+                return {"io": 0.0, "io_read": 0.0, "io_write": 0.0, "connections": 0}
+            return {field: previous[field] for field in SLOW_FIELDS}
+
+        read = write = 0.0
+        io_bytes = read_io()
+        if io_bytes is not None:
+            last = self._io_bytes.get(pid)
+            if last is not None and self._elapsed:
+                read = round(max(io_bytes[0] - last[0], 0) / self._elapsed, 1)
+                write = round(max(io_bytes[1] - last[1], 0) / self._elapsed, 1)
+            self._io_bytes[pid] = io_bytes
+        return {
+            "io": round(read + write, 1),
+            "io_read": read,
+            "io_write": write,
+            "connections": self._connections.get(pid, 0),
+        }
+
+    def forget(self, pid: int):
+        self._io_bytes.pop(pid, None)
+
+
+def _psutil_io_bytes(proc: psutil.Process) -> Optional[Tuple[int, int]]:
+    try:
+        counters = proc.io_counters()
+    except (psutil.AccessDenied, AttributeError):
+        # Other users' processes, or no per-process I/O on this platform
+        return None
+    return counters.read_bytes, counters.write_bytes
+
+
+class ProcessCache:
+    """
+    A PID-keyed table of running processes that survives between ticks.
+
+    refresh() updates the table in place and returns what was added, removed
+    or changed since the previous refresh. A PID that was reused by a new
+    process (different create_time) is reported as removed plus added.
+
+    Entries are replaced, never mutated, so a snapshot taken with
+    `dict(cache.entries)` stays valid after later refreshes.
+    """
+
+    def __init__(self):
+        self.entries: Dict[int, ProcessInfo] = {}
+        self._procs: Dict[int, psutil.Process] = {}
+        self.slow = SlowFields()
+        self._total_memory = 1
+
+    def _read_values(
+        self, proc: psutil.Process, previous: Optional[ProcessInfo]
+    ) -> Dict:
+        """Reads the per-tick values of one process (inside oneshot())."""
+        rss = proc.memory_info().rss
+        return {
+            # Delta since the last refresh (non-blocking); the first call
+            # for a process only primes it
+            "cpu": round(proc.cpu_percent(interval=None), 1),
+            # Same as memory_percent(), without re-reading the total per process
+            "mem": round(100.0 * rss / self._total_memory, 1),
+            "rss": rss,
+            "threads": proc.num_threads(),
+            **self.slow.values(proc.pid, previous, lambda: _psutil_io_bytes(proc)),
+        }
+
+    def refresh(self) -> ProcessDiff:
+        diff: ProcessDiff = {"added": [], "removed": [], "changed": []}
+        self.slow.start_refresh(time.monotonic())
+        self._total_memory = psutil.virtual_memory().total
+        seen = set()
+
+        for pid in psutil.pids():
+            try:
+                proc = self._procs.get(pid)
+                if proc is not None and not proc.is_running():
+                    # Same PID, different process: drop the stale entry
+                    diff["removed"].append(self.entries.pop(pid))
+                    del self._procs[pid]
+                    self.slow.forget(pid)
+                    proc = None
+
+                if proc is None:
+                    proc = psutil.Process(pid)
+                    with proc.oneshot():
+                        entry: ProcessInfo = {
+                            "pid": pid,
+                            "ppid": proc.ppid(),
+                            "name": proc.name(),
+                            "user": _read_or_empty(proc.username),
+                            "cmdline": _read_or_empty(
+                                lambda: " ".join(proc.cmdline())
+                            ),
+                            "create_time": proc.create_time(),
+                            **self._read_values(proc, None),
+                        }
+                    self._procs[pid] = proc
+                    self.entries[pid] = entry
+                    diff["added"].append(entry)
+                else:
+                    previous = self.entries[pid]
+                    with proc.oneshot():
+                        values = self._read_values(proc, previous)
+                    if values_changed(previous, values):
+                        entry = {**previous, **values}
+                        self.entries[pid] = entry
+                        diff["changed"].append((previous, entry))
+                seen.add(pid)
+
+            except psutil.AccessDenied:
+                # Keep what we already know rather than flapping the row
+                if pid in self.entries:
+                    seen.add(pid)
+            except psutil.NoSuchProcess:
+                # The process exited while we were reading it
+                continue
+
+        for pid in [pid for pid in self.entries if pid not in seen]:
+            diff["removed"].append(self.entries.pop(pid))
+            self._procs.pop(pid, None)
+            self.slow.forget(pid)
+
+        return diff
+
+
+def format_size(num_bytes: float) -> str:
+    """Formats a byte count with a binary unit, e.g. 1536 -> "1.5 KB"."""
+    if num_bytes < 1024:
+        return f"{num_bytes:.0f} B"
+    for unit in ("KB", "MB", "GB"):
+        num_bytes /= 1024
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+    num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+
+def is_active(process: ProcessInfo) -> bool:
+    """False for processes with no activity at all (e.g. kernel threads)."""
+    return process["cpu"] > 0.0 or process["mem"] > 0.0
+
+
+def top_processes(
+    processes: Dict[int, ProcessInfo], count: int, sort_by: str = "CPU"
+) -> List[ProcessInfo]:
+    """
+    Returns the first `count` processes ranked by one of SORT_KEYS.
+
+    Uses heapq, so ranking costs O(n log count) rather than a full sort.
+    """
+    key, descending = SORT_KEYS[sort_by]
+    select = heapq.nlargest if descending else heapq.nsmallest
+    return select(count, filter(is_active, processes.values()), key=itemgetter(key))
+
+
+def make_process_cache(backend: Optional[str] = None):
+    """
+    Returns the fastest process cache for this platform: the /proc reader on
+    Linux, psutil everywhere else. `backend` (or the TOOLKIT_PROCESS_BACKEND
+    environment variable) can force "psutil" or "procfs".
+    """
+    backend = backend or os.environ.get(BACKEND_ENV)
+    if backend != "psutil" and sys.platform.startswith("linux"):
+        from logic import procfs
+
+        if procfs.is_available():
+            return procfs.ProcfsProcessCache()
+    return ProcessCache()
+
+
+class ProcessCollector:
+    """Collect function for the process sampler: refreshes a process cache."""
+
+    def __init__(self, backend: Optional[str] = None):
+        self.cache = make_process_cache(backend)
+        self.tick = 0
+
+    def collect(self) -> ProcessSample:
+        diff = self.cache.refresh()
+        self.tick += 1
+        return {"processes": dict(self.cache.entries), "diff": diff, "tick": self.tick}
@@ -0,0 +1,209 @@
+import os
+import pwd
+import time
+from typing import Dict, Optional, Tuple
+
+from logic.processes import ProcessDiff, ProcessInfo, SlowFields, values_changed
+
+PROC_ROOT = "/proc"
+
+
+def _read(path: str) -> bytes:
+    # os.open/os.read skip the buffered file object machinery, which adds up
+    # over thousands of tiny /proc files per tick
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096)
+    finally:
+        os.close(fd)
+
+
+def _read_all(path: str) -> bytes:
+    # Command lines can be longer than one read
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def _read_io_bytes(path: str) -> Optional[Tuple[int, int]]:
+    """Returns (read_bytes, write_bytes) from /proc/[pid]/io, or None if unreadable."""
+    try:
+        data = _read(path)
+    except OSError:
+        # Usually another user's process
+        return None
+    read = write = 0
+    for line in data.splitlines():
+        if line.startswith(b"read_bytes:"):
+            read = int(line.split()[1])
+        elif line.startswith(b"write_bytes:"):
+            write = int(line.split()[1])
+    return read, write
+
+
+def is_available(proc_root: str = PROC_ROOT) -> bool:
+    return os.path.exists(os.path.join(proc_root, "self", "stat"))
+
+
+class ProcfsProcessCache:
+    """
+    Linux fast path for ProcessCache that reads /proc directly.
+
+    Each refresh reads only /proc/[pid]/stat and statm per process (plus io
+    when SlowFields has a pass due) and computes CPU% from jiffies deltas,
+    instead of going through psutil's per-process objects. PID reuse is
+    detected from the start time in stat. It has the same interface and diff
+    semantics as ProcessCache.
+    """
+
+    def __init__(self, proc_root: str = PROC_ROOT):
+        self.proc_root = proc_root
+        self.entries: Dict[int, ProcessInfo] = {}
+        # pid -> (start time in jiffies, utime + stime in jiffies)
+        self._ticks: Dict[int, tuple] = {}
+        self.slow = SlowFields()
+        self._last_refresh = None
+        # uid -> user name
+        self._users: Dict[int, str] = {}
+
+        self.clock_ticks = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.boot_time = self._read_boot_time()
+        self.total_memory = self._read_total_memory()
+
+    def _read_boot_time(self) -> float:
+        for line in _read(os.path.join(self.proc_root, "stat")).splitlines():
+            if line.startswith(b"btime"):
+                return float(line.split()[1])
+        return 0.0
+
+    def _read_total_memory(self) -> int:
+        for line in _read(os.path.join(self.proc_root, "meminfo")).splitlines():
+            if line.startswith(b"MemTotal:"):
+                return int(line.split()[1]) * 1024
+        return 1
+
+    def _read_user(self, pid: str) -> str:
+        try:
+            uid = os.stat(f"{self.proc_root}/{pid}").st_uid
+        except OSError:
+            return ""
+        user = self._users.get(uid)
+        if user is None:
+            try:
+                user = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                user = str(uid)
+            self._users[uid] = user
+        return user
+
+    def _read_names(self, pid: str, comm: bytes) -> Tuple[str, str]:
+        """
+        Returns the name and command line of a process.
+
+        The kernel truncates comm to 15 bytes; the name is completed from
+        cmdline like psutil does.
+        """
+        name = comm.decode(errors="replace")
+        try:
+            cmdline = _read_all(f"{self.proc_root}/{pid}/cmdline")
+        except OSError:
+            return name, ""
+        args = cmdline.rstrip(b"\0").split(b"\0")
+        if len(comm) >= 15:
+            exe = os.path.basename(args[0].decode(errors="replace"))
+            if exe.startswith(name):
+                name = exe
+        return name, b" ".join(args).decode(errors="replace")
+
+    def refresh(self) -> ProcessDiff:
+        diff: ProcessDiff = {"added": [], "removed": [], "changed": []}
+        now = time.monotonic()
+        elapsed = None if self._last_refresh is None else now - self._last_refresh
+        self._last_refresh = now
+        self.slow.start_refresh(now)
+
+        # Percent of one CPU per jiffy over the elapsed wall time
+        cpu_scale = 100.0 / (self.clock_ticks * elapsed) if elapsed else 0.0
+        mem_scale = 100.0 * self.page_size / self.total_memory
+
+        proc_root = self.proc_root
+        entries = self.entries
+        seen = set()
+
+        for name in os.listdir(proc_root):
+            if not name.isdigit():
+                continue
+            pid = int(name)
+            try:
+                stat = _read(f"{proc_root}/{name}/stat")
+                statm = _read(f"{proc_root}/{name}/statm")
+            except OSError:
+                # The process exited (or is not readable) mid-scan
+                continue
+
+            # The command name is in parentheses and may itself contain spaces
+            # or parentheses, so split on the last ")"
+            close = stat.rfind(b")")
+            fields = stat[close + 2 :].split()
+            # Field numbers from proc(5), offset by the 2 fields before ")"
+            cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+            threads = int(fields[17])  # num_threads
+            start_ticks = int(fields[19])  # starttime
+            rss_pages = int(statm.split()[1])
+            seen.add(pid)
+
+            previous = entries.get(pid)
+            known = self._ticks.get(pid)
+            if previous is not None and known[0] != start_ticks:
+                # Same PID, different process: drop the stale entry
+                diff["removed"].append(entries.pop(pid))
+                self.slow.forget(pid)
+                previous = None
+
+            values = {
+                "cpu": 0.0,
+                "mem": round(rss_pages * mem_scale, 1),
+                "rss": rss_pages * self.page_size,
+                "threads": threads,
+                **self.slow.values(
+                    pid, previous, lambda: _read_io_bytes(f"{proc_root}/{name}/io")
+                ),
+            }
+
+            if previous is None:
+                comm = stat[stat.find(b"(") + 1 : close]
+                proc_name, cmdline = self._read_names(name, comm)
+                entry: ProcessInfo = {
+                    "pid": pid,
+                    "ppid": int(fields[1]),
+                    "name": proc_name,
+                    "user": self._read_user(name),
+                    "cmdline": cmdline,
+                    "create_time": self.boot_time + start_ticks / self.clock_ticks,
+                    # The first CPU reading only primes the delta
+                    **values,
+                }
+                entries[pid] = entry
+                diff["added"].append(entry)
+            else:
+                values["cpu"] = round((cpu_ticks - known[1]) * cpu_scale, 1)
+                if values_changed(previous, values):
+                    entry = {**previous, **values}
+                    entries[pid] = entry
+                    diff["changed"].append((previous, entry))
+            self._ticks[pid] = (start_ticks, cpu_ticks)
+
+        for pid in [pid for pid in entries if pid not in seen]:
+            diff["removed"].append(entries.pop(pid))
+            del self._ticks[pid]
+            self.slow.forget(pid)
+
+        return diff
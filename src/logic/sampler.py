@@ -0,0 +1,169 @@
+import threading
+from typing import Any, Callable, List, Optional
+
+from logic.stats import MetricsCollector, RawMetrics, SystemMetrics, format_metrics
+
+# How visible the views fed by a sampler are, from least to most
+HIDDEN = 0  # minimized or withdrawn
+OBSCURED = 1  # mapped, but fully covered by other windows
+VISIBLE = 2
+
+# Obscured views are refreshed this many times less often
+OBSCURED_SLOWDOWN = 4
+# After a spike, sample this many times faster for FAST_TICKS ticks
+FAST_SPEEDUP = 4
+FAST_TICKS = 10
+
+
+class Sampler:
+    """
+    Runs a collect function on one long-lived daemon thread.
+
+    Every `interval` seconds the result of `collect()` is stored as the latest
+    sample and handed to each listener. Readers get the latest sample instantly
+    and never sleep or touch psutil themselves.
+
+    The pace adapts to the views being fed (see set_visibility()): obscured
+    views are sampled less often, and hidden ones at `idle_interval`, or not at
+    all when it is None. While visible, a spike (see is_spike()) temporarily
+    speeds sampling up so short bursts still show.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], Any],
+        interval: float,
+        name: str,
+        idle_interval: Optional[float] = None,
+    ):
+        self.collect = collect
+        self.interval = interval
+        self.idle_interval = idle_interval
+        self.name = name
+        self.listeners: List[Callable[[Any], None]] = []
+        self.visibility = VISIBLE
+        self._fast_ticks_left = 0
+        self._latest = None
+        self._stop_event = threading.Event()
+        # Set to cut the current wait short (stop, or the views became visible)
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Starts the sampling thread (does nothing if it is already running)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            # A fresh event per thread, so a thread that is still winding down
+            # after stop() can never be revived by a later start().
+            self._stop_event = threading.Event()
+            self._wake = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop_event, self._wake),
+                name=self.name,
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Asks the sampling thread to exit after its current tick."""
+        with self._lock:
+            self._stop_event.set()
+            self._wake.set()
+            self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_visibility(self, visibility: int):
+        """Adapts the pace to the most visible view fed by this sampler."""
+        previous, self.visibility = self.visibility, visibility
+        if visibility > previous:
+            # Don't make a view that just appeared wait for a slow tick
+            self._wake.set()
+
+    def current_interval(self) -> Optional[float]:
+        """Seconds until the next tick, or None while sampling is paused."""
+        if self.visibility == HIDDEN:
+            return self.idle_interval
+        if self.visibility == OBSCURED:
+            return self.interval * OBSCURED_SLOWDOWN
+        if self._fast_ticks_left:
+            self._fast_ticks_left -= 1
+            return self.interval / FAST_SPEEDUP
+        return self.interval
+
+    def is_spike(self, previous, sample) -> bool:
+        """Whether `sample` changed sharply from `previous`; subclasses decide."""
+        return False
+
+    def sample_now(self):
+        """Takes one sample on the calling thread and publishes it."""
+        sample = self.collect()
+        previous, self._latest = self._latest, sample
+        if previous is not None and self.is_spike(previous, sample):
+            self._fast_ticks_left = FAST_TICKS
+        for listener in list(self.listeners):
+            listener(sample)
+        return sample
+
+    def latest(self):
+        """Returns the most recent sample, or None before the first tick."""
+        return self._latest
+
+    def _run(self, stop_event: threading.Event, wake: threading.Event):
+        while not stop_event.is_set():
+            interval = self.current_interval()
+            if interval is None:
+                # Paused: sleep until a view becomes visible again
+                wake.wait()
+                wake.clear()
+                continue
+            try:
+                self.sample_now()
+            except Exception as e:
+                print(f"Error in {self.name}: {e}")
+            wake.wait(interval)
+            wake.clear()
+
+
+class MetricsSampler(Sampler):
+    """Samples system-wide CPU, RAM, disk and network metrics."""
+
+    # A jump of this many percentage points in CPU or RAM counts as a spike
+    SPIKE_PERCENT = 20
+    # ...as does the network rate growing by this factor (and 1 MB/s)
+    SPIKE_NET_FACTOR = 4
+    SPIKE_NET_MIN = 1024**2
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        idle_interval: Optional[float] = 5.0,
+        collect: Optional[Callable[[], RawMetrics]] = None,
+    ):
+        # `collect` replaces the in-process MetricsCollector (e.g. with a
+        # worker process)
+        super().__init__(
+            collect or self._collect, interval, "MetricsSampler", idle_interval
+        )
+        self._collector: Optional[MetricsCollector] = None
+
+    def is_spike(self, previous: RawMetrics, sample: RawMetrics) -> bool:
+        for field in ("cpu_percent", "ram_percent"):
+            if abs(sample[field] - previous[field]) >= self.SPIKE_PERCENT:
+                return True
+        rate, last_rate = sample["net_recv_rate"], previous["net_recv_rate"]
+        return rate >= self.SPIKE_NET_MIN and rate >= last_rate * self.SPIKE_NET_FACTOR
+
+    def _collect(self) -> RawMetrics:
+        if self._collector is None:
+            self._collector = MetricsCollector()
+        return self._collector.collect()
+
+    def latest_formatted(self) -> Optional[SystemMetrics]:
+        """Returns the most recent sample formatted for display."""
+        sample = self.latest()
+        return format_metrics(sample) if sample is not None else None
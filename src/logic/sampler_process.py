@@ -0,0 +1,289 @@
+"""
+Runs the system and process collectors in a child Python process.
+
+Parsing thousands of /proc files competes with Tk for the GIL, so with
+TOOLKIT_SAMPLER_PROCESS=1 the metrics bus asks a worker process for samples
+instead of collecting them in its own threads. The worker is started with
+`python -m logic.sampler_process` and talks over its stdin/stdout in
+length-prefixed binary frames:
+
+- b"S" asks for a system sample: one metrics log RECORD (64 bytes).
+- b"P" asks for a process refresh: only the diff is sent (removed PIDs,
+  added processes with their static fields, changed values), and the UI side
+  applies it to its own copy of the process table.
+
+Replies start with b"K" (ok) or b"E" followed by an error message.
+"""
+
+import os
+import struct
+import subprocess
+import sys
+import threading
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+
+from logic.metrics_log import RECORD, pack_sample, unpack_sample
+from logic.processes import BACKEND_ENV, ProcessDiff, ProcessInfo, ProcessSample
+from logic.stats import RawMetrics
+
+SAMPLER_PROCESS_ENV = "TOOLKIT_SAMPLER_PROCESS"
+
+SYSTEM_REQUEST = b"S"
+PROCESSES_REQUEST = b"P"
+OK = b"K"
+ERROR = b"E"
+
+FRAME = struct.Struct("<I")
+# Counts of removed, added and changed processes
+DIFF_HEADER = struct.Struct("<III")
+# pid, cpu, mem, rss, threads, io_read, io_write, connections
+VALUES = struct.Struct("<iddQIddI")
+# ppid, create_time, then the byte lengths of name, user and cmdline
+STATIC = struct.Struct("<idHHI")
+
+# Percentages are stored as 32-bit floats in a RECORD; round away the noise
+ROUNDED_FIELDS = ("cpu_percent", "cpu_temp", "ram_percent", "disk_percent")
+
+
+def is_enabled() -> bool:
+    return os.environ.get(SAMPLER_PROCESS_ENV) == "1"
+
+
+def _write_frame(stream: BinaryIO, payload: bytes):
+    stream.write(FRAME.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise EOFError("The sampler process closed the pipe")
+    return data
+
+
+def _read_frame(stream: BinaryIO) -> bytes:
+    (size,) = FRAME.unpack(_read_exactly(stream, FRAME.size))
+    return _read_exactly(stream, size)
+
+
+def _pack_values(info: ProcessInfo) -> bytes:
+    return VALUES.pack(
+        info["pid"],
+        info["cpu"],
+        info["mem"],
+        info["rss"],
+        info["threads"],
+        info["io_read"],
+        info["io_write"],
+        info["connections"],
+    )
+
+
+def encode_diff(diff: ProcessDiff) -> bytes:
+    """Packs a ProcessDiff into the compact wire format."""
+    counts = (len(diff["removed"]), len(diff["added"]), len(diff["changed"]))
+    parts = [
+        DIFF_HEADER.pack(*counts),
+        array("i", [info["pid"] for info in diff["removed"]]).tobytes(),
+    ]
+    for info in diff["added"]:
+        name = info["name"].encode()
+        user = info["user"].encode()
+        cmdline = info["cmdline"].encode()
+        parts.append(_pack_values(info))
+        parts.append(
+            STATIC.pack(
+                info["ppid"], info["create_time"], len(name), len(user), len(cmdline)
+            )
+        )
+        parts.append(name + user + cmdline)
+    parts.extend(_pack_values(current) for _, current in diff["changed"])
+    return b"".join(parts)
+
+
+def _unpack_values(values) -> Dict:
+    pid, cpu, mem, rss, threads, io_read, io_write, connections = values
+    return {
+        "pid": pid,
+        "cpu": cpu,
+        "mem": mem,
+        "rss": rss,
+        "threads": threads,
+        # Same as SlowFields computes it
+        "io": round(io_read + io_write, 1),
+        "io_read": io_read,
+        "io_write": io_write,
+        "connections": connections,
+    }
+
+
+class ProcessMirror:
+    """
+    The UI side's copy of the worker's process table, kept in step by
+    applying the diffs it sends.
+    """
+
+    def __init__(self):
+        self.entries: Dict[int, ProcessInfo] = {}
+        self.tick = 0
+
+    def apply(self, data: bytes) -> ProcessSample:
+        diff: ProcessDiff = {"added": [], "removed": [], "changed": []}
+        entries = self.entries
+        removed, added, changed = DIFF_HEADER.unpack_from(data)
+        offset = DIFF_HEADER.size
+
+        pids = array("i")
+        pids.frombytes(data[offset : offset + 4 * removed])
+        offset += 4 * removed
+        for pid in pids:
+            diff["removed"].append(entries.pop(pid))
+
+        for _ in range(added):
+            entry = _unpack_values(VALUES.unpack_from(data, offset))
+            offset += VALUES.size
+            ppid, create_time, name_len, user_len, cmdline_len = STATIC.unpack_from(
+                data, offset
+            )
+            offset += STATIC.size
+            strings = data[offset : offset + name_len + user_len + cmdline_len]
+            offset += name_len + user_len + cmdline_len
+            entry["ppid"] = ppid
+            entry["create_time"] = create_time
+            entry["name"] = strings[:name_len].decode(errors="replace")
+            entry["user"] = strings[name_len : name_len + user_len].decode(
+                errors="replace"
+            )
+            entry["cmdline"] = strings[name_len + user_len :].decode(errors="replace")
+            entries[entry["pid"]] = entry
+            diff["added"].append(entry)
+
+        end = offset + VALUES.size * changed
+        for values in VALUES.iter_unpack(data[offset:end]):
+            previous = entries[values[0]]
+            entry = {**previous, **_unpack_values(values)}
+            entries[values[0]] = entry
+            diff["changed"].append((previous, entry))
+
+        self.tick += 1
+        return {"processes": dict(entries), "diff": diff, "tick": self.tick}
+
+
+class SamplerProcess:
+    """
+    Collect functions backed by a worker process.
+
+    collect_system() and collect_processes() have the same results as
+    MetricsCollector.collect() and ProcessCollector.collect(), so they can be
+    handed to the bus's samplers as is. The worker is started on first use and
+    restarted if it dies; it exits by itself when this process goes away.
+    """
+
+    def __init__(self, backend: Optional[str] = None):
+        self.backend = backend
+        self.mirror = ProcessMirror()
+        self._process: Optional[subprocess.Popen] = None
+        # Both samplers share the one pipe
+        self._lock = threading.Lock()
+
+    def _start(self):
+        env = dict(os.environ)
+        if self.backend:
+            env[BACKEND_ENV] = self.backend
+        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "logic.sampler_process"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=Path(__file__).resolve().parent.parent,
+            env=env,
+            creationflags=flags,
+        )
+        self._reset_mirror()
+
+    def _reset_mirror(self):
+        # The worker starts over from an empty table; the tick jump makes
+        # subscribers rebuild from the next snapshot
+        previous_tick = self.mirror.tick
+        self.mirror = ProcessMirror()
+        self.mirror.tick = previous_tick + 1
+
+    def _request(self, op: bytes) -> bytes:
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+            try:
+                _write_frame(self._process.stdin, op)
+                reply = _read_frame(self._process.stdout)
+            except (OSError, EOFError):
+                self._process.kill()
+                self._process = None
+                raise
+        if reply[:1] == ERROR:
+            raise RuntimeError(reply[1:].decode(errors="replace"))
+        return reply[1:]
+
+    def collect_system(self) -> RawMetrics:
+        sample = unpack_sample(RECORD.unpack(self._request(SYSTEM_REQUEST)))
+        for field in ROUNDED_FIELDS:
+            if sample[field] is not None:
+                sample[field] = round(sample[field], 1)
+        return sample
+
+    def collect_processes(self) -> ProcessSample:
+        try:
+            data = self._request(PROCESSES_REQUEST)
+        except RuntimeError:
+            # The worker reset its table after the error
+            with self._lock:
+                self._reset_mirror()
+            raise
+        with self._lock:
+            return self.mirror.apply(data)
+
+    def close(self):
+        with self._lock:
+            if self._process is not None:
+                # Closing stdin makes the worker's loop exit
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+                self._process = None
+
+
+def main():
+    from logic.processes import make_process_cache
+    from logic.stats import MetricsCollector
+
+    # Frames go to the real stdout; stray prints must not corrupt them
+    requests, replies = sys.stdin.buffer, sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    metrics = MetricsCollector()
+    cache = make_process_cache()
+    while True:
+        try:
+            op = _read_frame(requests)
+        except EOFError:
+            # The UI process closed the pipe or exited
+            return
+        try:
+            if op == SYSTEM_REQUEST:
+                reply = OK + pack_sample(metrics.collect())
+            elif op == PROCESSES_REQUEST:
+                try:
+                    reply = OK + encode_diff(cache.refresh())
+                except Exception:
+                    # A half-done refresh would put the UI's copy out of step
+                    cache = make_process_cache()
+                    raise
+            else:
+                reply = ERROR + f"Unknown request {op!r}".encode()
+        except Exception as e:
+            reply = ERROR + str(e).encode()
+        _write_frame(replies, reply)
+
+
+if __name__ == "__main__":
+    main()
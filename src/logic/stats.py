@@ -1,7 +1,6 @@
 import psutil
 import time
-import platform  # Used for OS-specific adjustments
-from typing import TypedDict
+from typing import TypedDict, Optional
 
 
 class SystemMetrics(TypedDict):
@@ -14,72 +13,156 @@ class SystemMetrics(TypedDict):
     network_speed: str
 
 
-def get_system_metrics():
-    """
-    Returns a dictionary containing key system hardware metrics.
-    """
+class RawMetrics(TypedDict):
+    """The numbers behind SystemMetrics, before any formatting."""
 
-    # 1. CPU Usage
-    # Get a 1-second average for more accurate usage reading
-    cpu_percent = psutil.cpu_percent(interval=1)
+    timestamp: float
+    cpu_percent: float
+    cpu_temp: Optional[float]
+    ram_percent: float
+    ram_used: int
+    disk_percent: float
+    disk_used: int
+    disk_free: int
+    net_recv_rate: float  # bytes per second
+    net_sent_rate: float  # bytes per second
 
-    # 2. CPU Temperature (Less reliable across all OSes)
-    cpu_temp = "N/A"
+
+def get_cpu_temperature() -> Optional[float]:
+    """Returns the CPU temperature in °C, or None when it cannot be read."""
     try:
         # psutil's sensors_temperatures() is the standard way
         temps = psutil.sensors_temperatures()
-        if "coretemp" in temps:
-            # Common label for main CPU temperature on Linux/macOS
-            cpu_temp = f"{temps['coretemp'][0].current:.1f} °C"
-        elif "cpu_thermal" in temps:
-            # Another common label (e.g., Raspberry Pi)
-            cpu_temp = f"{temps['cpu_thermal'][0].current:.1f} °C"
-        elif platform.system() == "Windows":
-            # Windows temperature retrieval is often unsupported by psutil directly.
-            pass
-
     except AttributeError:
         # Handles systems where sensors_temperatures() is not implemented (e.g., some Windows/VMs)
-        cpu_temp = "Requires third-party tool on this OS"
+        return None
 
-    # 3. RAM Usage
-    ram = psutil.virtual_memory()
-    ram_used_percent = ram.percent
-    # Convert bytes to Gigabytes (GB)
-    ram_used_gb = ram.used / (1024**3)
+    if "coretemp" in temps:
+        # Common label for main CPU temperature on Linux/macOS
+        return temps["coretemp"][0].current
+    if "cpu_thermal" in temps:
+        # Another common label (e.g., Raspberry Pi)
+        return temps["cpu_thermal"][0].current
+    # Windows temperature retrieval is often unsupported by psutil directly.
+    return None
+
+
+def _cpu_total(times) -> float:
+    # On Linux, user and nice already include guest and guest_nice time
+    guest = getattr(times, "guest", 0.0) + getattr(times, "guest_nice", 0.0)
+    return sum(times) - guest
+
+
+def _cpu_busy_percent(before, after) -> float:
+    """Percentage of non-idle CPU time between two psutil.cpu_times() readings."""
+    total = _cpu_total(after) - _cpu_total(before)
+    if total <= 0:
+        return 0.0
+    idle = (after.idle + getattr(after, "iowait", 0.0)) - (
+        before.idle + getattr(before, "iowait", 0.0)
+    )
+    return round(min(max(100.0 * (total - idle) / total, 0.0), 100.0), 1)
+
+
+class MetricsCollector:
+    """
+    Collects system metrics without blocking.
+
+    CPU usage and network speed are computed from the deltas between two
+    consecutive calls to collect(), so nothing has to sleep. The first call
+    reports a network speed of 0.
+    """
+
+    def __init__(self, disk_path: str = "/"):
+        self.disk_path = disk_path
+        self._last_net = None
+        self._last_time = None
+        # Keep our own CPU baseline instead of psutil.cpu_percent()'s global one,
+        # so other callers (e.g. the process list) can't reset it under us.
+        self._last_cpu = psutil.cpu_times()
+
+    def collect(self) -> RawMetrics:
+        now = time.time()
 
-    # 4. Disk Usage (for the root/primary partition)
-    disk = psutil.disk_usage("/")
-    disk_used_percent = disk.percent
-    disk_used_gb = disk.used / (1024**3)
+        # 1. CPU Usage since the previous call
+        cpu_times = psutil.cpu_times()
+        cpu_percent = _cpu_busy_percent(self._last_cpu, cpu_times)
+        self._last_cpu = cpu_times
 
-    # 5. Network Speed (Approximate download speed)
-    # Get initial byte counts
-    net_io_start = psutil.net_io_counters()
-    time.sleep(1)  # Wait 1 second
-    net_io_end = psutil.net_io_counters()
+        # 2. RAM Usage
+        ram = psutil.virtual_memory()
+
+        # 3. Disk Usage (for the root/primary partition)
+        disk = psutil.disk_usage(self.disk_path)
+
+        # 4. Network rates since the previous call
+        net = psutil.net_io_counters()
+        recv_rate = sent_rate = 0.0
+        if self._last_net is not None and now > self._last_time:
+            elapsed = now - self._last_time
+            recv_rate = max(net.bytes_recv - self._last_net.bytes_recv, 0) / elapsed
+            sent_rate = max(net.bytes_sent - self._last_net.bytes_sent, 0) / elapsed
+        self._last_net = net
+        self._last_time = now
+
+        return {
+            "timestamp": now,
+            "cpu_percent": cpu_percent,
+            "cpu_temp": get_cpu_temperature(),
+            "ram_percent": ram.percent,
+            "ram_used": ram.used,
+            "disk_percent": disk.percent,
+            "disk_used": disk.used,
+            "disk_free": disk.free,
+            "net_recv_rate": recv_rate,
+            "net_sent_rate": sent_rate,
+        }
+
+
+def format_metrics(raw: RawMetrics) -> SystemMetrics:
+    """Turns a RawMetrics sample into the display strings used by the UI."""
+    cpu_temp = raw["cpu_temp"]
+    cpu_temp = "N/A" if cpu_temp is None else f"{cpu_temp:.1f} °C"
+
+    # Convert bytes to Gigabytes (GB)
+    ram_used_gb = raw["ram_used"] / (1024**3)
+    disk_used_gb = raw["disk_used"] / (1024**3)
 
-    # Calculate bytes received (download) over the interval
-    download_bytes_per_sec = net_io_end.bytes_recv - net_io_start.bytes_recv
     # Convert bytes/sec to Megabits/sec (Mbps) for speed reporting
     # 1 Byte = 8 bits. 1 Megabit = 1,000,000 bits.
-    network_speed_mbps = (download_bytes_per_sec * 8) / (1000**2)
+    network_speed_mbps = (raw["net_recv_rate"] * 8) / (1000**2)
 
-    # Build the final dictionary
     metrics: SystemMetrics = {
-        "cpu_used": f"{cpu_percent}%",
+        "cpu_used": f"{raw['cpu_percent']}%",
         "cpu_temp": f"Temp: {cpu_temp}",
-        "ram_used": f"{ram_used_percent}%",
+        "ram_used": f"{raw['ram_percent']}%",
         "ram_gb": f"Used: {ram_used_gb:.0f}GB",
-        "disk_used": f"{disk_used_percent}%",
+        "disk_used": f"{raw['disk_percent']}%",
         "disk_gb": f"Used: {disk_used_gb:.0f}GB",
         "network_speed": f"{network_speed_mbps:.0f}Mbps",
     }
-
     return metrics
 
 
+_default_collector: Optional[MetricsCollector] = None
+
+
+def get_system_metrics() -> SystemMetrics:
+    """
+    Returns a dictionary containing key system hardware metrics.
+
+    This never sleeps: rates are measured against the previous call. Long-lived
+    views should read from logic.sampler.MetricsSampler instead.
+    """
+    global _default_collector
+    if _default_collector is None:
+        _default_collector = MetricsCollector()
+    return format_metrics(_default_collector.collect())
+
+
 # Run the function and print the result
 if __name__ == "__main__":
+    get_system_metrics()
+    time.sleep(1)
     system_data = get_system_metrics()
     print(system_data)
@@ -41,3 +41,17 @@ def open_file_chooser():
     else:
         print("File selection cancelled.")
     return filename
+
+
+def save_file_chooser(default_name: str):
+    """Opens a dialog to pick where to save a text file."""
+    # Returns the full path to save to, or an empty string if cancelled.
+    filename = fd.asksaveasfilename(
+        title="Save as",
+        initialfile=default_name,
+        defaultextension=".txt",
+        filetypes=(("Text files", "*.txt"), ("All files", "*.*")),
+    )
+    if not filename:
+        print("Save cancelled.")
+    return filename
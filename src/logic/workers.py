@@ -0,0 +1,71 @@
+import itertools
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable, List, Optional
+
+# Lower runs first
+HIGH = 0  # the user is waiting on it, e.g. a clicked process's details
+NORMAL = 1
+LOW = 2  # background refreshes nobody asked for yet
+
+MAX_WORKERS = 4
+
+
+class WorkerPool:
+    """
+    A fixed set of daemon threads shared by every view's background work.
+
+    Calls run in priority order, and in submission order within a priority.
+    The threads are started on the first submit(). Each call gets a Future;
+    cancelling it before it starts skips the call.
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS, name: str = "Worker"):
+        self.max_workers = max_workers
+        self.name = name
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue()
+        # Breaks ties so calls of one priority keep their order
+        self._counter = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args, priority: int = NORMAL) -> Future:
+        future: Future = Future()
+        self._queue.put((priority, next(self._counter), future, fn, args))
+        self._start_threads()
+        return future
+
+    def _start_threads(self):
+        with self._lock:
+            while len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._work,
+                    name=f"{self.name}-{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _work(self):
+        while True:
+            _, _, future, fn, args = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+
+_default_pool: Optional[WorkerPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_pool() -> WorkerPool:
+    """Returns the application-wide worker pool."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = WorkerPool()
+        return _default_pool
@@ -1,6 +1,18 @@
+import time
+
+# Taken before the other imports, which are part of the startup time
+STARTED = time.perf_counter()
+
+import os
 import customtkinter
 import app
 import logic.utils as utils
+from logic import metrics_bus
+from app import STARTUP_BUDGET_S
+
+# Set to 1 to print the time to the first frame and exit (see
+# benchmarks/startup.py)
+STARTUP_PROBE_ENV = "TOOLKIT_STARTUP_PROBE"
 
 # Themes: "blue" (standard), "green", "dark-blue"
 
@@ -11,5 +23,20 @@ if utils.is_linux():
     customtkinter.DrawEngine.preferred_drawing_method = "circle_shapes"
     pass
 
-app = app.App()
+
+def first_frame_shown():
+    elapsed = time.perf_counter() - STARTED
+    if os.environ.get(STARTUP_PROBE_ENV) == "1":
+        print(f"first_frame={elapsed:.3f}", flush=True)
+        app.destroy()
+    elif elapsed > STARTUP_BUDGET_S:
+        print(
+            f"Warning: first frame after {elapsed:.2f}s, "
+            f"over the {STARTUP_BUDGET_S}s startup budget"
+        )
+
+
+app = app.App(on_first_frame=first_frame_shown)
 app.mainloop()
+# Keeps the rollup of the minute in progress
+metrics_bus.shutdown()
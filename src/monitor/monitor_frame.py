@@ -5,10 +5,6 @@ from orginizer.tools_header import ToolsHeader
 from snapshots import SnapshotsFrame
 from . import processes_frame
 
-# Set up appearance mode and color theme
-ctk.set_appearance_mode("System")  # Modes: "System", "Dark", "Light"
-ctk.set_default_color_theme("blue")
-
 
 class MonitorFrame(ctk.CTkFrame):
     """
@@ -29,6 +25,7 @@ class MonitorFrame(ctk.CTkFrame):
         # --- 2. Snapshots ---
         self.snapshots = SnapshotsFrame(self)
         self.snapshots.grid(row=1, column=0, padx=20, pady=(0, 10), sticky="ew")
+        self.snapshots.sheduleUpdates(master)
 
         # --- 3. Processes ---
         self.processes = processes_frame.ProcessesFrame(self)
@@ -39,7 +36,7 @@ class MonitorWindow(ctk.CTkToplevel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.title("System Monitor")
-        self.geometry("550x700")
+        self.geometry("900x700")
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
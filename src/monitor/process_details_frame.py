@@ -0,0 +1,105 @@
+import tkinter
+from typing import Dict, Optional
+
+import customtkinter as ctk
+
+from logic.process_details import SECTIONS, DetailsLoader
+from logic.processes import ProcessInfo
+from logic.workers import HIGH
+from ui_scheduler import get_scheduler
+
+
+class ProcessDetailsPane(ctk.CTkFrame):
+    """
+    Details of one process: command line, threads, open files, memory maps,
+    environment size and children.
+
+    Every section is fetched in the background by a DetailsLoader and filled
+    in as it arrives. Sections still queued are cancelled when the pane is
+    closed or destroyed.
+    """
+
+    def __init__(self, master, on_close=None):
+        super().__init__(master)
+        self.on_close = on_close
+        self.loader = DetailsLoader()
+        self.process: Optional[ProcessInfo] = None
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        # Title and buttons
+        self.title_label = ctk.CTkLabel(
+            self, text="", font=ctk.CTkFont(size=16, weight="bold"), anchor="w"
+        )
+        self.title_label.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="ew")
+        self.refresh_button = ctk.CTkButton(
+            self, text="Refresh", width=80, command=self.reload
+        )
+        self.refresh_button.grid(row=0, column=1, padx=5, pady=(10, 5))
+        self.close_button = ctk.CTkButton(
+            self, text="Close", width=80, command=self.close
+        )
+        self.close_button.grid(row=0, column=2, padx=(5, 10), pady=(10, 5))
+
+        # One title and value label per section
+        self.sections_frame = ctk.CTkScrollableFrame(self, height=200)
+        self.sections_frame.grid(
+            row=1, column=0, columnspan=3, padx=10, pady=(0, 10), sticky="nsew"
+        )
+        self.sections_frame.grid_columnconfigure(0, weight=1)
+        self.values: Dict[str, ctk.CTkLabel] = {}
+        for i, title in enumerate(SECTIONS):
+            ctk.CTkLabel(
+                self.sections_frame,
+                text=title,
+                font=ctk.CTkFont(size=14, weight="bold"),
+                anchor="w",
+            ).grid(row=2 * i, column=0, padx=5, pady=(5, 0), sticky="w")
+            value = ctk.CTkLabel(
+                self.sections_frame,
+                text="",
+                anchor="w",
+                justify="left",
+                wraplength=600,
+            )
+            value.grid(row=2 * i + 1, column=0, padx=15, sticky="w")
+            self.values[title] = value
+
+        tkinter.Misc.bind(self, "<Destroy>", self._on_destroy, "+")
+
+    def show(self, process: ProcessInfo):
+        """Shows the details of `process`, fetching every section again."""
+        self.process = process
+        self.title_label.configure(text=f"{process['name']} ({process['pid']})")
+        self.reload()
+
+    def reload(self):
+        if self.process is None:
+            return
+        for value in self.values.values():
+            value.configure(text="Loading...")
+        process = self.process
+        self.loader.load(
+            process, lambda title, text: self._section_ready(process, title, text)
+        )
+
+    def close(self):
+        self.loader.close()
+        self.process = None
+        if self.on_close is not None:
+            self.on_close()
+
+    def _section_ready(self, process: ProcessInfo, title: str, text: str):
+        # Called on a worker thread: hop back to the Tk main thread. If the
+        # pane is already gone, <Destroy> closes the loader.
+        get_scheduler().post(self, lambda: self._apply(process, title, text), HIGH)
+
+    def _apply(self, process: ProcessInfo, title: str, text: str):
+        # Skip results that arrive after another process was selected
+        if self.process is process:
+            self.values[title].configure(text=text)
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self.loader.close()
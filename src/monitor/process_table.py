@@ -0,0 +1,215 @@
+import math
+import sys
+import tkinter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import customtkinter as ctk
+
+# (header, row key, formatter, anchor "w" or "e")
+Column = Tuple[str, str, Callable[[object], str], str]
+# (first, count) -> (up to `count` rows starting at `first`, total number of rows)
+RowSource = Callable[[int, int], Tuple[List[Dict], int]]
+
+CELL_PADX = 10
+# Rows scrolled per mouse wheel notch
+WHEEL_ROWS = 3
+
+
+class VirtualTable(ctk.CTkFrame):
+    """
+    A scrollable table that only draws the rows in view.
+
+    Cells are canvas text items in a fixed pool sized to the visible height.
+    Scrolling asks `row_source` for the rows now in view and re-fills the same
+    items, so a table of thousands of rows costs as much as one screenful, and
+    only cells whose text or color changed are reconfigured.
+    """
+
+    def __init__(
+        self,
+        master,
+        columns: Sequence[Column],
+        row_source: RowSource,
+        weights: Optional[Sequence[int]] = None,
+        cell_color: Optional[Callable[[str, Dict], Optional[str]]] = None,
+        on_click: Optional[Callable[[Dict], None]] = None,
+    ):
+        super().__init__(master)
+        self.columns = columns
+        self.row_source = row_source
+        self.weights = weights or [1] * len(columns)
+        self.cell_color = cell_color
+        self.on_click = on_click
+
+        self.font = ctk.CTkFont(size=13)
+        header_font = ctk.CTkFont(size=14, weight="bold")
+        self.row_height = self.font.metrics("linespace") + 8
+        bg = self._apply_appearance_mode(self.cget("fg_color"))
+        self.text_color = self._apply_appearance_mode(
+            ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+        )
+
+        self.total = 0
+        self.rows: List[Dict] = []  # the rows in view, as last drawn
+        self.offset = 0  # pixels scrolled from the top
+        self._shift = 0  # offset within the first visible row
+        # Pool of canvas text items (one list per visible row) and what they show
+        self._items: List[List[int]] = []
+        self._shown: List[List[Tuple[str, str]]] = []
+        # Left edge and width of every column
+        self._x: List[Tuple[float, float]] = []
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        self.header = tkinter.Canvas(
+            self, height=self.row_height + 6, bg=bg, highlightthickness=0, bd=0
+        )
+        self.header.grid(row=0, column=0, padx=(5, 0), pady=(5, 0), sticky="ew")
+        self._header_items = [
+            self.header.create_text(
+                0, 0, text=header, font=header_font, fill=self.text_color
+            )
+            for header, _, _, _ in columns
+        ]
+
+        self.canvas = tkinter.Canvas(self, bg=bg, highlightthickness=0, bd=0)
+        self.canvas.grid(row=1, column=0, padx=(5, 0), pady=(0, 5), sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, rowspan=2, pady=5, sticky="ns")
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<Button-1>", self._on_click)
+        if sys.platform.startswith("linux"):
+            self.canvas.bind("<Button-4>", lambda e: self.scroll_by(-WHEEL_ROWS))
+            self.canvas.bind("<Button-5>", lambda e: self.scroll_by(WHEEL_ROWS))
+        else:
+            self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+
+    # --- Public API ---
+
+    def set_header(self, column: int, text: str):
+        self.header.itemconfigure(self._header_items[column], text=text)
+
+    def refresh(self):
+        """Re-reads the rows in view from the row source and redraws them."""
+        first = self.offset // self.row_height
+        rows, self.total = self.row_source(first, len(self._items))
+        # The table may have shrunk below the scroll position
+        if self.offset > self._max_offset():
+            self.scroll_to(self._max_offset())
+            return
+        self._draw(rows)
+
+    def scroll_to(self, offset: int):
+        self.offset = int(min(max(offset, 0), self._max_offset()))
+        shift = self.offset % self.row_height
+        if shift != self._shift:
+            self.canvas.move("cell", 0, self._shift - shift)
+            self._shift = shift
+        first = self.offset // self.row_height
+        rows, self.total = self.row_source(first, len(self._items))
+        self._draw(rows)
+
+    def scroll_by(self, rows: int):
+        self.scroll_to(self.offset + rows * self.row_height)
+
+    # --- Drawing ---
+
+    def _max_offset(self) -> int:
+        return max(self.total * self.row_height - self.canvas.winfo_height(), 0)
+
+    def _cell_x(self, column: int) -> float:
+        left, width = self._x[column]
+        if self.columns[column][3] == "e":
+            return left + width - CELL_PADX
+        return left + CELL_PADX
+
+    def _fit(self, column: int, text: str) -> str:
+        """Cuts text that would run into the next column (left-aligned columns only)."""
+        if self.columns[column][3] != "w":
+            return text
+        max_chars = int((self._x[column][1] - CELL_PADX) // self.font.measure("0"))
+        if len(text) > max_chars:
+            return text[: max(max_chars - 1, 0)] + "…"
+        return text
+
+    def _draw(self, rows: List[Dict]):
+        self.rows = rows
+        for i, items in enumerate(self._items):
+            row = rows[i] if i < len(rows) else None
+            shown = self._shown[i]
+            for col, (_, key, formatter, _) in enumerate(self.columns):
+                if row is None:
+                    cell = ("", self.text_color)
+                else:
+                    color = self.cell_color(key, row) if self.cell_color else None
+                    text = self._fit(col, formatter(row[key]))
+                    cell = (text, color or self.text_color)
+                if shown[col] != cell:
+                    self.canvas.itemconfigure(items[col], text=cell[0], fill=cell[1])
+                    shown[col] = cell
+
+        view = self.canvas.winfo_height()
+        content = self.total * self.row_height
+        if content <= view:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / content, (self.offset + view) / content)
+
+    def _on_configure(self, event):
+        # Split the width between the columns by weight
+        left = 0.0
+        total_weight = sum(self.weights)
+        self._x = []
+        for weight in self.weights:
+            width = event.width * weight / total_weight
+            self._x.append((left, width))
+            left += width
+        for col, item in enumerate(self._header_items):
+            anchor = self.columns[col][3]
+            self.header.coords(item, self._cell_x(col), (self.row_height + 6) / 2)
+            self.header.itemconfigure(item, anchor=anchor)
+
+        # One pool row per visible row, plus one for the partly scrolled-in row
+        needed = math.ceil(event.height / self.row_height) + 1
+        while len(self._items) > needed:
+            for item in self._items.pop():
+                self.canvas.delete(item)
+            self._shown.pop()
+        while len(self._items) < needed:
+            self._items.append(
+                [
+                    self.canvas.create_text(
+                        0, 0, font=self.font, anchor=anchor, tags="cell"
+                    )
+                    for _, _, _, anchor in self.columns
+                ]
+            )
+            self._shown.append([None] * len(self.columns))
+
+        for i, items in enumerate(self._items):
+            y = i * self.row_height - self._shift + self.row_height / 2
+            for col, item in enumerate(items):
+                self.canvas.coords(item, self._cell_x(col), y)
+        # Column widths changed, so truncated names must be re-fitted
+        for shown in self._shown:
+            shown[:] = [None] * len(self.columns)
+        self.refresh()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * self.total * self.row_height)
+        elif unit == "pages":
+            self.scroll_by(int(amount) * max(len(self._items) - 2, 1))
+        else:
+            self.scroll_by(int(amount))
+
+    def _on_click(self, event):
+        index = (event.y + self._shift) // self.row_height
+        if self.on_click is not None and index < len(self.rows):
+            self.on_click(self.rows[index])
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        self.scroll_by(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
@@ -1,35 +1,65 @@
 import customtkinter as ctk
-import psutil
-import threading
-from typing import List, Dict, Any, Tuple
-
-# Set up appearance mode and color theme
-ctk.set_appearance_mode("System")  # Modes: "System", "Dark", "Light"
-ctk.set_default_color_theme("blue")
+import live_updates
+from logic import metrics_bus
+from logic.process_groups import ProcessGroups
+from logic.process_search import ProcessIndex
+from logic.processes import (
+    SORT_KEYS,
+    ProcessSample,
+    format_size,
+    is_active,
+    top_processes,
+)
+from monitor.process_details_frame import ProcessDetailsPane
+from monitor.process_table import VirtualTable
+from typing import Dict, List, Optional, Tuple
+
+# Table columns: (header, ProcessInfo key, formatter, anchor)
+COLUMNS = (
+    ("Process Name", "name", str, "w"),
+    ("PID", "pid", str, "w"),
+    ("CPU (%)", "cpu", lambda value: f"{value:.1f}%", "e"),
+    ("RAM (%)", "mem", lambda value: f"{value:.1f}%", "e"),
+    ("RSS", "rss", format_size, "e"),
+    ("Threads", "threads", str, "e"),
+    ("Read", "io_read", lambda value: f"{format_size(value)}/s", "e"),
+    ("Write", "io_write", lambda value: f"{format_size(value)}/s", "e"),
+    ("Conns", "connections", str, "e"),
+)
+# The name column gets most of the width
+COLUMN_WEIGHTS = (3, 1, 1, 1, 1, 1, 1, 1, 1)
+PID_COLUMN = 1
+
+# View modes: one row per process, per application (name), or the process tree
+VIEW_MODES = ("Processes", "Apps", "Tree")
 
 
 class ProcessesFrame(ctk.CTkFrame):
     """
     A customtkinter application to display live CPU and RAM usage
-    for top system processes using the psutil library.
+    for all system processes using the psutil library.
     """
 
     def __init__(self, master):
         super().__init__(master, fg_color="transparent")
 
         # --- Configuration ---
-        self.update_interval_ms = 1500
-        self.max_processes = 15
-
-        # State variables for threading and UI reuse
-        self.is_fetching = False
-        # Stores rows of (name_label, pid_label, cpu_label, mem_label)
-        self.process_widgets: List[
-            Tuple[ctk.CTkLabel, ctk.CTkLabel, ctk.CTkLabel, ctk.CTkLabel]
-        ] = []
+        self.sort_by = "CPU"
+        self.view_mode = "Processes"
+
+        # Last sample from the bus, so changing the sort re-ranks it instantly
+        self.last_sample: Optional[ProcessSample] = None
+        # App and tree totals, only kept up to date while one of those views is shown
+        self.groups = ProcessGroups()
+        # Search index over name, PID, user and command line
+        self.search = ProcessIndex()
+        # The ranked rows of the last sample (at least down to the scroll
+        # position), and the total number of rows
+        self._ranked: Optional[List[Dict]] = None
+        self._total = 0
 
         # Configure grid for dynamic resizing
-        self.grid_rowconfigure(1, weight=1)
+        self.grid_rowconfigure(3, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
         # Title Label
@@ -40,154 +70,142 @@ class ProcessesFrame(ctk.CTkFrame):
         )
         self.title_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="w")
 
-        # Container for the process list (Scrollable Frame)
-        self.process_frame = ctk.CTkScrollableFrame(self, label_text="Top Processes")
-        self.process_frame.grid(row=1, column=0, padx=20, pady=10, sticky="nsew")
-        # Ensure the name column (0) gets most space
-        self.process_frame.grid_columnconfigure(0, weight=3)
-        self.process_frame.grid_columnconfigure((1, 2, 3), weight=1)
-
-        # Setup Header Row
-        self._setup_header()
-
-        # --- Start Monitoring ---
-        # Start the scheduling loop
-        self._schedule_update()
-
-    def _setup_header(self):
-        """Creates the header row for the process table."""
-        header_font = ctk.CTkFont(size=14, weight="bold")
+        # Sort selector
+        self.sort_button = ctk.CTkSegmentedButton(
+            self, values=list(SORT_KEYS), command=self._sort_changed
+        )
+        self.sort_button.set(self.sort_by)
+        self.sort_button.grid(row=0, column=1, padx=20, pady=(20, 10), sticky="e")
 
-        # Process Name
-        ctk.CTkLabel(self.process_frame, text="Process Name", font=header_font).grid(
-            row=0, column=0, padx=10, pady=(5, 10), sticky="w"
+        # View mode selector
+        self.view_button = ctk.CTkSegmentedButton(
+            self, values=list(VIEW_MODES), command=self._view_changed
         )
+        self.view_button.set(self.view_mode)
+        self.view_button.grid(row=1, column=0, columnspan=2, padx=20, sticky="w")
 
-        # Process ID (PID)
-        ctk.CTkLabel(self.process_frame, text="PID", font=header_font).grid(
-            row=0, column=1, padx=5, pady=(5, 10), sticky="w"
+        # Filter box: the table is re-filtered on every keystroke
+        self.filter_var = ctk.StringVar(value="")
+        self.filter_var.trace_add("write", lambda *args: self._invalidate())
+        self.filter_entry = ctk.CTkEntry(
+            self,
+            textvariable=self.filter_var,
+            placeholder_text="Filter by name, PID, user or command line",
+        )
+        self.filter_entry.grid(
+            row=2, column=0, columnspan=2, padx=20, pady=(10, 0), sticky="ew"
         )
 
-        # CPU Usage
-        ctk.CTkLabel(self.process_frame, text="CPU (%)", font=header_font).grid(
-            row=0, column=2, padx=10, pady=(5, 10), sticky="e"
+        # The process table only creates canvas items for the rows in view
+        self.table = VirtualTable(
+            self,
+            COLUMNS,
+            self._rows,
+            weights=COLUMN_WEIGHTS,
+            cell_color=self._cell_color,
+            on_click=self._row_clicked,
         )
+        self.table.grid(row=3, column=0, columnspan=2, padx=20, pady=10, sticky="nsew")
+
+        # Details of the clicked process, shown below the table
+        self.details = ProcessDetailsPane(self, on_close=self.details_closed)
 
-        # RAM Usage
-        ctk.CTkLabel(self.process_frame, text="RAM (%)", font=header_font).grid(
-            row=0, column=3, padx=10, pady=(5, 10), sticky="e"
+        # --- Start Monitoring ---
+        # Process samples come from the shared bus, which samples once per tick
+        # however many process views are open.
+        self.subscription = live_updates.attach(
+            self, metrics_bus.PROCESSES, self._data_ready
         )
 
-    def _fetch_process_data(self) -> List[Dict[str, Any]]:
-        """Retrieves and sorts process data using psutil."""
-        processes = []
-
-        # Initial call to cpu_percent to prime the pump (non-blocking)
-        # This is a good practice to ensure the first results are meaningful deltas.
-        psutil.cpu_percent(interval=None)
-
-        # Iterate over all running processes
-        for proc in psutil.process_iter(["name", "pid", "memory_percent"]):
-            try:
-                proc_info = proc.info
-                # Calculate CPU percent over a small interval (0.0 means non-blocking,
-                # retrieving the delta since the last time it was called.)
-                cpu_percent = proc.cpu_percent(interval=0.0)
-
-                # Filter out processes with very low activity
-                if cpu_percent > 0.0 or proc_info["memory_percent"] > 0.0:
-                    processes.append(
-                        {
-                            "name": proc_info["name"],
-                            "pid": proc_info["pid"],
-                            "cpu": cpu_percent,
-                            "mem": proc_info["memory_percent"],
-                        }
-                    )
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                # Handle transient errors gracefully
-                continue
-
-        # Sort by CPU usage descending and return the top N processes
-        processes.sort(key=lambda x: x["cpu"], reverse=True)
-        return processes[: self.max_processes]
-
-    def _thread_fetch_data(self):
-        """Runs the blocking psutil call in a separate thread."""
-        try:
-            processes = self._fetch_process_data()
-
-            # Once data is ready, schedule the UI update back on the main thread
-            # Use 'after' to safely communicate results back to the main thread
-            self.after(10, lambda: self._data_ready(processes))
-        except Exception as e:
-            print(f"Monitor Thread Error: {e}")
-            self._data_ready([])  # Pass empty list on failure
-
-    def _data_ready(self, processes: List[Dict[str, Any]]):
-        """Called on the main thread when data fetching is complete."""
-        self._update_ui(processes)
-        self.is_fetching = False
-
-    def _update_ui(self, processes: List[Dict[str, Any]]):
-        """Updates or creates UI elements to display the new process data without flicker."""
-
-        num_new_processes = len(processes)
-        num_existing_widgets = len(self.process_widgets)
-
-        # 1. Manage widget rows (Creation or Destruction)
-
-        # A. Destroy excess rows if the number of processes decreased
-        if num_existing_widgets > num_new_processes:
-            for i in range(num_new_processes, num_existing_widgets):
-                for widget in self.process_widgets[i]:
-                    widget.destroy()
-            # Truncate the list of managed widgets
-            self.process_widgets = self.process_widgets[:num_new_processes]
-
-        # B. Create new rows if the number of processes increased
-        for i in range(num_existing_widgets, num_new_processes):
-            row = i + 1
-            # Create a tuple of the 4 labels needed for a process row
-            widgets = (
-                ctk.CTkLabel(self.process_frame, text="", anchor="w"),  # Name
-                ctk.CTkLabel(self.process_frame, text="", anchor="w"),  # PID
-                ctk.CTkLabel(self.process_frame, text="", anchor="e"),  # CPU
-                ctk.CTkLabel(self.process_frame, text="", anchor="e"),  # RAM
-            )
-            # Layout the new widgets
-            widgets[0].grid(row=row, column=0, padx=10, pady=2, sticky="w")
-            widgets[1].grid(row=row, column=1, padx=5, pady=2, sticky="w")
-            widgets[2].grid(row=row, column=2, padx=10, pady=2, sticky="e")
-            widgets[3].grid(row=row, column=3, padx=10, pady=2, sticky="e")
-            self.process_widgets.append(widgets)
-
-        # 2. Update existing and newly created rows
-        default_color = ctk.ThemeManager.theme["CTkLabel"]["text_color"]
-        for i, proc in enumerate(processes):
-            name_label, pid_label, cpu_label, mem_label = self.process_widgets[i]
-
-            # Update the text using .configure() for flicker-free update
-            name_label.configure(text=proc["name"])
-            pid_label.configure(text=str(proc["pid"]))
-            cpu_label.configure(text=f"{proc['cpu']:.1f}%")
-            mem_label.configure(text=f"{proc['mem']:.1f}%")
-
-            # Optional: Highlight high CPU usage
-            if proc["cpu"] > 10.0:
-                cpu_label.configure(text_color="#FF4500")  # OrangeRed
-            elif proc["cpu"] > 5.0:
-                cpu_label.configure(text_color="#FFD700")  # Gold
-            else:
-                cpu_label.configure(text_color=default_color)
-
-    def _schedule_update(self):
-        """Schedules the data fetch to run in a thread and reschedules itself."""
-        # Only start a new fetch thread if the previous one is finished
-        if not self.is_fetching:
-            self.is_fetching = True
-            # Start the thread, set daemon=True so it exits when the main app exits
-            threading.Thread(target=self._thread_fetch_data, daemon=True).start()
-
-        # Reschedule the scheduler itself to maintain the update interval
-        self.after(self.update_interval_ms, self._schedule_update)
+    def _data_ready(self, sample: ProcessSample):
+        """Called on the main thread whenever the bus publishes a process sample."""
+        self.last_sample = sample
+        self.search.update(sample)
+        if self.view_mode != "Processes":
+            self.groups.update(sample)
+        self._invalidate()
+
+    def _view_changed(self, view_mode: str):
+        self.view_mode = view_mode
+        # Apps list the number of processes where the PID would be
+        self.table.set_header(
+            PID_COLUMN, "Procs" if view_mode == "Apps" else COLUMNS[PID_COLUMN][0]
+        )
+        if view_mode != "Processes" and self.last_sample is not None:
+            # The totals were not kept up to date meanwhile: start over
+            self.groups.tick = None
+            self.groups.update(self.last_sample)
+        self._invalidate()
+
+    def _sort_changed(self, sort_by: str):
+        self.sort_by = sort_by
+        # Re-rank the cached sample right away instead of waiting for the next tick
+        self._invalidate()
+
+    def _invalidate(self):
+        self._ranked = None
+        self.table.refresh()
+
+    def _rows(self, first: int, count: int) -> Tuple[List[Dict], int]:
+        """Row source for the table: rows first..first+count of the current view."""
+        if self.last_sample is None:
+            return [], 0
+        needed = first + count
+        ranked = self._ranked
+        if ranked is None or (needed > len(ranked) and len(ranked) < self._total):
+            # Rank a screenful beyond what is needed, so scrolling a little
+            # further only slices the cached ranking
+            self._ranked, self._total = self._rank(needed + count)
+        return self._ranked[first:needed], self._total
+
+    def _rank(self, count: int) -> Tuple[List[Dict], int]:
+        """Returns the first `count` rows of the current view, and the total."""
+        processes = self.last_sample["processes"]
+        matches = self.search.search(self.filter_var.get())
+        if matches is not None:
+            processes = {pid: processes[pid] for pid in matches if pid in processes}
+
+        if self.view_mode == "Apps":
+            names = None
+            if matches is not None:
+                names = {info["name"] for info in processes.values()}
+            rows = [
+                {**app, "pid": app["count"]}
+                for app in self.groups.top_apps(count, self.sort_by, names)
+            ]
+            total = len(self.groups.apps) if names is None else len(names)
+            return rows, total
+        if self.view_mode == "Tree":
+            rows = [
+                {**row, "name": "    " * depth + row["name"]}
+                for depth, row in self.groups.tree_rows(count, self.sort_by, matches)
+            ]
+            total = len(self.groups.nodes) if matches is None else len(processes)
+            return rows, total
+        total = sum(map(is_active, processes.values()))
+        return top_processes(processes, count, self.sort_by), total
+
+    def _row_clicked(self, row: Dict):
+        # App rows don't stand for a single process
+        if self.view_mode == "Apps" or self.last_sample is None:
+            return
+        process = self.last_sample["processes"].get(row["pid"])
+        if process is None:
+            return
+        self.details.grid(
+            row=4, column=0, columnspan=2, padx=20, pady=(0, 10), sticky="nsew"
+        )
+        self.details.show(process)
+
+    def details_closed(self):
+        self.details.grid_remove()
+
+    def _cell_color(self, key: str, row: Dict) -> Optional[str]:
+        # Highlight high CPU usage
+        if key != "cpu":
+            return None
+        if row["cpu"] > 10.0:
+            return "#FF4500"  # OrangeRed
+        if row["cpu"] > 5.0:
+            return "#FFD700"  # Gold
+        return None
@@ -1,7 +1,10 @@
 import customtkinter as ctk
+from job_status import JobStatus
+from log_sink import LogSink
 from .tools_header import ToolsHeader
 from .folders_framer import FoldersFrame
 from logic import utils
+from logic.jobs import CANCELLED
 from platformdirs import user_documents_dir, user_downloads_dir, user_desktop_dir
 from .organize_helper import run_organize
 
@@ -13,7 +16,7 @@ class FileOrganizerFrame(ctk.CTkFrame):
         # Configure the grid layout for the frame
         # Use column 0 for labels/widgets, and configure it to fill the space slightly
         self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure(6, weight=1)  # Row for the Logs textbox should expand
+        self.grid_rowconfigure(7, weight=1)  # Row for the Logs textbox should expand
 
         # --- 1. Title ---
         self.header = ToolsHeader(self, "file.png", "File Organizer")
@@ -45,29 +48,46 @@ class FileOrganizerFrame(ctk.CTkFrame):
             hover_color="darkgreen",
             command=self.on_organize,
         )
-        self.start_button.grid(row=4, column=0, padx=20, pady=(10, 20), sticky="ew")
+        self.start_button.grid(row=4, column=0, padx=20, pady=(10, 10), sticky="ew")
 
-        # --- 5. Logs Section ---
+        # --- 5. Progress and Cancel ---
+        # Files are moved on a worker thread so the window stays responsive
+        self.job_status = JobStatus(self, on_done=self.on_organize_done)
+        self.job_status.grid(row=5, column=0, padx=20, pady=(0, 10), sticky="ew")
+
+        # --- 6. Logs Section ---
         self.logs_label = ctk.CTkLabel(
             self, text="Logs", font=ctk.CTkFont(size=18, weight="bold")
         )
-        self.logs_label.grid(row=5, column=0, padx=20, pady=(10, 5), sticky="w")
+        self.logs_label.grid(row=6, column=0, padx=20, pady=(10, 5), sticky="w")
+        self.save_log_button = ctk.CTkButton(
+            self, text="Save Full Log", width=120, command=self.on_save_log
+        )
+        self.save_log_button.grid(row=6, column=0, padx=20, pady=(10, 5), sticky="e")
 
         # Textbox for Logs
         # The row configured with weight=1 (row 9 in the layout above) is the logs section,
         # so this textbox will expand into the remaining vertical space.
         self.logs_textbox = ctk.CTkTextbox(self, height=100)
-        self.logs_textbox.grid(row=6, column=0, padx=20, pady=(5, 20), sticky="nsew")
+        self.logs_textbox.grid(row=7, column=0, padx=20, pady=(5, 20), sticky="nsew")
+        # Lines are appended in batches, and only the latest are kept on screen
+        self.log = LogSink(self.logs_textbox)
 
     def addLog(self, log):
-        info = self.logs_textbox.get("1.0", "end")
-        info += f"\n{log}"
-        self.logs_textbox.delete("1.0", "end")
-        self.logs_textbox.insert("1.0", info)
-        print(log)
+        self.log.write(log)
+
+    def on_save_log(self):
+        path = utils.save_file_chooser("organizer-log.txt")
+        if path:
+            try:
+                self.log.save(path)
+            except OSError as e:
+                print(f"Error saving log: {e}")
 
     def on_organize(self):
-        self.logs_textbox.delete("1.0", "end")
+        if self.job_status.is_running():
+            return
+        self.log.clear()
 
         folders = [f.lower() for f in self.folders.get_folders()]
         depth = self.depth_var.get()
@@ -81,7 +101,15 @@ class FileOrganizerFrame(ctk.CTkFrame):
             root_dirs.append(user_desktop_dir())
         print("on organize", folders, depth, root_dirs)
 
-        run_organize(root_dirs, depth, lambda x: self.addLog(x))
+        self.start_button.configure(state="disabled")
+        self.job_status.run(
+            lambda job: run_organize(root_dirs, depth, self.addLog, job)
+        )
+
+    def on_organize_done(self, status):
+        self.start_button.configure(state="normal")
+        if status == CANCELLED:
+            self.addLog("Organizing cancelled.")
 
 
 class OrganizerWindow(ctk.CTkToplevel):
@@ -96,6 +124,10 @@ class OrganizerWindow(ctk.CTkToplevel):
         self.frame = FileOrganizerFrame(self)
         self.frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
 
+    def is_busy(self) -> bool:
+        """True while a run is in progress, so the window is not destroyed."""
+        return self.frame.job_status.is_running()
+
 
 # --- Example Usage (Main Application Loop) ---
 if __name__ == "__main__":
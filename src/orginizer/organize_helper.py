@@ -1,12 +1,13 @@
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from logic import config
+from logic.jobs import Job
 import shutil
 import os
 
 
 def extract_files_from_folder(
-    root_folder: str, max_depth: int
+    root_folder: str, max_depth: int, job: Optional[Job] = None
 ) -> Tuple[List[Path], List[Path]]:
 
     root_path = Path(root_folder).resolve()
@@ -18,6 +19,8 @@ def extract_files_from_folder(
 
         for item in current_path.iterdir():
             if item.is_file():
+                if job is not None:
+                    job.step()
                 file_paths.append(item)
             elif item.is_dir():
                 _extract_recursive(item, current_depth + 1)
@@ -38,11 +41,15 @@ def group_files_by_extension(paths: list[str]):
     return path_group
 
 
-def move_grouped_files(base_path: Path, groups: list[tuple[str, str]]):
+def move_grouped_files(
+    base_path: Path, groups: list[tuple[str, str]], job: Optional[Job] = None
+):
     base_path = Path(base_path)
     for file_path_str, group_name in groups:
         try:
             source_path = Path(file_path_str)
+            if job is not None:
+                job.step(source_path.stat().st_size)
             destination_dir = base_path / group_name
             destination_path = destination_dir / source_path.name
             destination_dir.mkdir(parents=True, exist_ok=True)
@@ -91,13 +98,24 @@ def delete_empty_folders(dir_path: str):
     print("--------------------------")
 
 
-def run_organize(root_dirs: list[str], depth: int, logger):
+def run_organize(
+    root_dirs: list[str], depth: int, logger, job: Optional[Job] = None
+):
+    """
+    Moves the files found up to `depth` levels below each of `root_dirs` into
+    one folder per file type. With a `job`, both the scan and the moves count
+    one step per file, and a cancelled job stops between two files.
+    """
     for dir in root_dirs:
         logger(f"Extracting files from: {dir}")
-        paths = extract_files_from_folder(dir, depth - 1)
+        if job is not None:
+            job.begin_phase(f"Scanning {Path(dir).name}")
+        paths = extract_files_from_folder(dir, depth - 1, job)
         grouped_paths = group_files_by_extension(paths)
         logger(f"Found {len(paths)} files:")
-        move_grouped_files(dir, grouped_paths)
+        if job is not None:
+            job.begin_phase(f"Moving files in {Path(dir).name}", len(paths))
+        move_grouped_files(dir, grouped_paths, job)
         delete_empty_folders(dir)
 
     logger(f"Operation complete!")
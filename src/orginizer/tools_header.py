@@ -1,5 +1,5 @@
 import customtkinter as ctk
-from PIL import Image
+from asset_cache import get_image
 
 
 class ToolsHeader(ctk.CTkFrame):
@@ -9,8 +9,7 @@ class ToolsHeader(ctk.CTkFrame):
         self.grid_rowconfigure(0, weight=1)
 
         # image
-        imageData = Image.open(f"assets/{filename}")
-        logo = ctk.CTkImage(dark_image=imageData, light_image=imageData, size=(50, 50))
+        logo = get_image(filename, (50, 50))
         self.logo = ctk.CTkLabel(
             self,
             text="",
@@ -1,16 +1,44 @@
 import customtkinter
-import logic.stats as stats
-import threading
+import tkinter
+import live_updates
+from logic import metrics_bus
+from logic.stats import format_metrics
+
+# Number of 1 s history points drawn in each cell's sparkline
+SPARKLINE_POINTS = 60
+
+
+class Sparkline(tkinter.Canvas):
+    """A tiny line chart that redraws a single canvas item in place."""
+
+    def __init__(self, master, bg, color="#1f6aa5", height=24, max_value=None):
+        super().__init__(master, height=height, bg=bg, highlightthickness=0, bd=0)
+        self.max_value = max_value
+        self._line = self.create_line(0, 0, 0, 0, fill=color, width=2)
+
+    def set_values(self, values):
+        width = self.winfo_width()
+        height = self.winfo_height()
+        if len(values) < 2 or width <= 1:
+            return
+        top = self.max_value or max(max(values), 1.0)
+        step = width / (len(values) - 1)
+        coords = []
+        for i, value in enumerate(values):
+            coords.append(i * step)
+            coords.append(height - 2 - (height - 4) * min(value / top, 1.0))
+        self.coords(self._line, *coords)
+
 
 class SnapshotsCell(customtkinter.CTkFrame):
-    def __init__(self, master, title, value, subValue):
+    def __init__(self, master, title, value, subValue, max_value=None):
         super().__init__(
             master,
             corner_radius=10,
         )
 
         self.grid_columnconfigure(0, weight=1)
-        self.grid_rowconfigure((0, 1, 2), weight=1)
+        self.grid_rowconfigure((0, 1, 2, 3), weight=1)
 
         # title
         self.title = customtkinter.CTkLabel(
@@ -37,10 +65,21 @@ class SnapshotsCell(customtkinter.CTkFrame):
         )
         self.subvalue.grid(row=2, column=0, padx=10, pady=(10, 0), sticky="w")
 
+        # trend
+        self.sparkline = Sparkline(
+            self,
+            bg=self._apply_appearance_mode(self.cget("fg_color")),
+            max_value=max_value,
+        )
+        self.sparkline.grid(row=3, column=0, padx=10, pady=(5, 10), sticky="we")
+
     def update(self, value: str, subvalue: str):
         self.value.configure(text=value)
         self.subvalue.configure(text=subvalue)
 
+    def update_trend(self, values):
+        self.sparkline.set_values(values)
+
 
 class SnapshotsFrame(customtkinter.CTkFrame):
     def __init__(self, master):
@@ -69,46 +108,24 @@ class SnapshotsFrame(customtkinter.CTkFrame):
         self.frame.grid_rowconfigure(0, weight=1)
 
         # cells
-        self.cpuCell = SnapshotsCell(self.frame, "CPU", "22%", "Temp: 45deg")
+        self.cpuCell = SnapshotsCell(
+            self.frame, "CPU", "22%", "Temp: 45deg", max_value=100
+        )
         self.cpuCell.grid(row=0, column=0, padx=5, sticky="news")
 
-        self.ramCell = SnapshotsCell(self.frame, "RAM", "22%", "Used: 7.4GB")
+        self.ramCell = SnapshotsCell(
+            self.frame, "RAM", "22%", "Used: 7.4GB", max_value=100
+        )
         self.ramCell.grid(row=0, column=1, padx=5, sticky="news")
 
-        self.diskCell = SnapshotsCell(self.frame, "Disk", "22%", "Free 300GB")
+        self.diskCell = SnapshotsCell(
+            self.frame, "Disk", "22%", "Free 300GB", max_value=100
+        )
         self.diskCell.grid(row=0, column=2, padx=5, sticky="news")
 
         self.networkCell = SnapshotsCell(self.frame, "Network", "12 Mbps", "Free")
         self.networkCell.grid(row=0, column=3, padx=5, sticky="news")
         
-    def _fetch_stats_in_thread(self, window):
-        def worker():
-            try:
-                data = stats.get_system_metrics()
-            except Exception as e:
-                print(f"Error fetching stats: {e}")
-                data = None
-            if data:
-                window.after(0, lambda: self._update_gui_and_schedule_next(data, window))
-            else:
-                window.after(0, lambda: self._schedule_next_update(window))
-
-        t = threading.Thread(target=worker)
-        t.daemon = True
-        t.start()
-    
-    def _update_gui_and_schedule_next(self, data, window):
-        """Updates the GUI with the fetched data and schedules the next update."""
-        self.updateStats(data) 
-        self._schedule_next_update(window)
-
-    
-    def _schedule_next_update(self, window):
-        """Schedules the next call to fetch stats in a thread."""
-        window.after(1000, lambda: self._fetch_stats_in_thread(window))
-
-
-    
     def updateStats(self, data):
         """Updates the GUI elements using the pre-fetched data."""
         self.cpuCell.update(data.get("cpu_used"), data.get("cpu_temp"))
@@ -117,7 +134,21 @@ class SnapshotsFrame(customtkinter.CTkFrame):
         
         self.networkCell.update(data.get("network_speed"), data.get("Free"))
 
-    
+    def updateTrends(self, history):
+        """Redraws the sparklines from the shared metric history."""
+        self.cpuCell.update_trend(history.recent("cpu_percent", SPARKLINE_POINTS))
+        self.ramCell.update_trend(history.recent("ram_percent", SPARKLINE_POINTS))
+        self.diskCell.update_trend(history.recent("disk_percent", SPARKLINE_POINTS))
+        self.networkCell.update_trend(
+            history.recent("net_recv_rate", SPARKLINE_POINTS)
+        )
+
+    def _on_sample(self, raw):
+        self.updateStats(format_metrics(raw))
+        self.updateTrends(metrics_bus.get_bus().history)
+
     def sheduleUpdates(self, window: customtkinter.CTk):
-        """Starts the periodic, non-blocking stats update process."""
-        self._fetch_stats_in_thread(window)
+        """Attaches this view to the shared metrics bus for live updates."""
+        self.subscription = live_updates.attach(
+            self, metrics_bus.SYSTEM, self._on_sample
+        )
@@ -1,7 +1,7 @@
 import customtkinter as ctk
 from PIL import Image
 from . import stats_helper
-import threading
+from ui_scheduler import get_scheduler
 from orginizer.tools_header import ToolsHeader
 import requests
 from io import BytesIO
@@ -147,7 +147,7 @@ class ForecastFrame(ctk.CTkFrame):
             except Exception as e:
                 print("Get image failed", e)
             cell[2].configure(
-                text=f"{forecast.get("low","--")}\n{forecast.get("high","--")}"
+                text=f"{forecast.get('low', '--')}\n{forecast.get('high', '--')}"
             )
 
     def set_data(self, data):
@@ -191,23 +191,16 @@ class StatsCenterFrame(ctk.CTkFrame):
 
     def get_data(self):
 
-        def threaded_fetch():
-            network, forecasts = stats_helper.get_network_and_forecast()
-            today = forecasts[0]
-            print("got", network, "forecast", forecasts, "todat", today)
+        def update_ui(data):
+            network, forecasts = data
+            self.network_frame.set_data(network)
+            self.weather_frame.set_data(forecasts[0])
+            self.weather_frame.set_forecasts_list(forecasts)
 
-            def update_ui():
-                print("update-ui")
-                self.network_frame.set_data(network)
-                self.weather_frame.set_data(today)
-                self.weather_frame.set_forecasts_list(forecasts)
-                for f in forecasts:
-                    print("ff:  ", f)
-
-            self.after(0, update_ui)
-
-        thread = threading.Thread(target=threaded_fetch, daemon=True)
-        thread.start()
+        # Fetched on the shared worker pool, applied on the Tk main thread
+        get_scheduler().run_in_background(
+            self, stats_helper.get_network_and_forecast, update_ui
+        )
 
 
 class StatsCenterWindow(ctk.CTkToplevel):
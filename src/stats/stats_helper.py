@@ -1,13 +1,17 @@
 import requests
 import socket
+from functools import lru_cache
 from dotenv import load_dotenv
 import os
 import datetime as dt
 
-load_dotenv()
 
-OPENWEATHER_API_KEY = os.getenv("API_KEY")
-print("API_KET", OPENWEATHER_API_KEY)
+@lru_cache(maxsize=None)
+def get_api_key():
+    """The OpenWeather API key, reading .env on the first call, not at import."""
+    load_dotenv()
+    return os.getenv("API_KEY")
+
 
 # --- CONFIGURATION ---
 IP_GEOLOCATION_URL = "http://ip-api.com/json/"
@@ -40,7 +44,7 @@ def fetch_weather_forecast(CITY_NAME: str):
 
     params = {
         "q": CITY_NAME,
-        "appid": OPENWEATHER_API_KEY,
+        "appid": get_api_key(),
         "units": "metric",  # for Celsius
     }
 
@@ -0,0 +1,92 @@
+import os
+import shutil
+import stat
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from cleaner import cleaner_helper, scanner
+
+THREE_DAYS = 3 * 24 * 60 * 60
+
+
+class CrossesBoundaryTest(unittest.TestCase):
+    def test_other_device(self):
+        entry = SimpleNamespace(st_dev=2, st_file_attributes=0)
+        self.assertTrue(scanner.crosses_boundary(entry, 1))
+        self.assertFalse(scanner.crosses_boundary(entry, 2))
+
+    def test_windows_junction(self):
+        # Windows' DirEntry stat reports no st_dev
+        entry = SimpleNamespace(
+            st_dev=0, st_file_attributes=stat.FILE_ATTRIBUTE_REPARSE_POINT
+        )
+        self.assertTrue(scanner.crosses_boundary(entry, 0))
+
+
+class StaleTreeBoundaryTest(unittest.TestCase):
+    """A stale build tree in the temp folder with a mount point inside."""
+
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp)
+        for path in ("build/obj/a.o", "build/mnt/outside.txt", "build/b.log"):
+            self._write(path)
+        old = time.time() - THREE_DAYS
+        for folder, names, files in os.walk(self.temp, topdown=False):
+            for name in names + files:
+                os.utime(os.path.join(folder, name), (old, old))
+        mount = os.stat(os.path.join(self.temp, "build", "mnt"))
+
+        # Stands in for a folder on another device, or a junction
+        def crosses_boundary(entry_stat, root_device):
+            return entry_stat.st_ino == mount.st_ino
+
+        patches = (
+            mock.patch.object(tempfile, "tempdir", self.temp),
+            mock.patch.object(scanner, "crosses_boundary", crosses_boundary),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _write(self, relative: str):
+        path = os.path.join(self.temp, *relative.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as file:
+            file.write("x")
+
+    def _plan(self):
+        options = {cleaner_helper.TEMP_FILES: True}
+        return cleaner_helper.build_clean_plan(options, lambda message: None)
+
+    def test_mount_point_is_not_followed_or_pruned(self):
+        plan = self._plan()
+        planned = {
+            os.path.relpath(candidate["path"], self.temp)
+            for candidate in plan["candidates"][cleaner_helper.TEMP_FILES]
+        }
+        self.assertEqual(
+            planned,
+            {
+                os.path.join("build", "obj"),
+                os.path.join("build", "obj", "a.o"),
+                os.path.join("build", "b.log"),
+            },
+        )
+
+    def test_execute_leaves_the_mount_point_alone(self):
+        plan = self._plan()
+        cleaner_helper.execute_clean_plan(
+            plan, [cleaner_helper.TEMP_FILES], lambda message: None
+        )
+        self.assertTrue(
+            os.path.exists(os.path.join(self.temp, "build", "mnt", "outside.txt"))
+        )
+        self.assertEqual(os.listdir(os.path.join(self.temp, "build")), ["mnt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,33 @@
+import importlib
+import os
+import threading
+from collections import OrderedDict
 import customtkinter
-from PIL import Image
-from orginizer.organize_frame import OrganizerWindow
-from cleaner.cleaner_frame import CleanerWindow
-from monitor.monitor_frame import MonitorWindow
-from stats.stats_frame import StatsCenterWindow
-from vault.vault_frame import VaultWindow
-from about.about_frame import AboutWindow
+from asset_cache import get_image
+
+# Tool attribute -> (module, window class). The modules are only imported when
+# their window is first opened, or by prewarm() once the dashboard is shown.
+TOOL_WINDOWS = {
+    "fileorganizer": ("orginizer.organize_frame", "OrganizerWindow"),
+    "cleaner": ("cleaner.cleaner_frame", "CleanerWindow"),
+    "monitor": ("monitor.monitor_frame", "MonitorWindow"),
+    "stats": ("stats.stats_frame", "StatsCenterWindow"),
+    "vault": ("vault.vault_frame", "VaultWindow"),
+    "about": ("about.about_frame", "AboutWindow"),
+}
+
+# Set TOOLKIT_PREWARM=0 to import the tools only when they are opened
+PREWARM_ENV = "TOOLKIT_PREWARM"
+
+# Closed tool windows are hidden and reused. The least recently closed ones
+# past this count, and any left closed for HIDDEN_TIMEOUT_MS, are destroyed.
+MAX_HIDDEN_WINDOWS = 3
+HIDDEN_TIMEOUT_MS = 10 * 60 * 1000
+
+
+def load_window_class(tool: str):
+    module_name, class_name = TOOL_WINDOWS[tool]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class ToolsCell(customtkinter.CTkFrame):
@@ -19,10 +41,7 @@ class ToolsCell(customtkinter.CTkFrame):
         self.grid_rowconfigure((0, 1, 2), weight=1)
 
         # image
-        imageData = Image.open(f"assets/{filename}")
-        logo = customtkinter.CTkImage(
-            dark_image=imageData, light_image=imageData, size=(50, 50)
-        )
+        logo = get_image(filename, (50, 50))
         self.logo = customtkinter.CTkLabel(
             self,
             text="",
@@ -149,39 +168,84 @@ class ToolsFrame(customtkinter.CTkFrame):
         self.stats = None
         self.vault = None
         self.about = None
+        # Hidden tool -> id of the after() that destroys it, oldest first
+        self.hidden = OrderedDict()
+
+    def open_tool(self, tool: str):
+        window = getattr(self, tool)
+        if window is None or not window.winfo_exists():
+            if tool in self.hidden:
+                self.window.after_cancel(self.hidden.pop(tool))
+            window = load_window_class(tool)(self.window)
+            window.protocol("WM_DELETE_WINDOW", lambda: self.close_tool(tool))
+            setattr(self, tool, window)
+            return
+        if tool in self.hidden:
+            # Shown again as it was left, without rebuilding or refetching
+            self.window.after_cancel(self.hidden.pop(tool))
+            window.deiconify()
+            window.lift()
+        window.focus()
+
+    def close_tool(self, tool: str):
+        """Hides a tool window so that opening it again is instant."""
+        getattr(self, tool).withdraw()
+        self.hidden[tool] = self.window.after(
+            HIDDEN_TIMEOUT_MS, lambda: self.release_tool(tool)
+        )
+        for hidden_tool in list(self.hidden):
+            if len(self.hidden) <= MAX_HIDDEN_WINDOWS:
+                break
+            self.release_tool(hidden_tool)
+
+    def release_tool(self, tool: str) -> bool:
+        """Destroys a hidden tool window, unless it is busy (e.g. cleaning)."""
+        self.window.after_cancel(self.hidden.pop(tool))
+        window = getattr(self, tool)
+        is_busy = getattr(window, "is_busy", None)
+        if is_busy is not None and is_busy():
+            # Try again later; it still counts as hidden
+            self.hidden[tool] = self.window.after(
+                HIDDEN_TIMEOUT_MS, lambda: self.release_tool(tool)
+            )
+            return False
+        window.destroy()
+        setattr(self, tool, None)
+        return True
 
     def open_fileorganizer(self, ev):
-        if self.fileorganizer is None or not self.fileorganizer.winfo_exists():
-            self.fileorganizer = OrganizerWindow(self.window)
-        else:
-            self.fileorganizer.focus()
+        self.open_tool("fileorganizer")
 
     def open_cleaner(self, ev):
-        if self.cleaner is None or not self.cleaner.winfo_exists():
-            self.cleaner = CleanerWindow(self.window)
-        else:
-            self.cleaner.focus()
+        self.open_tool("cleaner")
 
     def open_monitor(self, ev):
-        if self.monitor is None or not self.monitor.winfo_exists():
-            self.monitor = MonitorWindow(self.window)
-        else:
-            self.monitor.focus()
+        self.open_tool("monitor")
 
     def open_stats(self, ev):
-        if self.stats is None or not self.stats.winfo_exists():
-            self.stats = StatsCenterWindow(self.window)
-        else:
-            self.stats.focus()
+        self.open_tool("stats")
 
     def open_vault(self, ev):
-        if self.vault is None or not self.vault.winfo_exists():
-            self.vault = VaultWindow(self.window)
-        else:
-            self.vault.focus()
+        self.open_tool("vault")
 
     def open_about(self, ev):
-        if self.about is None or not self.about.winfo_exists():
-            self.about = AboutWindow(self.window)
-        else:
-            self.about.focus()
+        self.open_tool("about")
+
+    def prewarm(self):
+        """
+        Imports the tool modules on a background thread, so the first click
+        on a cell does not wait for them. Importing creates no widgets and
+        must not touch Tk: the theme is only set in main.py, on the main
+        thread.
+        """
+        if os.environ.get(PREWARM_ENV) == "0":
+            return
+        threading.Thread(target=self._prewarm, name="Prewarm", daemon=True).start()
+
+    def _prewarm(self):
+        for module_name, _ in TOOL_WINDOWS.values():
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                # Opening the tool reports the error again
+                print(f"Error preloading {module_name}: {e}")
@@ -0,0 +1,125 @@
+import itertools
+import threading
+import tkinter
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from logic.workers import LOW, NORMAL, get_pool
+
+# (priority, order, widget, callback, live)
+Entry = Tuple[int, int, tkinter.Misc, Callable[[], None], bool]
+
+
+def _is_hidden(widget: tkinter.Misc) -> bool:
+    return widget.winfo_toplevel().state() in ("withdrawn", "iconic")
+
+
+class UiScheduler:
+    """
+    Runs UI updates posted from any thread on the Tk main thread.
+
+    Everything posted before Tk is next idle is applied in one idle callback,
+    most urgent priority first. Posts with the same `key` replace each other,
+    so a view that gets several samples in one tick redraws once. Updates for
+    destroyed widgets are dropped, and so are `live` ones for widgets in a
+    withdrawn or minimized window: the metrics bus hands those the latest
+    sample once they are shown again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, Entry] = {}
+        self._order = itertools.count()
+        self._root: Optional[tkinter.Misc] = None
+        self._scheduled = False
+
+    def post(
+        self,
+        widget: tkinter.Misc,
+        callback: Callable[[], None],
+        priority: int = NORMAL,
+        key: Optional[Hashable] = None,
+        live: bool = False,
+    ) -> bool:
+        """
+        Queues `callback()` for the next idle moment.
+
+        Returns False if the widget (or the interpreter) is already gone.
+        """
+        order = next(self._order)
+        entry_key = key if key is not None else order
+        with self._lock:
+            self._pending[entry_key] = (
+                priority,
+                order,
+                widget,
+                callback,
+                live,
+            )
+            if self._scheduled:
+                return True
+            self._scheduled = True
+        try:
+            if self._root is None:
+                # The root window outlives every view, so the idle callback
+                # is never lost with the widget that asked for it
+                self._root = widget.nametowidget(".")
+            self._root.after_idle(self._flush)
+        except (RuntimeError, tkinter.TclError):
+            with self._lock:
+                # Only this post failed; updates other widgets queued stay
+                # pending until the next successful post arms the flush
+                entry = self._pending.get(entry_key)
+                if entry is not None and entry[1] == order:
+                    del self._pending[entry_key]
+                self._scheduled = False
+            return False
+        return True
+
+    def run_in_background(
+        self,
+        widget: tkinter.Misc,
+        work: Callable[[], Any],
+        on_done: Callable[[Any], None],
+        priority: int = LOW,
+    ):
+        """
+        Runs `work()` on the shared worker pool, then `on_done(result)` on the
+        Tk main thread if `widget` still exists. Errors are printed.
+        """
+
+        def finished(future):
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Error in background work: {e}")
+                return
+            self.post(widget, lambda: on_done(result), priority)
+
+        get_pool().submit(work, priority=priority).add_done_callback(finished)
+
+    def _flush(self):
+        with self._lock:
+            entries = sorted(self._pending.values(), key=lambda e: e[:2])
+            self._pending.clear()
+            self._scheduled = False
+
+        for _, _, widget, callback, live in entries:
+            try:
+                if not widget.winfo_exists() or (live and _is_hidden(widget)):
+                    continue
+                callback()
+            except Exception as e:
+                print(f"Error in UI update: {e}")
+
+
+_default_scheduler: Optional[UiScheduler] = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> UiScheduler:
+    """Returns the application-wide UI scheduler."""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = UiScheduler()
+        return _default_scheduler
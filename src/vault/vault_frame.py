@@ -1,26 +1,29 @@
 import customtkinter as ctk
-from PIL import Image
-import os
+from asset_cache import get_image
 from logic import utils
 from orginizer.tools_header import ToolsHeader
 from .vault_helper import VaultHelper
 from logic.view_file_helper import open_file_with_default_viewer
 
 ICON_SIZE = (20, 20)
-get_img = lambda x: ctk.CTkImage(Image.open(os.path.join("assets", x)), size=ICON_SIZE)
-icon_map = {
-    "photo": get_img("photo_icon.png"),
-    "video": get_img("video_icon.png"),
-    "document": get_img("documents_icon.png"),
-    "audio": get_img("audio_icon.png"),
-    "help": get_img("help_icon.png"),
-    "add": get_img("add_icon.png"),
-    "file": get_img("file_icon.png"),
-    "delete": get_img("delete_icon.png"),
-    "restore": get_img("restore_icon.png"),
+icon_files = {
+    "photo": "photo_icon.png",
+    "video": "video_icon.png",
+    "document": "documents_icon.png",
+    "audio": "audio_icon.png",
+    "help": "help_icon.png",
+    "add": "add_icon.png",
+    "file": "file_icon.png",
+    "delete": "delete_icon.png",
+    "restore": "restore_icon.png",
 }
 
 
+def get_icon(kind: str) -> ctk.CTkImage:
+    """The icon for `kind`, decoded on first use; unknown kinds get "file"."""
+    return get_image(icon_files.get(kind, icon_files["file"]), ICON_SIZE)
+
+
 class VaultFrame(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs, fg_color="transparent")
@@ -48,7 +51,7 @@ class VaultFrame(ctk.CTkFrame):
         self.add_button = ctk.CTkButton(
             self.button_frame,
             text=" Add File",
-            image=icon_map["add"],
+            image=get_icon("add"),
             compound="left",
             command=self.add_file_command,
         )
@@ -57,7 +60,7 @@ class VaultFrame(ctk.CTkFrame):
         self.help_button = ctk.CTkButton(
             self.button_frame,
             text=" Delete All",
-            image=icon_map["delete"],
+            image=get_icon("delete"),
             compound="left",
             command=self.delete_all,
             fg_color=(
@@ -109,7 +112,7 @@ class VaultFrame(ctk.CTkFrame):
             frame.grid_columnconfigure(0, weight=1)
             frame.grid(row=i, column=0, sticky="ew")
 
-            file_icon = icon_map.get(file["type"], icon_map["file"])
+            file_icon = get_icon(file["type"])
 
             # The file label contains the icon and the file name
             file_label = ctk.CTkLabel(
@@ -139,7 +142,7 @@ class VaultFrame(ctk.CTkFrame):
             delete_but = ctk.CTkButton(
                 frame,
                 text="",
-                image=icon_map["delete"],
+                image=get_icon("delete"),
                 width=50,
                 fg_color="transparent",
             )
@@ -150,7 +153,7 @@ class VaultFrame(ctk.CTkFrame):
             restore_but = ctk.CTkButton(
                 frame,
                 text="",
-                image=icon_map["restore"],
+                image=get_icon("restore"),
                 width=50,
                 fg_color="transparent",
             )